@@ -0,0 +1,50 @@
+"""
+Benchmark: búsqueda en grilla en paralelo (SlideProject.grid_search)
+
+Mide el tiempo de la búsqueda en grilla del proyecto de ejemplo con 1, 2,
+..., N procesos y la aceleración respecto de un proceso. Todas las
+ejecuciones deben encontrar el mismo mínimo global.
+
+Uso:
+    python benchmarks/bench_grid_search.py [max_workers] [nx] [ny] [radius_increments]
+"""
+from slidepyv6 import SlideProject
+from pathlib import Path
+import os
+import sys
+import time
+
+EXAMPLE = Path(__file__).resolve().parent.parent / "examples" / "example_project.slim"
+
+
+if __name__ == "__main__":
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else (os.cpu_count() or 1)
+    nx = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    ny = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+    radius_increments = int(sys.argv[4]) if len(sys.argv) > 4 else 20
+
+    project = SlideProject(str(EXAMPLE))
+    print("-" * 78)
+    print(f"Grilla de {nx} x {ny} centros, {radius_increments} radios por centro "
+          f"({os.cpu_count()} núcleos disponibles)")
+    print("-" * 78)
+    print(f'{"Procesos":>10}{"Superficies":>15}{"Tiempo (s)":>15}{"Sup./s":>15}{"Acel.":>10}{"FS mín.":>12}')
+
+    reference = None
+    baseline = None
+    for workers in range(1, max_workers + 1):
+        start = time.perf_counter()
+        results = project.grid_search(grid=(nx, ny), radius_increments=radius_increments, workers=workers)
+        elapsed = time.perf_counter() - start
+
+        fs_min = min(minimum.surface.fs for minimum in results.global_minimums)
+        if reference is None:
+            reference, baseline = fs_min, elapsed
+        assert fs_min == reference, "El mínimo global cambia con el número de procesos"
+        assert all(field.shape == (ny, nx) for field in results.fs_fields().values()), \
+            "El campo de FS no tiene la forma de la grilla de centros"
+
+        count = len(results.surface_table)
+        print(f'{workers:>10}{count:>15}{elapsed:>15.2f}{count / elapsed:>15.0f}'
+              f'{baseline / elapsed:>9.2f}x{fs_min:>12.5f}')
+    print("-" * 78)
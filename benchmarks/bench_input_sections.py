@@ -0,0 +1,85 @@
+"""
+Benchmark: separación de secciones del archivo .sli
+
+Compara la búsqueda anterior (un re.search por sección sobre todo el
+archivo) con el escaneo de una sola pasada de InputParser.split_sections,
+sobre un .sli generado a partir del proyecto de ejemplo con 100k vértices.
+
+Uso:
+    python benchmarks/bench_input_sections.py [num_vertices]
+"""
+from slidepyv6.io.parsers.input_parser import InputParser
+from pathlib import Path
+import re
+import sys
+import time
+import zipfile
+
+EXAMPLE = Path(__file__).resolve().parent.parent / "examples" / "example_project.slim"
+
+
+def legacy_split_sections(content: str) -> dict[str, str]:
+    """Búsqueda anterior: un regex por sección sobre todo el contenido"""
+    extracted_data = {}
+    for section in InputParser.SECTIONS:
+        pattern = rf"^{section}\b:(.*?)(?=\n\w|\Z)"
+        match = re.search(pattern, content, re.DOTALL | re.MULTILINE)
+        if match:
+            extracted_data[section] = match.group(1).strip()
+    return extracted_data
+
+
+def generate_sli(num_vertices: int) -> str:
+    """Genera un .sli con una malla de num_vertices vértices y sus celdas triangulares"""
+    with zipfile.ZipFile(EXAMPLE) as zip_ref:
+        content = zip_ref.read("example_project.sli").decode("utf-8", errors="ignore")
+    content = content.replace("\r\n", "\n")
+
+    # malla regular de nx columnas (los 11 vértices originales se conservan)
+    nx = 200
+    vertices = content.split("vertices:\n", 1)[1].split("\n\n", 1)[0].splitlines()
+    for i in range(len(vertices), num_vertices):
+        vertices.append(f"  {i + 1} x: {30 + (i % nx) * 0.1:.4f}  y: {-(i // nx) * 0.1:.4f}")
+
+    cells = content.split("cells:\n", 1)[1].split("\n\n", 1)[0].splitlines()
+    first = 12
+    for i in range(first, num_vertices - nx):
+        if (i - first) % nx == nx - 1:
+            continue
+        cells.append(f"  {len(cells) + 1}  vertices: [{i},{i + 1},{i + nx}] material: soil2")
+
+    content = re.sub(r"(?ms)^vertices:\n.*?\n\n", "vertices:\n" + "\n".join(vertices) + "\n\n", content, count=1)
+    content = re.sub(r"(?ms)^cells:\n.*?\n\n", "cells:\n" + "\n".join(cells) + "\n\n", content, count=1)
+    return content
+
+
+def timeit(func, content: str, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(content)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    num_vertices = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    content = generate_sli(num_vertices)
+
+    legacy = legacy_split_sections(content)
+    scanned = InputParser.split_sections(content)
+    assert all(legacy[name] == scanned[name] for name in legacy), "Las secciones no coinciden"
+
+    t_legacy = timeit(legacy_split_sections, content)
+    t_scan = timeit(InputParser.split_sections, content)
+    t_slices = timeit(lambda c: [spans[n] for spans in [InputParser.split_sections(c)] for n in InputParser.SECTIONS], content)
+
+    print("-" * 70)
+    print(f"Archivo .sli generado: {num_vertices} vértices, {len(content) / 1e6:.1f} MB")
+    print("-" * 70)
+    print(f'{"Método":<45}{"Tiempo (ms)":>15}')
+    print(f'{"re.search por sección (anterior)":<45}{t_legacy * 1e3:>15.2f}')
+    print(f'{"escaneo de una pasada (posiciones)":<45}{t_scan * 1e3:>15.2f}')
+    print(f'{"escaneo + recorte de las 12 secciones":<45}{t_slices * 1e3:>15.2f}')
+    print(f'{"Aceleración":<45}{t_legacy / t_slices:>14.1f}x')
+    print("-" * 70)
@@ -0,0 +1,92 @@
+"""
+Benchmark: material en un punto (ProjectGeometry.material_at)
+
+Compara el recorrido lineal de las celdas con una prueba punto en polígono
+por celda (fuerza bruta) con el índice espacial CellGrid, sobre mallas
+triangulares regulares de distintos tamaños.
+
+Uso:
+    python benchmarks/bench_material_at.py [num_points]
+"""
+from slidepyv6.models.geometries import GeometryArrays, ProjectGeometry
+from slidepyv6.analysis.spatial import CellGrid
+import numpy as np
+import sys
+import time
+
+
+def generate_mesh(nx: int, ny: int) -> ProjectGeometry:
+    """Malla de nx * ny rectángulos divididos en dos triángulos, con dos materiales por capas"""
+    xs, ys = np.meshgrid(np.linspace(0, 100, nx + 1), np.linspace(0, 50, ny + 1))
+    vertices = np.column_stack([xs.ravel(), ys.ravel()])
+
+    i, j = np.meshgrid(np.arange(nx), np.arange(ny))
+    v0 = (j * (nx + 1) + i).ravel()
+    v1, v2, v3 = v0 + 1, v0 + nx + 2, v0 + nx + 1
+    triangles = np.concatenate([np.column_stack([v0, v1, v2]), np.column_stack([v0, v2, v3])])
+    num_cells = len(triangles)
+
+    centroid_y = vertices[triangles, 1].mean(axis=1)
+    arrays = GeometryArrays(
+        vertex_ids=np.arange(1, len(vertices) + 1),
+        vertices=vertices,
+        cell_ids=np.arange(1, num_cells + 1),
+        cell_offsets=np.arange(0, 3 * num_cells + 1, 3),
+        cell_vertices=triangles.ravel(),
+        cell_material=(centroid_y < 20).astype(np.int32),
+        materials=['soil1', 'soil2']
+    )
+    return ProjectGeometry(arrays=arrays, supports=[], limits=None)
+
+
+def brute_force(geometry: ProjectGeometry, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    """Recorre todas las celdas probando todos los puntos contra cada una"""
+    arrays = geometry.arrays
+    result = np.full(len(xs), -1, dtype=np.int64)
+    for cell in range(arrays.num_cells):
+        polygon = arrays.cell_coords(cell)
+        inside = np.zeros(len(xs), dtype=bool)
+        for (xi, yi), (xj, yj) in zip(polygon, np.roll(polygon, -1, axis=0)):
+            with np.errstate(divide='ignore', invalid='ignore'):
+                inside ^= ((yi > ys) != (yj > ys)) & (xs < (xj - xi) * (ys - yi) / (yj - yi) + xi)
+        result[inside] = cell
+    return result
+
+
+if __name__ == "__main__":
+    num_points = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = np.random.default_rng(0)
+    xs = rng.uniform(-5, 105, num_points)
+    ys = rng.uniform(-5, 55, num_points)
+
+    print("-" * 78)
+    print(f"Consulta de {num_points} puntos")
+    print("-" * 78)
+    print(f'{"Celdas":>10}{"Construcción (ms)":>20}{"Índice (ms)":>15}{"Fuerza bruta (ms)":>20}{"Acel.":>10}')
+
+    for nx, ny in [(20, 25), (100, 50), (250, 200)]:
+        geometry = generate_mesh(nx, ny)
+        arrays = geometry.arrays
+
+        start = time.perf_counter()
+        index = CellGrid(arrays.vertices, arrays.cell_offsets, arrays.cell_vertices)
+        t_build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        cells = index.locate(xs, ys)
+        t_index = time.perf_counter() - start
+
+        # la fuerza bruta se mide sobre una muestra y se escala al total
+        sample = min(num_points, 20_000)
+        start = time.perf_counter()
+        expected = brute_force(geometry, xs[:sample], ys[:sample])
+        t_brute = (time.perf_counter() - start) * num_points / sample
+
+        # los puntos sobre aristas compartidas pueden asignarse a cualquiera de las dos celdas
+        same = np.mean(arrays.cell_material[cells[:sample]] * (cells[:sample] >= 0)
+                       == arrays.cell_material[expected] * (expected >= 0))
+        assert same > 0.999, "El índice no coincide con la fuerza bruta"
+
+        print(f'{arrays.num_cells:>10}{t_build * 1e3:>20.1f}{t_index * 1e3:>15.1f}'
+              f'{t_brute * 1e3:>20.1f}{t_brute / t_index:>9.0f}x')
+    print("-" * 78)
@@ -0,0 +1,24 @@
+from slidepyv6 import SlideProject
+from slidepyv6.models.properties import MohrCoulombParams
+
+# Create a new project
+project = SlideProject("example_project.slim")
+
+
+# FS recalculado con las rebanadas de cada mínimo global
+print("-" * 60)
+print(f'{"Método":<25}{"FS Slide":>15}{"FS calculado":>20}')
+print("-" * 60)
+factors = project.evaluate_safety_factors()
+for minimum in project.results.global_minimums:
+    method = minimum.surface.method
+    if method in factors:
+        print(f'{method:<25}{minimum.surface.fs:>15.5f}{float(factors[method].fs):>20.5f}')
+
+
+# FS con la cohesión del material 1 aumentada
+print("-" * 60)
+print(f'{"→ Cohesión de soil1 = 8"}')
+factors = project.evaluate_safety_factors(strength={"soil1": MohrCoulombParams(cohesion=8.0, friction_angle=25.0)})
+for method, result in factors.items():
+    print(f'method: {method}, fs: {float(result.fs):.5f}')
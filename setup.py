@@ -12,7 +12,9 @@ setup(
     url="https://github.com/edwinar13/SlidePyV6-Library", 
     include_package_data=True,
     package_dir={'slidepyv6': 'slidepyv6'},
-    install_requires=[],
+    install_requires=[
+        'numpy',
+    ],
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
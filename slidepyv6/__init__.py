@@ -1,3 +1,4 @@
 from .core import SlideProject
+from .batch import load_many, BatchResult, BatchSummary
 from .models.metadata import ProjectMetadata
 from .models.properties import ProjectProperties, PropertyMaterial, PropertySupport, MohrCoulombParams, UndrainedParams, NoStrengthParams, InfiniteStrengthParams, HoekBrownParams, GeneralHoekBrownParams, EndAnchoredParams,  GeoTextileParams, GroutedTiebackParams, GroutedTiebackFrictionParams, MicroPileParams, SoilNailParams
\ No newline at end of file
@@ -0,0 +1,14 @@
+#  imports
+from .spatial import CellGrid
+from .intersections import CircleIntersections, intersect_circles
+from .topology import MeshTopology, TopologyReport
+from .limit_equilibrium import (
+    LimitEquilibriumSlices, SafetyFactors, bishop_simplified, critical_seismic_coefficient, janbu_simplified,
+    safety_factor
+)
+from .slicing import CircleSlices, slice_circles, weight_fractions
+from .grid_search import center_grid, circle_radii, grid_search
+from .sensitivity import StrengthSensitivity, hoek_brown_equivalent, strength_sensitivity
+from .probabilistic import Distribution, MonteCarloStatistics, ProbabilisticSurface, monte_carlo
+from .back_analysis import BackAnalysis, back_analysis
+from .fs_field import FSField, fs_field
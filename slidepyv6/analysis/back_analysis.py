@@ -0,0 +1,126 @@
+from ..models.properties import MohrCoulombParams, PropertyMaterial
+from ..utils.exceptions import SlideError
+from .limit_equilibrium import _TERMS, METHODS, LimitEquilibriumSlices, _m_alpha
+from dataclasses import dataclass, replace
+import numpy as np
+
+# Campos de LimitEquilibriumSlices por rebanada y por superficie (se agrega el eje de los ángulos)
+_PER_SLICE = ('width', 'alpha', 'weight', 'pore_pressure', 'arm', 'load', 'horizontal', 'seismic_arm')
+_PER_SURFACE = ('radius', 'load_moment', 'passive_moment', 'passive_force', 'seismic', 'seismicv')
+
+
+@dataclass(eq=False)
+class BackAnalysis:
+    """
+    Clase BackAnalysis con la curva c–φ de un material que lleva el FS a 1 en
+    una o varias superficies.
+    Atributos:
+    ----------
+        material_id (str): Id del material analizado.
+        method (str): Método de equilibrio límite.
+        friction_angle (np.ndarray): Ángulos de fricción de la curva (grados), (k,).
+        cohesion (np.ndarray): Cohesión con la que FS = 1 para cada ángulo,
+            (..., k) con la forma del lote de superficies. Es negativa si la
+            superficie tiene FS > 1 sin cohesión y NaN si algún mα es nulo o
+            negativo con FS = 1 o si la base no pasa por el material.
+    """
+    material_id: str
+    method: str
+    friction_angle: np.ndarray
+    cohesion: np.ndarray
+
+    @property
+    def admissible(self) -> np.ndarray:
+        """True para los pares (c, φ) con cohesión no negativa"""
+        return self.cohesion >= 0.0
+
+    def friction_angle_at_zero_cohesion(self) -> np.ndarray:
+        """
+        Ángulo de fricción con el que FS = 1 sin cohesión, interpolado en la
+        curva (NaN si la curva no cruza c = 0)
+        """
+        cohesion = np.atleast_2d(self.cohesion).reshape(-1, len(self.friction_angle))
+        angle = np.full(len(cohesion), np.nan)
+        for i, curve in enumerate(cohesion):
+            # la cohesión decrece con φ: primer cambio de signo
+            cross = np.flatnonzero((curve[:-1] >= 0.0) & (curve[1:] < 0.0))
+            if len(cross):
+                k = cross[0]
+                angle[i] = np.interp(0.0, curve[k:k + 2][::-1], self.friction_angle[k:k + 2][::-1])
+        return angle.reshape(np.shape(self.cohesion)[:-1])
+
+
+def back_analysis(
+        slices: LimitEquilibriumSlices,
+        base_material: np.ndarray,
+        materials: list[PropertyMaterial],
+        material_id: str,
+        friction_angles,
+        method: str = 'bishop simplified'
+        ) -> BackAnalysis:
+    """
+    Retroanálisis: cohesión de un material de Mohr-Coulomb que lleva el FS a
+    1 para cada ángulo de fricción, en todas las superficies del lote a la vez.
+
+    Con FS = 1 y φ dado los mα quedan fijos y el término resistente es lineal
+    en la cohesión del material, por lo que cada punto de la curva se obtiene
+    sin iterar a partir de los términos con c = 0 y c = 1. Los demás
+    materiales conservan la resistencia de slices.
+
+    Args:
+        slices: Datos de las rebanadas, (..., n)
+        base_material: Número del material de la base de cada rebanada (1 =
+            primer material de materials), (..., n)
+        materials: Materiales del proyecto (ProjectProperties.materials)
+        material_id: Id del material a retroanalizar
+        friction_angles: Ángulos de fricción de la curva (grados)
+        method: Método de equilibrio límite (METHODS)
+
+    Devuelve:
+        BackAnalysis: Curva c–φ de cada superficie
+    """
+    terms = _TERMS.get(method.strip().lower())
+    if terms is None:
+        raise SlideError(f"Método no soportado: {method} (disponibles: {', '.join(METHODS)})")
+    number = {material.id: i + 1 for i, material in enumerate(materials)}
+    if material_id not in number:
+        raise SlideError(f"Material no encontrado: {material_id}")
+    if not isinstance(materials[number[material_id] - 1].material_params, MohrCoulombParams):
+        raise SlideError(f"El material {material_id} no es de Mohr-Coulomb")
+    angles = np.atleast_1d(np.asarray(friction_angles, dtype=np.float64))
+
+    # lote (..., k, n): una copia de cada superficie por ángulo
+    mask = (np.asarray(base_material).astype(np.int64) == number[material_id])[..., None, :]
+    shape = slices.shape + (len(angles), np.shape(slices.weight)[-1])
+
+    def expand(value, fill):
+        return np.where(mask, fill, np.broadcast_to(np.asarray(value)[..., None, :], shape))
+
+    def per_slice(value):
+        return np.asarray(value)[..., None, :]
+
+    def per_surface(value):
+        return np.asarray(value)[..., None]
+
+    batch = replace(
+        slices,
+        **{name: per_slice(getattr(slices, name)) for name in _PER_SLICE},
+        **{name: per_surface(getattr(slices, name)) for name in _PER_SURFACE},
+        tan_phi=expand(slices.tan_phi, np.tan(np.radians(angles))[:, None])
+    )
+    unit = np.ones(shape[:-1])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # f(c) = resistente - motor es lineal en c
+        resisting, driving = terms(replace(batch, cohesion=expand(slices.cohesion, 0.0)))
+        f0 = resisting(unit) - driving
+        resisting, driving = terms(replace(batch, cohesion=expand(slices.cohesion, 1.0)))
+        f1 = resisting(unit) - driving
+        cohesion = -f0 / (f1 - f0)
+        m_alpha = _m_alpha(batch, unit)
+    bad = np.any((m_alpha <= 0.0) & (batch.width > 0.0), axis=-1) | ~(f1 - f0 > 0.0)
+    return BackAnalysis(
+        material_id=material_id,
+        method=method,
+        friction_angle=angles,
+        cohesion=np.where(bad, np.nan, cohesion)
+    )
@@ -0,0 +1,233 @@
+from ..models.results import CenterGrid, Surface, SurfaceTable
+from ..utils.exceptions import SlideError
+from dataclasses import dataclass
+import numpy as np
+
+# Bordes que cruza la curva de nivel en cada caso de marching squares
+# (0 = abajo, 1 = derecha, 2 = arriba, 3 = izquierda); los casos 5 y 10
+# (puntos de silla) se resuelven con el promedio de la celda
+_SEGMENTS = {
+    1: ((3, 0),), 2: ((0, 1),), 3: ((3, 1),), 4: ((1, 2),),
+    6: ((0, 2),), 7: ((3, 2),), 8: ((2, 3),), 9: ((2, 0),),
+    11: ((2, 1),), 12: ((1, 3),), 13: ((1, 0),), 14: ((0, 3),),
+}
+_SADDLES = {
+    # (promedio < nivel, promedio >= nivel)
+    5: (((3, 0), (1, 2)), ((3, 2), (1, 0))),
+    10: (((0, 1), (2, 3)), ((0, 3), (2, 1))),
+}
+
+
+@dataclass(eq=False)
+class FSField:
+    """
+    Clase FSField con el FS mínimo de cada centro de una grilla de centros
+    de falla, para un método.
+    Atributos:
+    ----------
+        method (str): Nombre del método.
+        x (np.ndarray): Coordenadas x de las columnas de la grilla, (nx,).
+        y (np.ndarray): Coordenadas y de las filas de la grilla, (ny,).
+        fs (np.ndarray): FS mínimo de cada centro (NaN sin superficies válidas), (ny, nx).
+        radius (np.ndarray): Radio de la superficie de FS mínimo, (ny, nx).
+        row (np.ndarray): Fila de esa superficie en la tabla (-1 sin superficie), (ny, nx).
+        table (SurfaceTable): Tabla de superficies de origen.
+    """
+    method: str
+    x: np.ndarray
+    y: np.ndarray
+    fs: np.ndarray
+    radius: np.ndarray
+    row: np.ndarray
+    table: SurfaceTable
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.fs.shape
+
+    def local_minimum_mask(self, include_edges: bool = True) -> np.ndarray:
+        """
+        Centros cuyo FS no supera el de ninguno de sus 8 vecinos (los centros
+        sin FS cuentan como infinito)
+
+        Args:
+            include_edges: Si es False se descartan los centros del borde de
+                la grilla (un mínimo en el borde suele indicar que la grilla
+                debe ampliarse)
+        """
+        values = np.where(np.isnan(self.fs), np.inf, self.fs)
+        padded = np.pad(values, 1, constant_values=np.inf)
+        ny, nx = values.shape
+        mask = np.isfinite(values)
+        for dy in (-1, 0, 1):
+            for dx in (-1, 0, 1):
+                if dy or dx:
+                    mask &= values <= padded[1 + dy:1 + dy + ny, 1 + dx:1 + dx + nx]
+        if not include_edges:
+            mask[[0, -1], :] = False
+            mask[:, [0, -1]] = False
+        return mask
+
+    def local_minima(self, include_edges: bool = True) -> list[Surface]:
+        """
+        Superficies de los mínimos locales del campo, de menor a mayor FS
+        (cada una es la de FS mínimo de su centro)
+
+        Args:
+            include_edges: Si es False se descartan los centros del borde de la grilla
+        """
+        iy, ix = np.nonzero(self.local_minimum_mask(include_edges))
+        order = np.argsort(self.fs[iy, ix], kind='stable')
+        return [self.table.surface(row, self.method) for row in self.row[iy[order], ix[order]].tolist()]
+
+    def contours(self, level: float) -> list[np.ndarray]:
+        """
+        Curvas de nivel FS = level sobre la grilla de centros (marching
+        squares con interpolación lineal en los bordes de cada celda; las
+        celdas con algún centro sin FS se omiten)
+
+        Args:
+            level: Valor de FS
+
+        Devuelve:
+            list[np.ndarray]: Polilíneas (k, 2) con las coordenadas x, y de
+                cada curva (cerradas si el primer y el último punto coinciden)
+        """
+        fs = self.fs
+        ny, nx = fs.shape
+        if ny < 2 or nx < 2:
+            return []
+
+        # punto de corte en cada borde de la grilla (NaN si no se cruza)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            th = (level - fs[:, :-1]) / (fs[:, 1:] - fs[:, :-1])
+            tv = (level - fs[:-1, :]) / (fs[1:, :] - fs[:-1, :])
+        xs_h = self.x[:-1] + th * np.diff(self.x)
+        ys_h = np.broadcast_to(self.y[:, None], th.shape)
+        xs_v = np.broadcast_to(self.x[None, :], tv.shape)
+        ys_v = self.y[:-1, None] + tv * np.diff(self.y)[:, None]
+        points = np.concatenate([
+            np.stack([xs_h, ys_h], axis=-1).reshape(-1, 2),
+            np.stack([xs_v, ys_v], axis=-1).reshape(-1, 2),
+        ])
+        offset = ny * (nx - 1)
+
+        # caso de cada celda
+        above = fs >= level
+        case = (above[:-1, :-1] * 1 + above[:-1, 1:] * 2 + above[1:, 1:] * 4 + above[1:, :-1] * 8)
+        corners = np.stack([fs[:-1, :-1], fs[:-1, 1:], fs[1:, 1:], fs[1:, :-1]])
+        case = np.where(np.isnan(corners).any(axis=0), 0, case)
+        center = corners.mean(axis=0) >= level
+
+        # id del punto de cada borde de cada celda: abajo, derecha, arriba, izquierda
+        iy, ix = np.mgrid[0:ny - 1, 0:nx - 1]
+        edges = np.stack([
+            iy * (nx - 1) + ix,
+            offset + iy * nx + ix + 1,
+            (iy + 1) * (nx - 1) + ix,
+            offset + iy * nx + ix,
+        ], axis=-1)
+
+        segments = []
+        for value in np.unique(case):
+            if value in (0, 15):
+                continue
+            cells = case == value
+            if value in _SADDLES:
+                for pairs, selected in zip(_SADDLES[value], (~center & cells, center & cells)):
+                    for a, b in pairs:
+                        segments.append(np.stack([edges[selected][:, a], edges[selected][:, b]], axis=-1))
+            else:
+                for a, b in _SEGMENTS[value]:
+                    segments.append(np.stack([edges[cells][:, a], edges[cells][:, b]], axis=-1))
+        if not segments:
+            return []
+        return [points[line] for line in _join_segments(np.concatenate(segments))]
+
+
+def fs_field(table: SurfaceTable, method: str) -> FSField:
+    """
+    Ubica las superficies de una tabla (por ejemplo la de una búsqueda en
+    grilla) en la grilla de centros y guarda el FS mínimo de cada centro con
+    el radio de esa superficie.
+
+    Se usa la grilla de la búsqueda (table.grid), que incluye los centros sin
+    superficies; si no se conoce se reconstruye a partir de las coordenadas de
+    los centros, completando las filas y columnas faltantes de una grilla
+    regular (CenterGrid.infer). Los centros sin superficies válidas quedan
+    con FS NaN. Las superficies con FS no válido (vacío o código de error,
+    FS <= 0) se ignoran. Las superficies que no son de una grilla rectangular
+    (por ejemplo de tres puntos) dejan la grilla mayormente vacía.
+
+    Args:
+        table: Tabla de superficies
+        method: Nombre del método
+
+    Devuelve:
+        FSField: Campo de FS mínimo (ny, nx)
+    """
+    name = method.strip().lower()
+    if name not in table.methods:
+        raise SlideError(f"Método sin resultados: {method} (disponibles: {', '.join(table.methods)})")
+    grid = table.grid if table.grid is not None else CenterGrid.infer(table.xc, table.yc)
+    ny, nx = grid.shape
+    iy, ix = grid.locate(table.xc, table.yc)
+
+    fs = table.fs[:, table.methods.index(name)]
+    on_grid = (iy >= 0) & (ix >= 0)
+    valid = np.isfinite(fs) & (fs > 0) & on_grid
+    cell = np.where(on_grid, iy * nx + ix, -1)
+
+    # fila de FS mínimo de cada centro: orden por (centro, FS) y primera de cada centro
+    order = np.lexsort((np.where(valid, fs, np.inf), cell))
+    first = order[np.r_[True, cell[order][1:] != cell[order][:-1]]] if len(order) else order
+    first = first[valid[first]]
+
+    field_fs = np.full(ny * nx, np.nan)
+    field_radius = np.full(ny * nx, np.nan)
+    field_row = np.full(ny * nx, -1, dtype=np.int64)
+    field_fs[cell[first]] = fs[first]
+    field_radius[cell[first]] = table.radius[first]
+    field_row[cell[first]] = first
+    return FSField(
+        method=name,
+        x=grid.x,
+        y=grid.y,
+        fs=field_fs.reshape(ny, nx),
+        radius=field_radius.reshape(ny, nx),
+        row=field_row.reshape(ny, nx),
+        table=table
+    )
+
+
+def _join_segments(segments: np.ndarray) -> list[np.ndarray]:
+    """
+    Une segmentos (pares de ids de punto) en polilíneas; cada id aparece en
+    uno o dos segmentos porque cada borde lo comparten dos celdas
+    """
+    neighbors = {}
+    for a, b in segments.tolist():
+        neighbors.setdefault(a, []).append(b)
+        neighbors.setdefault(b, []).append(a)
+
+    lines = []
+    visited = set()
+    # primero las curvas abiertas (extremos con un solo vecino), después las cerradas
+    starts = [point for point, linked in neighbors.items() if len(linked) == 1] + list(neighbors)
+    for start in starts:
+        if start in visited:
+            continue
+        line = [start]
+        visited.add(start)
+        current = start
+        while True:
+            following = [point for point in neighbors[current] if point not in visited]
+            if not following:
+                if len(line) > 2 and start in neighbors[current]:
+                    line.append(start)
+                break
+            current = following[0]
+            visited.add(current)
+            line.append(current)
+        lines.append(np.array(line))
+    return lines
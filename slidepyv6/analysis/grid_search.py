@@ -0,0 +1,313 @@
+from ..models.geometries import Point, ProjectGeometry
+from ..models.loads import ProjectLoads
+from ..models.properties import MohrCoulombParams, ProjectProperties
+from ..models.results import (
+    CenterGrid, EquilibriumTerms, GlobalMinimum, Method, ProjectResults, Surface, SurfaceTable
+)
+from ..utils.exceptions import SlideError
+from .limit_equilibrium import METHODS, safety_factor, strength_arrays
+from .slicing import WATER_UNIT_WEIGHT, slice_circles
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+import numpy as np
+import os
+
+# Número de círculos por tarea (cada tarea se discretiza y evalúa en bloque)
+DEFAULT_CHUNK_SIZE = 4096
+
+
+@dataclass(eq=False)
+class _SearchContext:
+    """Datos del proyecto que necesita cada proceso para evaluar círculos"""
+    geometry: ProjectGeometry
+    properties: ProjectProperties
+    loads: ProjectLoads | None
+    direction: str
+    methods: tuple[str, ...]
+    cohesion: np.ndarray
+    tan_phi: np.ndarray
+    limits: tuple[float, float]
+    bottom: float
+    num_slices: int
+    water_unit_weight: float
+    seismic: float
+    seismicv: float
+
+
+# contexto del proceso de trabajo (se envía una sola vez, en el inicializador)
+_CONTEXT: _SearchContext | None = None
+
+
+def _init_worker(context: _SearchContext) -> None:
+    global _CONTEXT
+    _CONTEXT = context
+
+
+def center_grid(geometry: ProjectGeometry, nx: int = 20, ny: int = 20) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Grilla de centros por encima de la pendiente: en x entre los límites de
+    la pendiente y en y desde la cota máxima de la pendiente hasta esa cota
+    más el ancho entre límites
+
+    Args:
+        geometry: Geometría del proyecto
+        nx, ny: Número de centros en x y en y
+
+    Devuelve:
+        tuple[np.ndarray, np.ndarray]: Coordenadas x, y de los nx * ny centros
+    """
+    left, right = _slope_limits(geometry)
+    top = float(geometry.arrays.vertices[geometry.arrays.slope, 1].max())
+    xs, ys = np.meshgrid(np.linspace(left, right, nx), np.linspace(top, top + (right - left), ny + 1)[1:])
+    return xs.ravel(), ys.ravel()
+
+
+def circle_radii(
+        geometry: ProjectGeometry,
+        xc: np.ndarray,
+        yc: np.ndarray,
+        radius_increments: int = 10
+        ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Radios de prueba de cada centro: radius_increments radios equiespaciados
+    desde el círculo tangente a la pendiente (sin incluirlo) hasta la menor
+    distancia del centro a los dos extremos de los límites de la pendiente
+
+    Args:
+        geometry: Geometría del proyecto
+        xc, yc: Centros, (m,)
+        radius_increments: Número de radios por centro
+
+    Devuelve:
+        tuple: xc, yc y radio de cada círculo, (m * radius_increments,) (los
+            centros sin radios válidos se omiten)
+    """
+    xc = np.asarray(xc, dtype=np.float64)
+    yc = np.asarray(yc, dtype=np.float64)
+    slope = _clipped_slope(geometry)
+    left, right = slope[0], slope[-1]
+
+    # distancia de cada centro a cada segmento de la pendiente recortada
+    ax, ay = slope[:-1, 0], slope[:-1, 1]
+    dx, dy = np.diff(slope[:, 0]), np.diff(slope[:, 1])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = ((xc[:, None] - ax) * dx + (yc[:, None] - ay) * dy) / (dx * dx + dy * dy)
+    t = np.clip(np.nan_to_num(t), 0.0, 1.0)
+    r_min = np.hypot(ax + t * dx - xc[:, None], ay + t * dy - yc[:, None]).min(axis=1)
+    r_max = np.minimum(np.hypot(*(left[:, None] - [xc, yc])), np.hypot(*(right[:, None] - [xc, yc])))
+
+    keep = r_max > r_min
+    fraction = np.arange(1, radius_increments + 1) / radius_increments
+    radii = r_min[keep, None] + (r_max - r_min)[keep, None] * fraction
+    return (np.repeat(xc[keep], radius_increments), np.repeat(yc[keep], radius_increments), radii.ravel())
+
+
+def grid_search(
+        geometry: ProjectGeometry,
+        properties: ProjectProperties,
+        loads: ProjectLoads | None = None,
+        direction: str = 'left to right',
+        centers: tuple[np.ndarray, np.ndarray] | None = None,
+        grid: tuple[int, int] = (20, 20),
+        radius_increments: int = 10,
+        num_slices: int = 25,
+        methods: tuple[str, ...] = ('bishop simplified', 'janbu simplified'),
+        strength: dict[str, MohrCoulombParams] | None = None,
+        workers: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        water_unit_weight: float = WATER_UNIT_WEIGHT['metric'],
+        seismic: float = 0.0,
+        seismicv: float = 0.0
+        ) -> ProjectResults:
+    """
+    Búsqueda de superficies circulares en grilla: para cada centro se prueban
+    radius_increments radios, los círculos se discretizan y evalúan en bloques
+    vectorizados y los bloques se reparten entre procesos.
+
+    Los círculos cuya entrada o salida queda fuera de los límites de la
+    pendiente, que bajan de la base del modelo o cuyo término motor o FS no es
+    positivo se descartan (FS NaN en la tabla).
+
+    Args:
+        geometry: Geometría del proyecto
+        properties: Propiedades del proyecto
+        loads: Cargas del proyecto
+        direction: Sentido de la falla (ProjectMetadata.direction)
+        centers: Coordenadas x, y de los centros; por defecto center_grid(geometry, *grid)
+        grid: Número de centros en x y en y de la grilla por defecto
+        radius_increments: Número de radios por centro
+        num_slices: Número de rebanadas por superficie
+        methods: Métodos a evaluar (METHODS)
+        strength: Parámetros de Mohr-Coulomb que reemplazan a los del proyecto, por id de material
+        workers: Número de procesos (por defecto el número de núcleos; 1 evalúa en este proceso)
+        chunk_size: Número de círculos por tarea
+        water_unit_weight: Peso unitario del agua
+        seismic, seismicv: Coeficientes sísmicos horizontal y vertical
+
+    Devuelve:
+        ProjectResults: Tabla de superficies con el FS de cada método (y la
+            grilla de centros si centers forma una grilla rectangular) y el
+            mínimo global de cada método (con sus rebanadas)
+    """
+    methods = tuple(method.strip().lower() for method in methods)
+    unknown = [method for method in methods if method not in METHODS]
+    if unknown:
+        raise SlideError(f"Métodos no soportados: {', '.join(unknown)} (disponibles: {', '.join(METHODS)})")
+    if len(geometry.arrays.slope) < 2:
+        raise SlideError("La geometría no tiene una pendiente definida")
+
+    if centers is None:
+        centers = center_grid(geometry, *grid)
+    xc, yc, radius = circle_radii(geometry, *centers, radius_increments=radius_increments)
+
+    cohesion, tan_phi = strength_arrays(properties.materials, overrides=strength)
+    exterior = geometry.arrays.vertices[geometry.arrays.exterior]
+    context = _SearchContext(
+        geometry=geometry,
+        properties=properties,
+        loads=loads,
+        direction=direction,
+        methods=methods,
+        cohesion=cohesion,
+        tan_phi=tan_phi,
+        limits=_slope_limits(geometry),
+        bottom=float(exterior[:, 1].min()) if len(exterior) else -np.inf,
+        num_slices=num_slices,
+        water_unit_weight=water_unit_weight,
+        seismic=seismic,
+        seismicv=seismicv
+    )
+
+    chunks = [slice(start, start + chunk_size) for start in range(0, len(xc), chunk_size)]
+    tasks = [(xc[chunk], yc[chunk], radius[chunk]) for chunk in chunks]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) <= 1:
+        _init_worker(context)
+        parts = [_evaluate_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(context,)) as executor:
+            parts = list(executor.map(_evaluate_chunk, tasks))
+
+    columns = {
+        name: np.concatenate([part[name] for part in parts]) if parts else np.empty(0)
+        for name in ('x1', 'y1', 'x2', 'y2')
+    }
+    fs = np.concatenate([part['fs'] for part in parts]) if parts else np.empty((0, len(methods)))
+    table = SurfaceTable(
+        methods=list(methods),
+        xc=xc, yc=yc, radius=radius,
+        yleft=columns['y1'].copy(), yright=columns['y2'].copy(),
+        b1=np.full(len(xc), np.nan),
+        fs=fs,
+        # grilla de los centros pedidos, incluidos los que no tienen radios válidos
+        grid=CenterGrid.from_centers(*centers),
+        **columns
+    )
+    return ProjectResults(
+        methods=[Method(id=i, name=method) for i, method in enumerate(methods)],
+        surface_table=table,
+        global_minimums=[
+            minimum for i in range(len(methods))
+            if (minimum := _global_minimum(context, table, i)) is not None
+        ]
+    )
+
+
+def _evaluate_chunk(task: tuple[np.ndarray, np.ndarray, np.ndarray]) -> dict[str, np.ndarray]:
+    """Discretiza y evalúa un bloque de círculos con el contexto del proceso"""
+    context = _CONTEXT
+    xc, yc, radius = task
+    slices = slice_circles(
+        context.geometry, context.properties, xc, yc, radius,
+        num_slices=context.num_slices,
+        loads=context.loads,
+        direction=context.direction,
+        water_unit_weight=context.water_unit_weight
+    )
+    data = slices.to_limit_equilibrium(
+        context.cohesion, context.tan_phi, seismic=context.seismic, seismicv=context.seismicv
+    )
+    x1, x2 = slices.x[:, 0], slices.x[:, -1]
+    left, right = context.limits
+    tolerance = 1e-9 * max(abs(left), abs(right), 1.0)
+    inside = slices.valid & (x1 >= left - tolerance) & (x2 <= right + tolerance) & (yc - radius >= context.bottom)
+
+    fs = np.full((len(xc), len(context.methods)), np.nan)
+    for column, method in enumerate(context.methods):
+        result = safety_factor(method, data)
+        # sin término motor positivo la masa no desliza en el sentido de la falla
+        keep = inside & (result.driving > 0) & (result.fs > 0)
+        fs[keep, column] = result.fs[keep]
+    return {'x1': x1, 'y1': slices.yt[:, 0], 'x2': x2, 'y2': slices.yt[:, -1], 'fs': fs}
+
+
+def _global_minimum(context: _SearchContext, table: SurfaceTable, column: int) -> GlobalMinimum | None:
+    """Superficie de menor FS de un método, con sus rebanadas y términos de equilibrio"""
+    values = table.fs[:, column]
+    if len(values) == 0 or np.isnan(values).all():
+        return None
+    k = int(np.nanargmin(values))
+    method = table.methods[column]
+
+    slices = slice_circles(
+        context.geometry, context.properties, table.xc[k], table.yc[k], table.radius[k],
+        num_slices=context.num_slices,
+        loads=context.loads,
+        direction=context.direction,
+        water_unit_weight=context.water_unit_weight
+    )
+    data = slices.to_limit_equilibrium(
+        context.cohesion, context.tan_phi, seismic=context.seismic, seismicv=context.seismicv
+    )
+    result = safety_factor(method, data)
+    fs = float(result.fs[0])
+    resisting, driving = float(result.resisting[0]), float(result.driving[0])
+    moments = method == 'bishop simplified'
+
+    slice_data = slices.slice_arrays(0)
+    slice_data.base_cohesion = data.cohesion[0].copy()
+    slice_data.base_friction_angle = np.arctan(data.tan_phi[0])
+    slice_data.m_alpha = np.cos(data.alpha[0]) * (1.0 + np.tan(data.alpha[0]) * data.tan_phi[0] / fs)
+
+    surface = Surface(
+        method=method,
+        radius=float(table.radius[k]),
+        point1=Point(x=float(table.x1[k]), y=float(table.y1[k])),
+        point2=Point(x=float(table.x2[k]), y=float(table.y2[k])),
+        yleft=float(table.yleft[k]),
+        yright=float(table.yright[k]),
+        fs=float(values[k]),
+        point_center=Point(x=float(table.xc[k]), y=float(table.yc[k])),
+        b1=None
+    )
+    return GlobalMinimum(
+        surface=surface,
+        equilibrium_terms=EquilibriumTerms(
+            resisting_moment=resisting if moments else None,
+            driving_moment=driving if moments else None,
+            resisting_force=None if moments else resisting,
+            driving_force=None if moments else driving
+        ),
+        slice_data=slice_data
+    )
+
+
+def _slope_limits(geometry: ProjectGeometry) -> tuple[float, float]:
+    """x de los límites de la pendiente (por defecto, los extremos de la pendiente)"""
+    if geometry.limits is not None:
+        first, second = geometry.limits
+        return tuple(sorted((float(first.x), float(second.x))))
+    xs = geometry.arrays.vertices[geometry.arrays.slope, 0]
+    return float(xs.min()), float(xs.max())
+
+
+def _clipped_slope(geometry: ProjectGeometry) -> np.ndarray:
+    """Polilínea de la pendiente (x creciente) recortada a los límites"""
+    slope = geometry.arrays.vertices[geometry.arrays.slope]
+    if slope[0, 0] > slope[-1, 0]:
+        slope = slope[::-1]
+    left, right = _slope_limits(geometry)
+    inner = slope[(slope[:, 0] > left) & (slope[:, 0] < right)]
+    ends = np.array([[left, np.interp(left, slope[:, 0], slope[:, 1])],
+                     [right, np.interp(right, slope[:, 0], slope[:, 1])]])
+    return np.vstack([ends[:1], inner, ends[1:]])
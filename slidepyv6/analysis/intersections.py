@@ -0,0 +1,173 @@
+from ..utils.exceptions import SlideError
+from dataclasses import dataclass
+import numpy as np
+
+# Número de círculos que se procesan a la vez (limita la memoria temporal)
+_CIRCLE_CHUNK = 1 << 16
+
+
+@dataclass(eq=False)
+class CircleIntersections:
+    """
+    Clase CircleIntersections con la intersección de N círculos de falla con
+    la superficie del talud.
+    Atributos:
+    ----------
+        x1 (np.ndarray): Coordenada x del extremo izquierdo de la falla.
+        y1 (np.ndarray): Coordenada y del extremo izquierdo.
+        x2 (np.ndarray): Coordenada x del extremo derecho de la falla.
+        y2 (np.ndarray): Coordenada y del extremo derecho.
+        count (np.ndarray): Número de cortes del círculo con la superficie.
+        arc_length (np.ndarray): Longitud del arco inferior entre entrada y salida.
+        area (np.ndarray): Área de la masa deslizante (entre la superficie y el arco).
+    """
+    x1: np.ndarray
+    y1: np.ndarray
+    x2: np.ndarray
+    y2: np.ndarray
+    count: np.ndarray
+    arc_length: np.ndarray
+    area: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.x1)
+
+    @property
+    def valid(self) -> np.ndarray:
+        """True para los círculos que cortan la superficie al menos dos veces"""
+        return self.count >= 2
+
+    def deviation(self, x1, y1, x2, y2) -> np.ndarray:
+        """
+        Mayor distancia entre los puntos calculados y los dados (por ejemplo
+        point1/point2 leídos del .s01), por círculo
+
+        Args:
+            x1, y1, x2, y2: Coordenadas de referencia de entrada y salida
+        """
+        return np.maximum(np.hypot(self.x1 - x1, self.y1 - y1), np.hypot(self.x2 - x2, self.y2 - y2))
+
+
+def intersect_circles(xc, yc, radius, polyline: np.ndarray, direction: str = 'left to right') -> CircleIntersections:
+    """
+    Intersecta N círculos con una polilínea (la superficie del talud), en
+    bloques de operaciones de NumPy de (círculos, segmentos).
+
+    Si el círculo corta la superficie más de dos veces, la falla es el primer
+    tramo del arco bajo la superficie en el sentido de la falla (los dos
+    primeros cortes desde la izquierda para 'left to right'), igual que los
+    puntos point1/point2 que guarda Slide.
+
+    La masa deslizante se toma entre la polilínea y el arco inferior del
+    círculo, y(x) = yc - sqrt(r² - (x - xc)²), por lo que el área supone una
+    superficie que es función de x y un centro por encima de la falla (como
+    en las superficies circulares de Slide).
+
+    Args:
+        xc, yc, radius: Centro y radio de cada círculo, (N,)
+        polyline: Vértices de la superficie en orden, (k, 2)
+        direction: Sentido de la falla, 'left to right' o 'right to left'
+            (ProjectMetadata.direction)
+
+    Devuelve:
+        CircleIntersections: Puntos de entrada y salida, número de cortes,
+            longitud del arco y área de cada círculo (NaN si corta menos de dos veces)
+    """
+    xc, yc, radius = (np.atleast_1d(np.asarray(value, dtype=np.float64)) for value in (xc, yc, radius))
+    polyline = np.asarray(polyline, dtype=np.float64)
+    right_to_left = direction.strip().lower() == 'right to left'
+    if len(polyline) < 2:
+        raise SlideError("La superficie del talud necesita al menos dos vértices")
+    if polyline[0, 0] > polyline[-1, 0]:
+        polyline = polyline[::-1]
+
+    num = len(xc)
+    result = {name: np.full(num, np.nan) for name in ('x1', 'y1', 'x2', 'y2', 'arc_length', 'area')}
+    result['count'] = np.zeros(num, dtype=np.int64)
+    for start in range(0, num, _CIRCLE_CHUNK):
+        chunk = slice(start, start + _CIRCLE_CHUNK)
+        for name, values in _intersect_chunk(xc[chunk], yc[chunk], radius[chunk], polyline, right_to_left).items():
+            result[name][chunk] = values
+    return CircleIntersections(**result)
+
+
+def _intersect_chunk(xc, yc, radius, polyline, right_to_left) -> dict[str, np.ndarray]:
+    ax, ay = polyline[:-1, 0], polyline[:-1, 1]
+    dx, dy = np.diff(polyline[:, 0]), np.diff(polyline[:, 1])
+
+    # |A + t d - C|² = r²  =>  a t² + b t + c = 0, para cada (círculo, segmento)
+    fx = ax[None, :] - xc[:, None]
+    fy = ay[None, :] - yc[:, None]
+    a = dx * dx + dy * dy
+    b = 2.0 * (fx * dx + fy * dy)
+    c = fx * fx + fy * fy - (radius * radius)[:, None]
+    disc = b * b - 4.0 * a * c
+    root = np.sqrt(np.where(disc >= 0, disc, np.nan))
+
+    # el extremo final de cada segmento se cuenta solo en el último
+    upper = np.ones(len(dx))
+    upper[:-1] = np.nextafter(1.0, 0.0)
+
+    xs, ys, hits = [], [], []
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for sign in (-1.0, 1.0):
+            t = (-b + sign * root) / (2.0 * a)
+            hit = (t >= 0.0) & (t <= upper)
+            if sign > 0:
+                # raíz doble (tangente): se cuenta una sola vez
+                hit &= disc > 0
+            xs.append(np.where(hit, ax + t * dx, np.nan))
+            ys.append(np.where(hit, ay + t * dy, np.nan))
+            hits.append(hit)
+
+    xs = np.concatenate(xs, axis=1)
+    ys = np.concatenate(ys, axis=1)
+    count = np.concatenate(hits, axis=1).sum(axis=1)
+
+    # primer tramo del arco bajo la superficie, en el sentido de la falla:
+    # los dos primeros cortes desde la izquierda (o desde la derecha)
+    rows = np.arange(len(xc))[:, None]
+    valid = count >= 2
+    if right_to_left:
+        order = np.argsort(np.where(np.isnan(xs), np.inf, -xs), axis=1)[:, 1::-1]
+    else:
+        order = np.argsort(np.where(np.isnan(xs), np.inf, xs), axis=1)[:, :2]
+    if order.shape[1] < 2:
+        order = np.zeros((len(xc), 2), dtype=np.int64)
+    pair_x = xs[rows, order]
+    pair_y = ys[rows, order]
+    x1 = np.where(valid, pair_x[:, 0], np.nan)
+    y1 = np.where(valid, pair_y[:, 0], np.nan)
+    x2 = np.where(valid, pair_x[:, 1], np.nan)
+    y2 = np.where(valid, pair_y[:, 1], np.nan)
+
+    # arco inferior: de la entrada a la salida en sentido antihorario
+    angle1 = np.arctan2(y1 - yc, x1 - xc)
+    angle2 = np.arctan2(y2 - yc, x2 - xc)
+    arc_length = radius * np.mod(angle2 - angle1, 2.0 * np.pi)
+
+    area = _area_under_polyline(polyline, x2) - _area_under_polyline(polyline, x1) \
+        - _area_under_lower_arc(xc, yc, radius, x1, x2)
+
+    return {'x1': x1, 'y1': y1, 'x2': x2, 'y2': y2, 'count': count,
+            'arc_length': arc_length, 'area': area}
+
+
+def _area_under_polyline(polyline: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """Integral de la polilínea (función de x) desde su primer vértice hasta x"""
+    px, py = polyline[:, 0], polyline[:, 1]
+    cumulative = np.r_[0.0, np.cumsum(np.diff(px) * (py[1:] + py[:-1]) / 2.0)]
+    k = np.clip(np.searchsorted(px, x, side='right') - 1, 0, len(px) - 2)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        slope = (py[k + 1] - py[k]) / (px[k + 1] - px[k])
+    slope = np.where(np.isfinite(slope), slope, 0.0)
+    y = py[k] + slope * (x - px[k])
+    return cumulative[k] + (x - px[k]) * (py[k] + y) / 2.0
+
+
+def _area_under_lower_arc(xc, yc, radius, x1, x2) -> np.ndarray:
+    """Integral de y = yc - sqrt(r² - (x - xc)²) entre x1 y x2"""
+    def primitive(u):
+        u = np.clip(u, -radius, radius)
+        return 0.5 * (u * np.sqrt(np.maximum(radius * radius - u * u, 0.0)) + radius * radius * np.arcsin(u / radius))
+    return yc * (x2 - x1) - (primitive(x2 - xc) - primitive(x1 - xc))
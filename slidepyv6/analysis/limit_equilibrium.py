@@ -0,0 +1,591 @@
+from ..models.loads import ProjectLoads
+from ..models.geometries import Support
+from ..models.properties import EndAnchoredParams, MohrCoulombParams, PropertyMaterial, PropertySupport
+from ..models.results import SliceArrays
+from ..utils.exceptions import SlideError
+from dataclasses import dataclass, field, replace
+from typing import Callable
+import numpy as np
+
+
+@dataclass(eq=False)
+class LimitEquilibriumSlices:
+    """
+    Clase LimitEquilibriumSlices con los datos por rebanada que necesitan los
+    métodos de equilibrio límite. Los arreglos por rebanada tienen forma
+    (..., n) y los arreglos por superficie forma (...), de modo que un mismo
+    objeto puede contener una superficie o un lote de superficies (las
+    rebanadas de relleno deben tener ancho y peso 0).
+    Atributos:
+    ----------
+        width (np.ndarray): Ancho de cada rebanada.
+        alpha (np.ndarray): Inclinación de la base (rad), positiva si la base
+            baja en el sentido de la falla.
+        weight (np.ndarray): Peso de cada rebanada.
+        cohesion (np.ndarray): Cohesión en la base.
+        tan_phi (np.ndarray): Tangente del ángulo de fricción en la base.
+        pore_pressure (np.ndarray): Presión de poros en la base.
+        arm (np.ndarray): Brazo del peso respecto del centro, positivo si el
+            peso empuja en el sentido de la falla.
+        radius (np.ndarray): Radio de la superficie.
+        load (np.ndarray): Cargas externas verticales sobre cada rebanada (hacia abajo positivas).
+        horizontal (np.ndarray): Cargas externas horizontales sobre cada
+            rebanada (positivas en el sentido de la falla).
+        load_moment (np.ndarray): Momento motor de las cargas externas respecto del centro.
+        passive_moment (np.ndarray): Momento resistente de los soportes pasivos (Bishop).
+        passive_force (np.ndarray): Fuerza resistente de los soportes pasivos (Janbu).
+        seismic_arm (np.ndarray): Brazo de la fuerza sísmica horizontal de cada
+            rebanada, yc menos la cota del centro de la rebanada (Bishop).
+        seismic (np.ndarray): Coeficiente sísmico horizontal de la superficie
+            (fuerza k W en el sentido de la falla).
+        seismicv (np.ndarray): Coeficiente sísmico vertical de la superficie
+            (fuerza k W, positiva hacia arriba).
+    """
+    width: np.ndarray
+    alpha: np.ndarray
+    weight: np.ndarray
+    cohesion: np.ndarray
+    tan_phi: np.ndarray
+    pore_pressure: np.ndarray
+    arm: np.ndarray
+    radius: np.ndarray
+    load: np.ndarray = field(default_factory=lambda: np.zeros(1))
+    horizontal: np.ndarray = field(default_factory=lambda: np.zeros(1))
+    load_moment: np.ndarray = field(default_factory=lambda: np.zeros(()))
+    passive_moment: np.ndarray = field(default_factory=lambda: np.zeros(()))
+    passive_force: np.ndarray = field(default_factory=lambda: np.zeros(()))
+    seismic_arm: np.ndarray = field(default_factory=lambda: np.zeros(1))
+    seismic: np.ndarray = field(default_factory=lambda: np.zeros(()))
+    seismicv: np.ndarray = field(default_factory=lambda: np.zeros(()))
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Forma del lote de superficies (() para una sola superficie)"""
+        return np.shape(self.weight)[:-1]
+
+
+@dataclass(eq=False)
+class SafetyFactors:
+    """
+    Clase SafetyFactors con el resultado de un método de equilibrio límite
+    para una superficie o un lote de superficies.
+    Atributos:
+    ----------
+        method (str): Nombre del método ('bishop simplified', 'janbu simplified').
+        fs (np.ndarray): Factor de seguridad de cada superficie.
+        converged (np.ndarray): True si la iteración convergió.
+        iterations (int): Número de iteraciones realizadas.
+        resisting (np.ndarray): Término resistente (momento en Bishop, fuerza en Janbu).
+        driving (np.ndarray): Término motor (momento en Bishop, fuerza en Janbu).
+    """
+    method: str
+    fs: np.ndarray
+    converged: np.ndarray
+    iterations: int
+    resisting: np.ndarray
+    driving: np.ndarray
+
+
+#---------------------------------------------------------------------
+# Métodos
+#---------------------------------------------------------------------
+
+def bishop_simplified(
+        slices: LimitEquilibriumSlices,
+        tolerance: float = 1e-6,
+        max_iterations: int = 100,
+        fs0: float = 1.0
+        ) -> SafetyFactors:
+    """
+    Factor de seguridad de Bishop simplificado (equilibrio de momentos
+    respecto del centro, fuerzas entre rebanadas horizontales)
+
+        FS = (R Σ [c b + (W' + Q - u b) tanφ] / mα + M pasivo)  /  (Σ W' brazo + kh Σ W brazo sísmico + M cargas)
+        mα = cos α (1 + tan α tanφ / FS),  W' = W (1 - kv)
+
+    Args:
+        slices: Datos de las rebanadas
+        tolerance: Diferencia máxima de FS entre dos iteraciones
+        max_iterations: Número máximo de iteraciones
+        fs0: Valor inicial de FS
+    """
+    resisting, driving = _bishop_terms(slices)
+    return _iterate('bishop simplified', resisting, driving, tolerance, max_iterations, fs0)
+
+
+def janbu_simplified(
+        slices: LimitEquilibriumSlices,
+        tolerance: float = 1e-6,
+        max_iterations: int = 100,
+        fs0: float = 1.0
+        ) -> SafetyFactors:
+    """
+    Factor de seguridad de Janbu simplificado (equilibrio de fuerzas
+    horizontales, sin factor de corrección f0)
+
+        FS = (Σ [c b + (W' + Q - u b) tanφ] / (cos α mα) + T pasivo)  /  (Σ (W' + Q) tan α + Σ H + kh Σ W)
+
+    Args:
+        slices: Datos de las rebanadas
+        tolerance: Diferencia máxima de FS entre dos iteraciones
+        max_iterations: Número máximo de iteraciones
+        fs0: Valor inicial de FS
+    """
+    resisting, driving = _janbu_terms(slices)
+    return _iterate('janbu simplified', resisting, driving, tolerance, max_iterations, fs0)
+
+
+# Métodos disponibles, por el nombre que usa Slide en el .s01
+METHODS: dict[str, Callable[..., SafetyFactors]] = {
+    'bishop simplified': bishop_simplified,
+    'janbu simplified': janbu_simplified,
+}
+
+
+def safety_factor(method: str, slices: LimitEquilibriumSlices, **kwargs) -> SafetyFactors:
+    """
+    Factor de seguridad por el nombre del método
+
+    Args:
+        method: Nombre del método (METHODS), sin distinguir mayúsculas
+        slices: Datos de las rebanadas
+        **kwargs: Opciones de la iteración (tolerance, max_iterations, fs0)
+    """
+    solver = METHODS.get(method.strip().lower())
+    if solver is None:
+        raise SlideError(f"Método no soportado: {method} (disponibles: {', '.join(METHODS)})")
+    return solver(slices, **kwargs)
+
+
+def critical_seismic_coefficient(
+        method: str,
+        slices: LimitEquilibriumSlices,
+        vertical_ratio: float = 0.0
+        ) -> np.ndarray:
+    """
+    Coeficiente sísmico horizontal crítico kc (aceleración de fluencia) con
+    el que FS = 1, para cada superficie del lote. La fuerza sísmica vertical
+    es vertical_ratio * kc * W (positiva hacia arriba).
+
+    Con FS = 1 los mα quedan fijos y los términos resistente y motor son
+    lineales en el coeficiente, por lo que kc se obtiene sin iterar a partir
+    de los términos con k = 0 y k = 1. Los coeficientes sísmicos de slices
+    se ignoran. kc es negativo si la superficie ya es inestable (FS < 1) y
+    NaN si algún mα es nulo o negativo con FS = 1 o si el sismo no aumenta
+    el término motor.
+
+    Args:
+        method: Nombre del método (METHODS)
+        slices: Datos de las rebanadas
+        vertical_ratio: Cociente entre los coeficientes vertical y horizontal
+
+    Devuelve:
+        np.ndarray: kc de cada superficie
+    """
+    terms = _TERMS.get(method.strip().lower())
+    if terms is None:
+        raise SlideError(f"Método no soportado: {method} (disponibles: {', '.join(METHODS)})")
+    unit = np.ones(slices.shape)
+    static = terms(replace(slices, seismic=0.0 * unit, seismicv=0.0 * unit))
+    seismic = terms(replace(slices, seismic=unit, seismicv=vertical_ratio * unit))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # f(k) = resistente - motor es lineal en k
+        f0 = static[0](unit) - static[1]
+        f1 = seismic[0](unit) - seismic[1]
+        kc = f0 / (f0 - f1)
+        m_alpha = _m_alpha(slices, unit)
+    bad = np.any((m_alpha <= 0.0) & (slices.width > 0.0), axis=-1) | ~(f0 - f1 > 0.0)
+    return np.where(bad, np.nan, kc)
+
+
+def _bishop_terms(slices: LimitEquilibriumSlices):
+    """Término resistente (función de FS) y motor de Bishop simplificado"""
+    numerator = _base_strength(slices)
+    driving = np.sum(_vertical_weight(slices) * slices.arm, axis=-1) + slices.load_moment + \
+        slices.seismic * np.sum(slices.weight * slices.seismic_arm, axis=-1)
+
+    def resisting(fs):
+        return slices.radius * np.sum(numerator / _m_alpha(slices, fs), axis=-1) + slices.passive_moment
+
+    return resisting, driving
+
+
+def _janbu_terms(slices: LimitEquilibriumSlices):
+    """Término resistente (función de FS) y motor de Janbu simplificado"""
+    numerator = _base_strength(slices) / np.cos(slices.alpha)
+    driving = np.sum((_vertical_weight(slices) + slices.load) * np.tan(slices.alpha) + slices.horizontal, axis=-1) + \
+        slices.seismic * np.sum(slices.weight, axis=-1)
+
+    def resisting(fs):
+        return np.sum(numerator / _m_alpha(slices, fs), axis=-1) + slices.passive_force
+
+    return resisting, driving
+
+
+# Términos de cada método (critical_seismic_coefficient)
+_TERMS = {
+    'bishop simplified': _bishop_terms,
+    'janbu simplified': _janbu_terms,
+}
+
+
+def _vertical_weight(slices: LimitEquilibriumSlices) -> np.ndarray:
+    """Peso menos la fuerza sísmica vertical, W (1 - kv)"""
+    return slices.weight * (1.0 - np.asarray(slices.seismicv)[..., None])
+
+
+def _base_strength(slices: LimitEquilibriumSlices) -> np.ndarray:
+    """c b + (W' + Q - u b) tanφ para cada rebanada"""
+    return slices.cohesion * slices.width + \
+        (_vertical_weight(slices) + slices.load - slices.pore_pressure * slices.width) * slices.tan_phi
+
+
+def _m_alpha(slices: LimitEquilibriumSlices, fs: np.ndarray) -> np.ndarray:
+    fs = np.asarray(fs)[..., None]
+    return np.cos(slices.alpha) * (1.0 + np.tan(slices.alpha) * slices.tan_phi / fs)
+
+
+def _iterate(method, resisting, driving, tolerance, max_iterations, fs0) -> SafetyFactors:
+    """Iteración de punto fijo FS = resistente(FS) / motor sobre todo el lote a la vez"""
+    driving = np.asarray(driving, dtype=np.float64)
+    fs = np.full(driving.shape, float(fs0))
+    delta = np.full(driving.shape, np.inf)
+    iterations = 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        while iterations < max_iterations:
+            iterations += 1
+            new = resisting(fs) / driving
+            delta = np.abs(new - fs)
+            fs = new
+            # los NaN (superficies sin motor o con mα nulo) no detienen la iteración
+            if not np.any(delta > tolerance):
+                break
+        res = resisting(fs)
+    return SafetyFactors(
+        method=method,
+        fs=fs,
+        converged=np.isfinite(fs) & (delta <= tolerance),
+        iterations=iterations,
+        resisting=res,
+        driving=driving
+    )
+
+
+#---------------------------------------------------------------------
+# Datos de entrada
+#---------------------------------------------------------------------
+
+def strength_arrays(
+        materials: list[PropertyMaterial],
+        material_ids: list[str] | None = None,
+        overrides: dict[str, MohrCoulombParams] | None = None
+        ) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Cohesión y tangente del ángulo de fricción de cada material, alineadas con
+    material_ids (NaN para los materiales que no son de Mohr-Coulomb)
+
+    Args:
+        materials: Materiales del proyecto (ProjectProperties.materials)
+        material_ids: Orden de los materiales en los arreglos (por defecto el de materials)
+        overrides: Parámetros que reemplazan a los del proyecto, por id de material
+    """
+    params = {material.id: material.material_params for material in materials}
+    params.update(overrides or {})
+    if material_ids is None:
+        material_ids = [material.id for material in materials]
+
+    cohesion = np.full(len(material_ids), np.nan)
+    tan_phi = np.full(len(material_ids), np.nan)
+    for i, material_id in enumerate(material_ids):
+        param = params.get(material_id)
+        if isinstance(param, MohrCoulombParams):
+            cohesion[i] = param.cohesion
+            tan_phi[i] = np.tan(np.radians(param.friction_angle))
+    return cohesion, tan_phi
+
+
+def load_forces(
+        x: np.ndarray,
+        loads: ProjectLoads | None,
+        xc,
+        yc,
+        direction: str = 'left to right'
+        ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Reparte las cargas del proyecto entre las rebanadas de una superficie o
+    de un lote de superficies
+
+    Las cargas lineales se asignan a la rebanada que contiene su punto y las
+    distribuidas se integran sobre el tramo de cada rebanada (variación lineal
+    entre los dos extremos). La dirección de cada carga es su ángulo (270 = vertical
+    hacia abajo).
+
+    Args:
+        x: Límites de las rebanadas, (..., n + 1) crecientes
+        loads: Cargas del proyecto
+        xc, yc: Centro de cada superficie, (...)
+        direction: Sentido de la falla (ProjectMetadata.direction)
+
+    Devuelve:
+        tuple: Carga vertical (hacia abajo positiva) y horizontal (positiva
+            en el sentido de la falla) por rebanada, (..., n), y momento motor
+            total respecto del centro, (...)
+    """
+    x = np.asarray(x, dtype=np.float64)
+    xc = np.asarray(xc, dtype=np.float64)
+    yc = np.asarray(yc, dtype=np.float64)
+    left, right = x[..., :-1], x[..., 1:]
+    vertical = np.zeros(left.shape)
+    horizontal = np.zeros(left.shape)
+    moment = np.zeros(np.broadcast_shapes(x.shape[:-1], xc.shape, yc.shape))
+    sign = -1.0 if _right_to_left(direction) else 1.0
+    if loads is None or x.shape[-1] < 2:
+        return vertical, horizontal, moment
+
+    for linear in loads.linear:
+        px, py = linear.load.point.x, linear.load.point.y
+        inside = (left <= px) & (px < right)
+        inside[..., -1] |= px == right[..., -1]
+        fx, fy = _components(linear.load.magnitude, linear.angle)
+        vertical -= np.where(inside, fy, 0.0)
+        horizontal += np.where(inside, sign * fx, 0.0)
+        moment += np.where(inside.any(axis=-1), sign * ((px - xc) * fy - (py - yc) * fx), 0.0)
+
+    for distributed in loads.distributed:
+        # Slide aplica la magnitud load en el punto de load2 y viceversa (así
+        # se reproducen los FS del .s01)
+        (xa, ya, qa), (xb, yb, qb) = sorted([
+            (distributed.load.point.x, distributed.load.point.y, distributed.load2.magnitude),
+            (distributed.load2.point.x, distributed.load2.point.y, distributed.load.magnitude),
+        ])
+        if xb <= xa:
+            continue
+        a = np.clip(left, xa, xb)
+        b = np.clip(right, xa, xb)
+        q_a = qa + (qb - qa) * (a - xa) / (xb - xa)
+        q_b = qa + (qb - qa) * (b - xa) / (xb - xa)
+        force = 0.5 * (q_a + q_b) * (b - a)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # x del centroide del trapecio de carga sobre cada rebanada
+            centroid = (q_a * (2 * a + b) + q_b * (a + 2 * b)) / (3 * (q_a + q_b))
+        centroid = np.where(force != 0, centroid, 0.0)
+        height = ya + (yb - ya) * (centroid - xa) / (xb - xa)
+
+        fx, fy = _components(force, distributed.angle)
+        vertical -= fy
+        horizontal += sign * fx
+        moment += sign * np.sum((centroid - xc[..., None]) * fy - (height - yc[..., None]) * fx, axis=-1)
+    return vertical, horizontal, moment
+
+
+def support_forces(
+        x: np.ndarray,
+        supports: list[Support],
+        support_properties: list[PropertySupport],
+        xc,
+        yc,
+        radius,
+        direction: str = 'left to right'
+        ) -> dict[str, np.ndarray]:
+    """
+    Fuerzas de los soportes que cruzan la superficie de falla
+
+    Solo se consideran los anclajes de extremo (EndAnchoredParams), con una
+    fuerza cap / sp dirigida desde el extremo que está dentro del círculo
+    hacia el que está fuera y aplicada en el cruce con el círculo, si el cruce
+    está en la base de la masa deslizante. Con fa = 0
+    el soporte es activo (se suma a las cargas); con otro valor es pasivo (se
+    suma al término resistente).
+
+    Args:
+        x: Límites de las rebanadas, (..., n + 1) crecientes
+        supports: Soportes de la geometría
+        support_properties: Propiedades de los soportes (ProjectProperties.supports)
+        xc, yc, radius: Centro y radio de cada superficie, (...)
+        direction: Sentido de la falla (ProjectMetadata.direction)
+
+    Devuelve:
+        dict[str, np.ndarray]: load y horizontal por rebanada (..., n) y
+            load_moment, passive_moment y passive_force por superficie (...)
+    """
+    x = np.asarray(x, dtype=np.float64)
+    xc, yc, radius = (np.asarray(value, dtype=np.float64) for value in (xc, yc, radius))
+    shape = np.broadcast_shapes(x.shape[:-1], xc.shape, yc.shape, radius.shape)
+    left, right = x[..., :-1], x[..., 1:]
+    forces = {
+        'load': np.zeros(left.shape),
+        'horizontal': np.zeros(left.shape),
+        'load_moment': np.zeros(shape),
+        'passive_moment': np.zeros(shape),
+        'passive_force': np.zeros(shape),
+    }
+    sign = -1.0 if _right_to_left(direction) else 1.0
+    params = {prop.id: prop.support_params for prop in support_properties}
+
+    for support in supports:
+        param = params.get(support.property_id)
+        if not isinstance(param, EndAnchoredParams) or not param.sp:
+            continue
+        x1, y1, x2, y2 = support.point1.x, support.point1.y, support.point2.x, support.point2.y
+        length = np.hypot(x2 - x1, y2 - y1)
+        if length == 0:
+            continue
+        inside1 = np.hypot(x1 - xc, y1 - yc) < radius
+        inside2 = np.hypot(x2 - xc, y2 - yc) < radius
+        crosses = inside1 != inside2
+
+        # cruce con el círculo: |P1 + t (P2 - P1) - C| = r, t en [0, 1]
+        dx, dy = x2 - x1, y2 - y1
+        fx, fy = x1 - xc, y1 - yc
+        b = 2.0 * (fx * dx + fy * dy)
+        c = fx * fx + fy * fy - radius * radius
+        root = np.sqrt(np.maximum(b * b - 4.0 * length ** 2 * c, 0.0))
+        t = np.where(inside1, -b + root, -b - root) / (2.0 * length ** 2)
+        px, py = x1 + t * dx, y1 + t * dy
+        # el cruce debe estar en la base de la masa deslizante
+        crosses = crosses & (px >= x[..., 0]) & (px <= x[..., -1])
+
+        # desde el extremo dentro del círculo hacia el de fuera
+        direction_sign = np.where(inside1, 1.0, -1.0)
+        force = param.cap / param.sp
+        force_x = direction_sign * force * dx / length
+        force_y = direction_sign * force * dy / length
+        moment = np.where(crosses, sign * ((px - xc) * force_y - (py - yc) * force_x), 0.0)
+        horizontal = np.where(crosses, sign * force_x, 0.0)
+
+        if param.fa == 0:
+            # la componente vertical actúa sobre la rebanada del cruce
+            px, force_y, horizontal, crosses = (
+                np.broadcast_to(value, shape)[..., None] for value in (px, force_y, horizontal, crosses))
+            in_slice = (left <= px) & (px < right) & crosses
+            forces['load'] -= np.where(in_slice, force_y, 0.0)
+            forces['horizontal'] += np.where(in_slice, horizontal, 0.0)
+            forces['load_moment'] += moment
+        else:
+            forces['passive_moment'] -= moment
+            forces['passive_force'] -= horizontal
+    return forces
+
+
+def external_forces(
+        x: np.ndarray,
+        xc,
+        yc,
+        radius,
+        direction: str = 'left to right',
+        loads: ProjectLoads | None = None,
+        supports: list[Support] | None = None,
+        support_properties: list[PropertySupport] | None = None
+        ) -> dict[str, np.ndarray]:
+    """
+    Cargas y soportes sobre las rebanadas, con los nombres de los campos de
+    LimitEquilibriumSlices (load, horizontal, load_moment, passive_moment,
+    passive_force)
+
+    Args:
+        x: Límites de las rebanadas, (..., n + 1) crecientes
+        xc, yc, radius: Centro y radio de cada superficie, (...)
+        direction: Sentido de la falla (ProjectMetadata.direction)
+        loads: Cargas del proyecto
+        supports: Soportes de la geometría
+        support_properties: Propiedades de los soportes
+    """
+    forces = support_forces(x, supports or [], support_properties or [], xc, yc, radius, direction)
+    vertical, horizontal, moment = load_forces(x, loads, xc, yc, direction)
+    forces['load'] = forces['load'] + vertical
+    forces['horizontal'] = forces['horizontal'] + horizontal
+    forces['load_moment'] = forces['load_moment'] + moment
+    return forces
+
+
+def slices_from_slice_data(
+        slice_data: SliceArrays,
+        xc: float,
+        yc: float,
+        radius: float,
+        direction: str = 'left to right',
+        strength: tuple[np.ndarray, np.ndarray] | None = None,
+        pore_pressure: np.ndarray | float | None = None,
+        loads: ProjectLoads | None = None,
+        supports: list[Support] | None = None,
+        support_properties: list[PropertySupport] | None = None,
+        seismic: float = 0.0,
+        seismicv: float = 0.0
+        ) -> LimitEquilibriumSlices:
+    """
+    Datos de equilibrio límite a partir de las rebanadas leídas del .s01
+
+    Args:
+        slice_data: Rebanadas de la superficie
+        xc, yc, radius: Centro y radio de la superficie
+        direction: Sentido de la falla (ProjectMetadata.direction)
+        strength: Cohesión y tanφ por material (strength_arrays, en el orden
+            de ProjectProperties.materials); por defecto se usan base_cohesion
+            y base_friction_angle de las rebanadas
+        pore_pressure: Presión de poros en la base de cada rebanada (o un
+            valor para todas); por defecto la de las rebanadas
+        loads: Cargas externas del proyecto
+        supports: Soportes de la geometría (ProjectGeometry.supports)
+        support_properties: Propiedades de los soportes (ProjectProperties.supports)
+        seismic, seismicv: Coeficientes sísmicos horizontal y vertical
+            (ProjectMetadata.seismic y seismicv)
+    """
+    x = np.asarray(slice_data.x, dtype=np.float64)
+    yb = np.asarray(slice_data.yb, dtype=np.float64)
+    if len(x) < 2 or len(slice_data.slice_weight) != len(x) - 1:
+        raise SlideError("Las rebanadas no tienen límites (x, yb) y pesos consistentes")
+
+    sign = -1.0 if _right_to_left(direction) else 1.0
+    width = np.diff(x)
+    alpha = np.arctan(-sign * np.diff(yb) / width)
+    middle = 0.5 * (x[1:] + x[:-1])
+
+    if strength is None:
+        cohesion = np.asarray(slice_data.base_cohesion, dtype=np.float64)
+        tan_phi = np.tan(slice_data.base_friction_angle)
+    else:
+        # base_material es el número del material (1 = primer material)
+        codes = np.asarray(slice_data.base_material).astype(np.int64) - 1
+        cohesion, tan_phi = strength[0][codes], strength[1][codes]
+
+    if pore_pressure is None:
+        pore_pressure = slice_data.pore_pressure
+    pore_pressure = np.broadcast_to(np.asarray(pore_pressure, dtype=np.float64), width.shape)
+
+    forces = external_forces(x, xc, yc, radius, direction, loads, supports, support_properties)
+    return LimitEquilibriumSlices(
+        width=width,
+        alpha=alpha,
+        weight=np.asarray(slice_data.slice_weight, dtype=np.float64),
+        cohesion=cohesion,
+        tan_phi=tan_phi,
+        pore_pressure=pore_pressure,
+        arm=sign * (xc - middle),
+        radius=np.asarray(radius, dtype=np.float64),
+        seismic_arm=yc - slice_centroid_height(slice_data.yt, yb),
+        seismic=np.asarray(seismic, dtype=np.float64),
+        seismicv=np.asarray(seismicv, dtype=np.float64),
+        **forces
+    )
+
+
+def slice_centroid_height(yt, yb) -> np.ndarray:
+    """
+    Cota aproximada del centro de cada rebanada (promedio de las cuatro
+    esquinas), donde actúa la fuerza sísmica horizontal
+
+    Args:
+        yt, yb: Cotas de la superficie y de la base en los límites, (..., n + 1)
+    """
+    yt, yb = np.asarray(yt, dtype=np.float64), np.asarray(yb, dtype=np.float64)
+    return 0.25 * (yt[..., 1:] + yt[..., :-1] + yb[..., 1:] + yb[..., :-1])
+
+
+def _components(magnitude, angle: float):
+    """Componentes x, y de una fuerza dada por su magnitud y ángulo (grados)"""
+    theta = np.radians(angle)
+    return magnitude * np.cos(theta), magnitude * np.sin(theta)
+
+
+def _right_to_left(direction: str) -> bool:
+    return direction.strip().lower() == 'right to left'
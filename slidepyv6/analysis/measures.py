@@ -0,0 +1,114 @@
+from .spatial import cell_bounds
+import numpy as np
+
+
+def next_positions(cell_offsets: np.ndarray) -> np.ndarray:
+    """
+    Para cada posición de cell_vertices, la posición del vértice siguiente
+    dentro de la misma celda (el último vértice vuelve al primero)
+
+    Args:
+        cell_offsets: Inicio de los vértices de cada celda (CSR), (m + 1,)
+    """
+    nxt = np.arange(1, cell_offsets[-1] + 1, dtype=np.int64)
+    filled = np.diff(cell_offsets) > 0
+    nxt[cell_offsets[1:][filled] - 1] = cell_offsets[:-1][filled]
+    return nxt
+
+
+def _segment_sums(values: np.ndarray, cell_offsets: np.ndarray) -> np.ndarray:
+    """Suma de values por celda (0 para celdas sin vértices)"""
+    sums = np.zeros(len(cell_offsets) - 1)
+    filled = np.diff(cell_offsets) > 0
+    if filled.any():
+        sums[filled] = np.add.reduceat(values, cell_offsets[:-1][filled])
+    return sums
+
+
+def _shoelace_terms(vertices: np.ndarray, cell_offsets: np.ndarray, cell_vertices: np.ndarray):
+    """Coordenadas de cada arista (xi, yi, xj, yj) y su término xi*yj - xj*yi"""
+    vx = np.ascontiguousarray(vertices[:, 0])
+    vy = np.ascontiguousarray(vertices[:, 1])
+    i = cell_vertices
+    j = cell_vertices[next_positions(cell_offsets)]
+    xi, yi, xj, yj = vx[i], vy[i], vx[j], vy[j]
+    return xi, yi, xj, yj, xi * yj - xj * yi
+
+
+def cell_signed_areas(vertices: np.ndarray, cell_offsets: np.ndarray, cell_vertices: np.ndarray) -> np.ndarray:
+    """
+    Área con signo de cada celda (positiva si los vértices están en sentido
+    antihorario), por la fórmula del área de Gauss
+
+    Args:
+        vertices, cell_offsets, cell_vertices: Geometría en formato CSR
+    """
+    *_, cross = _shoelace_terms(vertices, cell_offsets, cell_vertices)
+    return 0.5 * _segment_sums(cross, cell_offsets)
+
+
+def cell_areas(vertices: np.ndarray, cell_offsets: np.ndarray, cell_vertices: np.ndarray) -> np.ndarray:
+    """
+    Área de cada celda
+
+    Args:
+        vertices, cell_offsets, cell_vertices: Geometría en formato CSR
+    """
+    return np.abs(cell_signed_areas(vertices, cell_offsets, cell_vertices))
+
+
+def cell_centroids(vertices: np.ndarray, cell_offsets: np.ndarray, cell_vertices: np.ndarray) -> np.ndarray:
+    """
+    Centroide de cada celda (de su área; para celdas degeneradas, de área
+    nula, el promedio de sus vértices)
+
+    Args:
+        vertices, cell_offsets, cell_vertices: Geometría en formato CSR
+
+    Devuelve:
+        np.ndarray: (m, 2) con x, y del centroide (NaN para celdas sin vértices)
+    """
+    xi, yi, xj, yj, cross = _shoelace_terms(vertices, cell_offsets, cell_vertices)
+    area = 0.5 * _segment_sums(cross, cell_offsets)
+    sizes = np.diff(cell_offsets)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cx = _segment_sums((xi + xj) * cross, cell_offsets) / (6.0 * area)
+        cy = _segment_sums((yi + yj) * cross, cell_offsets) / (6.0 * area)
+        mean_x = _segment_sums(xi, cell_offsets) / sizes
+        mean_y = _segment_sums(yi, cell_offsets) / sizes
+
+    degenerate = ~np.isfinite(cx) | ~np.isfinite(cy) | (area == 0)
+    cx[degenerate] = mean_x[degenerate]
+    cy[degenerate] = mean_y[degenerate]
+    return np.column_stack([cx, cy])
+
+
+def material_totals(values: np.ndarray, cell_material: np.ndarray, num_materials: int) -> np.ndarray:
+    """
+    Suma de un valor por celda (por ejemplo el área) agrupado por código de material
+
+    Args:
+        values: Valor de cada celda, (m,)
+        cell_material: Código del material de cada celda, (m,)
+        num_materials: Número de materiales
+    """
+    return np.bincount(cell_material, weights=values, minlength=num_materials)
+
+
+def polyline_length(vertices: np.ndarray, indices: np.ndarray, closed: bool = False) -> float:
+    """
+    Longitud de una polilínea dada por índices de vértices
+
+    Args:
+        vertices: Coordenadas de los vértices, (n, 2)
+        indices: Índices de los vértices de la polilínea, en orden
+        closed: Si es True se suma también el tramo del último al primer vértice
+    """
+    if len(indices) < 2:
+        return 0.0
+    points = vertices[indices]
+    if closed:
+        points = np.vstack([points, points[:1]])
+    return float(np.hypot(*np.diff(points, axis=0).T).sum())
+
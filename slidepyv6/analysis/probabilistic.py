@@ -0,0 +1,397 @@
+from ..models.properties import MohrCoulombParams, PropertyMaterial
+from ..utils.exceptions import SlideError
+from .limit_equilibrium import LimitEquilibriumSlices, safety_factor
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Iterator
+import numpy as np
+import math
+import os
+
+# Realizaciones por bloque (la memoria de una corrida no depende del total)
+DEFAULT_CHUNK_SIZE = 10000
+
+# Distribuciones disponibles
+DISTRIBUTIONS = ('normal', 'lognormal', 'uniform')
+
+# Parámetros que se pueden muestrear por material
+PARAMETERS = ('cohesion', 'friction_angle', 'unit_weight')
+
+# Probabilidad mínima de que una muestra sin truncar caiga en [minimum, maximum]
+# (con menos, el muestreo por rechazo no es viable)
+MIN_ACCEPTANCE = 1e-4
+
+# Rondas máximas del muestreo por rechazo
+_MAX_ROUNDS = 100
+
+
+@dataclass
+class Distribution:
+    """
+    Clase Distribution con la distribución de un parámetro de un material.
+    Los valores fuera de [minimum, maximum] se vuelven a muestrear
+    (distribución truncada); el intervalo debe tener una probabilidad de al
+    menos MIN_ACCEPTANCE en la distribución sin truncar.
+    Atributos:
+    ----------
+        kind (str): 'normal', 'lognormal' o 'uniform'.
+        mean (float): Media (no se usa en 'uniform').
+        std_dev (float): Desviación estándar (no se usa en 'uniform').
+        minimum (float | None): Mínimo; por defecto mean - 3 std_dev en
+            'normal' y 0 en 'lognormal'.
+        maximum (float | None): Máximo; por defecto mean + 3 std_dev.
+    """
+    kind: str = 'normal'
+    mean: float = 0.0
+    std_dev: float = 0.0
+    minimum: float | None = None
+    maximum: float | None = None
+
+    def bounds(self) -> tuple[float, float]:
+        """Mínimo y máximo de la distribución truncada (valida los parámetros)"""
+        kind = self.kind.strip().lower()
+        if kind not in DISTRIBUTIONS:
+            raise SlideError(f"Distribución no soportada: {self.kind} (disponibles: {', '.join(DISTRIBUTIONS)})")
+        if kind == 'uniform':
+            if self.minimum is None or self.maximum is None:
+                raise SlideError("La distribución uniforme necesita minimum y maximum")
+            lower, upper = float(self.minimum), float(self.maximum)
+        else:
+            if self.std_dev < 0.0:
+                raise SlideError(f"Desviación estándar negativa: {self.std_dev}")
+            if kind == 'lognormal' and self.mean <= 0.0:
+                raise SlideError(f"La distribución lognormal necesita una media positiva: {self.mean}")
+            lower = self.mean - 3.0 * self.std_dev if kind == 'normal' else 0.0
+            upper = self.mean + 3.0 * self.std_dev
+            lower = float(lower if self.minimum is None else self.minimum)
+            upper = float(upper if self.maximum is None else self.maximum)
+        if lower > upper:
+            raise SlideError(f"Distribución con mínimo {lower} mayor que el máximo {upper}")
+        return lower, upper
+
+    def acceptance(self) -> float:
+        """Probabilidad de que una muestra sin truncar caiga en [minimum, maximum]"""
+        lower, upper = self.bounds()
+        kind = self.kind.strip().lower()
+        if kind == 'uniform' or self.std_dev == 0.0:
+            return 1.0
+        if kind == 'normal':
+            mu, sigma = self.mean, self.std_dev
+        else:
+            mu, sigma = self._log_parameters()
+            lower = math.log(lower) if lower > 0.0 else -math.inf
+            upper = math.log(upper) if upper > 0.0 else -math.inf
+        # con erfc la cola superior no pierde precisión
+        return 0.5 * (math.erfc((lower - mu) / (sigma * math.sqrt(2.0)))
+                      - math.erfc((upper - mu) / (sigma * math.sqrt(2.0))))
+
+    def validate(self) -> None:
+        """Verifica los parámetros y que la truncación permita muestrear"""
+        acceptance = self.acceptance()
+        if acceptance < MIN_ACCEPTANCE:
+            lower, upper = self.bounds()
+            raise SlideError(f"El intervalo [{lower}, {upper}] tiene probabilidad {acceptance:.3g} en la "
+                             f"distribución {self.kind} ({self.mean}, {self.std_dev}); no se puede muestrear")
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        """
+        Muestras de la distribución truncada
+
+        Args:
+            rng: Generador de números aleatorios
+            size: Número de muestras
+        """
+        self.validate()
+        kind = self.kind.strip().lower()
+        lower, upper = self.bounds()
+        if kind == 'uniform' or self.std_dev == 0.0:
+            return rng.uniform(lower, upper, size) if kind == 'uniform' else np.full(size, float(self.mean))
+
+        # muestreo por rechazo: en cada ronda se muestrea lo que falta dividido
+        # por la probabilidad de aceptación
+        acceptance = self.acceptance()
+        values = np.empty(size)
+        pending = np.arange(size)
+        for _ in range(_MAX_ROUNDS):
+            if len(pending) == 0:
+                return values
+            draw = self._draw(rng, int(math.ceil(len(pending) / acceptance)) + 16)
+            draw = draw[(draw >= lower) & (draw <= upper)][:len(pending)]
+            values[pending[:len(draw)]] = draw
+            pending = pending[len(draw):]
+        if len(pending) == 0:
+            return values
+        raise SlideError(f"No se pudo muestrear la distribución {self.kind} en [{lower}, {upper}]")
+
+    def _log_parameters(self) -> tuple[float, float]:
+        """Media y desviación de la normal asociada a la lognormal"""
+        sigma2 = math.log1p((self.std_dev / self.mean) ** 2)
+        return math.log(self.mean) - 0.5 * sigma2, math.sqrt(sigma2)
+
+    def _draw(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        if self.kind.strip().lower() == 'normal':
+            return rng.normal(self.mean, self.std_dev, size)
+        return rng.lognormal(*self._log_parameters(), size)
+
+
+@dataclass(eq=False)
+class ProbabilisticSurface:
+    """
+    Clase ProbabilisticSurface con los datos fijos de una superficie crítica
+    para el análisis probabilístico.
+    Atributos:
+    ----------
+        method (str): Método de equilibrio límite.
+        slices (LimitEquilibriumSlices): Rebanadas con los parámetros del proyecto, (n,).
+        base_material (np.ndarray): Número del material de la base (1 = primer material), (n,).
+        weight_fractions (np.ndarray): Fracción del peso de cada rebanada por
+            material (weight_fractions), (n, m).
+    """
+    method: str
+    slices: LimitEquilibriumSlices
+    base_material: np.ndarray
+    weight_fractions: np.ndarray
+
+
+@dataclass(eq=False)
+class MonteCarloStatistics:
+    """
+    Clase MonteCarloStatistics con los estadísticos acumulados del FS de una
+    superficie (se actualizan por bloques sin guardar las realizaciones).
+    Atributos:
+    ----------
+        method (str): Método de equilibrio límite.
+        edges (np.ndarray): Bordes del histograma.
+        histogram (np.ndarray): Realizaciones por intervalo (los FS fuera del
+            rango se cuentan en el primer o en el último intervalo).
+        count (int): Realizaciones con FS válido.
+        invalid (int): Realizaciones sin FS (no convergen o sin momento motor).
+        failures (int): Realizaciones con FS < 1.
+        mean (float): Media del FS.
+        m2 (float): Suma de los cuadrados de las desviaciones respecto de la media.
+        minimum (float): FS mínimo.
+        maximum (float): FS máximo.
+        seed (int | None): Semilla de la corrida (para reproducirla).
+    """
+    method: str
+    edges: np.ndarray
+    histogram: np.ndarray = None
+    count: int = 0
+    invalid: int = 0
+    failures: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    minimum: float = np.inf
+    maximum: float = -np.inf
+    seed: int | None = None
+
+    def __post_init__(self):
+        if self.histogram is None:
+            self.histogram = np.zeros(len(self.edges) - 1, dtype=np.int64)
+
+    @property
+    def probability_of_failure(self) -> float:
+        """Fracción de realizaciones válidas con FS < 1"""
+        return self.failures / self.count if self.count else np.nan
+
+    @property
+    def std_dev(self) -> float:
+        return float(np.sqrt(self.m2 / (self.count - 1))) if self.count > 1 else np.nan
+
+    @property
+    def reliability_index(self) -> float:
+        """Índice de confiabilidad suponiendo FS normal, β = (μ - 1) / σ"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return float(np.divide(self.mean - 1.0, self.std_dev))
+
+    @property
+    def lognormal_reliability_index(self) -> float:
+        """Índice de confiabilidad suponiendo FS lognormal"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sigma2 = np.log1p((self.std_dev / self.mean) ** 2)
+            return float((np.log(self.mean) - 0.5 * sigma2) / np.sqrt(sigma2))
+
+    def update(self, fs: np.ndarray) -> None:
+        """Agrega un bloque de realizaciones"""
+        fs = np.asarray(fs, dtype=np.float64).ravel()
+        valid = fs[np.isfinite(fs)]
+        self.invalid += len(fs) - len(valid)
+        if len(valid) == 0:
+            return
+        other = MonteCarloStatistics(method=self.method, edges=self.edges)
+        other.count = len(valid)
+        other.failures = int(np.count_nonzero(valid < 1.0))
+        other.mean = float(valid.mean())
+        other.m2 = float(np.sum((valid - other.mean) ** 2))
+        other.minimum = float(valid.min())
+        other.maximum = float(valid.max())
+        bins = np.searchsorted(self.edges, valid, side='right') - 1
+        other.histogram = np.bincount(np.clip(bins, 0, len(self.edges) - 2), minlength=len(self.edges) - 1)
+        self.merge(other)
+
+    def merge(self, other: "MonteCarloStatistics") -> None:
+        """Agrega los estadísticos de otro bloque (fórmula de Chan para la varianza)"""
+        self.invalid += other.invalid
+        if other.count == 0:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.failures += other.failures
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        self.histogram = self.histogram + other.histogram
+
+
+@dataclass(eq=False)
+class _MonteCarloContext:
+    """Datos que necesita cada proceso para evaluar un bloque de realizaciones"""
+    surfaces: list[ProbabilisticSurface]
+    materials: list[PropertyMaterial]
+    distributions: dict[str, dict[str, Distribution]]
+    entropy: int
+    edges: np.ndarray
+    tolerance: float
+
+
+# contexto del proceso de trabajo (se envía una sola vez, en el inicializador)
+_CONTEXT: _MonteCarloContext | None = None
+
+
+def _init_worker(context: _MonteCarloContext) -> None:
+    global _CONTEXT
+    _CONTEXT = context
+
+
+def monte_carlo(
+        surfaces: list[ProbabilisticSurface],
+        materials: list[PropertyMaterial],
+        distributions: dict[str, dict[str, Distribution]],
+        realizations: int = 10000,
+        seed: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        workers: int | None = None,
+        fs_range: tuple[float, float] = (0.0, 3.0),
+        bins: int = 60,
+        tolerance: float = 1e-6
+        ) -> Iterator[dict[str, MonteCarloStatistics]]:
+    """
+    Análisis probabilístico de Monte Carlo de las superficies críticas. Las
+    realizaciones se muestrean y evalúan en bloques de chunk_size (como un
+    lote de superficies) y después de cada bloque se entregan los
+    estadísticos acumulados, por lo que la memoria no depende del número de
+    realizaciones.
+
+    Cada bloque usa su propia secuencia aleatoria, derivada de la semilla y
+    del número del bloque: con la misma semilla y el mismo chunk_size los
+    resultados son iguales con cualquier número de procesos. En cada
+    realización todas las superficies usan los mismos parámetros.
+
+    Se pueden muestrear 'cohesion' y 'friction_angle' (grados) de los
+    materiales de Mohr-Coulomb y 'unit_weight' de cualquier material; el
+    peso de cada rebanada cambia según la fracción de su peso que aporta el
+    material (el peso saturado se escala en la misma proporción).
+
+    Args:
+        surfaces: Superficies críticas (una por método)
+        materials: Materiales del proyecto (ProjectProperties.materials)
+        distributions: Distribución de cada parámetro por id de material, por
+            ejemplo {'soil1': {'cohesion': Distribution('normal', 5, 1)}}
+        realizations: Número total de realizaciones
+        seed: Semilla (por defecto una aleatoria, guardada en los resultados)
+        chunk_size: Realizaciones por bloque
+        workers: Número de procesos (None = número de núcleos)
+        fs_range: Rango del histograma de FS
+        bins: Número de intervalos del histograma
+        tolerance: Diferencia máxima de FS entre dos iteraciones
+
+    Devuelve:
+        Iterator[dict[str, MonteCarloStatistics]]: Después de cada bloque,
+            método => estadísticos acumulados (el mismo diccionario se actualiza)
+    """
+    by_id = {material.id: material for material in materials}
+    for material_id, parameters in distributions.items():
+        material = by_id.get(material_id)
+        if material is None:
+            raise SlideError(f"Material no encontrado: {material_id}")
+        for parameter, distribution in parameters.items():
+            if parameter not in PARAMETERS:
+                raise SlideError(f"Parámetro no válido: {parameter} (disponibles: {', '.join(PARAMETERS)})")
+            if parameter != 'unit_weight' and not isinstance(material.material_params, MohrCoulombParams):
+                raise SlideError(f"El material {material_id} no es de Mohr-Coulomb")
+            distribution.validate()
+    if realizations <= 0 or chunk_size <= 0:
+        raise SlideError("realizations y chunk_size deben ser positivos")
+
+    methods = [surface.method for surface in surfaces]
+    if len(set(methods)) != len(methods):
+        raise SlideError("Hay más de una superficie con el mismo método; los estadísticos se guardan por método")
+
+    entropy = np.random.SeedSequence(seed).entropy
+    edges = np.linspace(fs_range[0], fs_range[1], bins + 1)
+    statistics = {
+        surface.method: MonteCarloStatistics(method=surface.method, edges=edges, seed=entropy)
+        for surface in surfaces
+    }
+    context = _MonteCarloContext(surfaces, materials, distributions, entropy, edges, tolerance)
+    tasks = [(index, min(chunk_size, realizations - start))
+             for index, start in enumerate(range(0, realizations, chunk_size))]
+
+    workers = workers or os.cpu_count() or 1
+    executor = None
+    if workers == 1 or len(tasks) == 1:
+        _init_worker(context)
+        chunks = map(_evaluate_chunk, tasks)
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(context,))
+        chunks = executor.map(_evaluate_chunk, tasks)
+    try:
+        for chunk in chunks:
+            for method, values in chunk.items():
+                statistics[method].merge(values)
+            yield statistics
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
+def _evaluate_chunk(task: tuple[int, int]) -> dict[str, MonteCarloStatistics]:
+    """Muestrea y evalúa un bloque de realizaciones en el proceso actual"""
+    index, size = task
+    context = _CONTEXT
+    rng = np.random.default_rng(np.random.SeedSequence(context.entropy, spawn_key=(index,)))
+    number = {material.id: i + 1 for i, material in enumerate(context.materials)}
+    by_id = {material.id: material for material in context.materials}
+
+    # muestras: (material, parámetro) => (size,), en el orden de distributions
+    samples = {
+        (material_id, parameter): distribution.sample(rng, size)
+        for material_id, parameters in context.distributions.items()
+        for parameter, distribution in parameters.items()
+    }
+    # factor del peso unitario de cada material, (size, m)
+    ratio = np.ones((size, len(context.materials)))
+    for (material_id, parameter), values in samples.items():
+        if parameter == 'unit_weight':
+            ratio[:, number[material_id] - 1] = values / by_id[material_id].unit_weight
+
+    chunk = {}
+    for surface in context.surfaces:
+        slices = surface.slices
+        cohesion = np.repeat(np.asarray(slices.cohesion, dtype=np.float64)[None, :], size, axis=0)
+        tan_phi = np.repeat(np.asarray(slices.tan_phi, dtype=np.float64)[None, :], size, axis=0)
+        for (material_id, parameter), values in samples.items():
+            mask = surface.base_material == number[material_id]
+            if parameter == 'cohesion':
+                cohesion[:, mask] = values[:, None]
+            elif parameter == 'friction_angle':
+                tan_phi[:, mask] = np.tan(np.radians(values))[:, None]
+        # las rebanadas sin fracciones (sin peso) no cambian
+        weight = slices.weight * (1.0 + (ratio - 1.0) @ surface.weight_fractions.T)
+        batch = replace(slices, cohesion=cohesion, tan_phi=tan_phi, weight=weight)
+        statistics = MonteCarloStatistics(method=surface.method, edges=context.edges)
+        statistics.update(safety_factor(surface.method, batch, tolerance=context.tolerance).fs)
+        chunk[surface.method] = statistics
+    return chunk
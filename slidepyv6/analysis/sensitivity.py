@@ -0,0 +1,236 @@
+from ..models.properties import GeneralHoekBrownParams, HoekBrownParams, MohrCoulombParams, PropertyMaterial
+from ..utils.exceptions import SlideError
+from .limit_equilibrium import LimitEquilibriumSlices, safety_factor
+from dataclasses import dataclass, fields, replace
+import numpy as np
+
+# Número de combinaciones que se evalúan a la vez (limita la memoria temporal)
+DEFAULT_CHUNK_SIZE = 1 << 13
+
+# Parámetros que se pueden barrer según el modelo de resistencia del material
+_SWEEPABLE = (MohrCoulombParams, HoekBrownParams, GeneralHoekBrownParams)
+
+
+@dataclass(eq=False)
+class StrengthSensitivity:
+    """
+    Clase StrengthSensitivity con el FS de una superficie para todas las
+    combinaciones (producto cartesiano) de los parámetros de resistencia
+    barridos.
+    Atributos:
+    ----------
+        method (str): Método de equilibrio límite.
+        axes (list[tuple[str, str]]): (id del material, parámetro) de cada eje de fs.
+        values (list[np.ndarray]): Valores barridos en cada eje.
+        fs (np.ndarray): FS de cada combinación, forma (len(values[0]), len(values[1]), ...).
+        baseline (float): FS con los parámetros del proyecto.
+        reference (tuple[int, ...]): Índice de cada eje con el valor más
+            cercano al del proyecto.
+    """
+    method: str
+    axes: list[tuple[str, str]]
+    values: list[np.ndarray]
+    fs: np.ndarray
+    baseline: float
+    reference: tuple[int, ...]
+
+    def axis(self, material_id: str, parameter: str) -> int:
+        """Número del eje de fs de un parámetro de un material"""
+        try:
+            return self.axes.index((material_id, parameter))
+        except ValueError:
+            raise SlideError(f"El parámetro {parameter} de {material_id} no fue barrido") from None
+
+    def sweep(self, material_id: str, parameter: str) -> np.ndarray:
+        """
+        FS a lo largo de un eje, con los demás parámetros en su valor de
+        referencia (el más cercano al del proyecto)
+        """
+        axis = self.axis(material_id, parameter)
+        index = list(self.reference)
+        index[axis] = slice(None)
+        return self.fs[tuple(index)]
+
+    def tornado(self) -> dict[tuple[str, str], tuple[float, float]]:
+        """
+        FS mínimo y máximo de cada eje con los demás parámetros en su valor de
+        referencia, ordenados de mayor a menor rango (gráfico de tornado)
+        """
+        bars = {}
+        for material_id, parameter in self.axes:
+            values = self.sweep(material_id, parameter)
+            bars[(material_id, parameter)] = (float(np.nanmin(values)), float(np.nanmax(values)))
+        return dict(sorted(bars.items(), key=lambda item: item[1][0] - item[1][1]))
+
+
+def strength_sensitivity(
+        slices: LimitEquilibriumSlices,
+        base_material: np.ndarray,
+        materials: list[PropertyMaterial],
+        ranges: dict[str, dict[str, np.ndarray]],
+        method: str = 'bishop simplified',
+        sigma3_max: dict[str, float] | None = None,
+        slope_height: float | None = None,
+        tolerance: float = 1e-6,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+        ) -> StrengthSensitivity:
+    """
+    FS de una superficie para el producto cartesiano de los rangos de
+    parámetros de resistencia, evaluando bloques de combinaciones como un
+    lote de superficies (sin un ciclo de Python por combinación).
+
+    Los materiales de Mohr-Coulomb se barren por 'cohesion' y
+    'friction_angle' (grados). Los de Hoek-Brown por 'sigc', 'mb', 's' (y 'a'
+    en el generalizado); en la base se usan la cohesión y el ángulo de
+    fricción equivalentes (hoek_brown_equivalent). Las rebanadas con base en
+    un material no barrido conservan la resistencia de slices, y los ejes de
+    materiales que no están en la base no cambian el FS (se evalúan una sola
+    vez y se repiten).
+
+    Args:
+        slices: Datos de las rebanadas de la superficie, forma (n,)
+        base_material: Número del material de la base de cada rebanada (1 =
+            primer material de materials), (n,)
+        materials: Materiales del proyecto (ProjectProperties.materials)
+        ranges: Valores de cada parámetro por id de material, por ejemplo
+            {'soil1': {'cohesion': np.linspace(2, 8, 50), 'friction_angle': np.linspace(20, 30, 50)}}
+        method: Método de equilibrio límite (METHODS)
+        sigma3_max: Tensión de confinamiento máxima para el ajuste de
+            Hoek-Brown, por id de material (por defecto hoek_brown_sigma3_max)
+        slope_height: Altura del talud para hoek_brown_sigma3_max
+        tolerance: Diferencia máxima de FS entre dos iteraciones
+        chunk_size: Combinaciones por bloque
+
+    Devuelve:
+        StrengthSensitivity: Tensor de FS y valores de cada eje
+    """
+    if np.shape(slices.weight)[:-1] != ():
+        raise SlideError("strength_sensitivity evalúa una sola superficie")
+    by_id = {material.id: material for material in materials}
+    number = {material.id: i + 1 for i, material in enumerate(materials)}
+    base_material = np.asarray(base_material).astype(np.int64)
+    sigma3_max = sigma3_max or {}
+
+    # ejes: (material, parámetro, valores)
+    axes, values, reference = [], [], []
+    for material_id, parameters in ranges.items():
+        material = by_id.get(material_id)
+        if material is None:
+            raise SlideError(f"Material no encontrado: {material_id}")
+        params = material.material_params
+        if not isinstance(params, _SWEEPABLE):
+            raise SlideError(f"El material {material_id} no es de Mohr-Coulomb ni de Hoek-Brown")
+        names = {f.name for f in fields(params)}
+        for parameter, grid in parameters.items():
+            if parameter not in names:
+                raise SlideError(f"Parámetro no válido para {material_id}: {parameter} "
+                                 f"(disponibles: {', '.join(sorted(names))})")
+            grid = np.atleast_1d(np.asarray(grid, dtype=np.float64))
+            if grid.ndim != 1 or len(grid) == 0:
+                raise SlideError(f"El rango de {parameter} de {material_id} debe ser un arreglo 1D no vacío")
+            axes.append((material_id, parameter))
+            values.append(grid)
+            reference.append(int(np.argmin(np.abs(grid - getattr(params, parameter)))))
+    shape = tuple(len(grid) for grid in values)
+
+    # solo los ejes de materiales presentes en la base cambian el FS
+    present = set(base_material.tolist())
+    active = [i for i, (material_id, _) in enumerate(axes) if number[material_id] in present]
+    active_shape = tuple(shape[i] for i in active)
+    total = int(np.prod(active_shape, dtype=np.int64))
+
+    # cohesión y ángulo de fricción de cada material barrido (Hoek-Brown: σ3max fijo)
+    swept = {}
+    for material_id in dict.fromkeys(axes[i][0] for i in active):
+        material = by_id[material_id]
+        params = material.material_params
+        if isinstance(params, MohrCoulombParams):
+            swept[material_id] = None
+            continue
+        limit = sigma3_max.get(material_id)
+        if limit is None:
+            if slope_height is None:
+                raise SlideError(f"Falta sigma3_max o slope_height para el material de Hoek-Brown {material_id}")
+            limit = hoek_brown_sigma3_max(*_hoek_brown(params), material.unit_weight, slope_height)
+        swept[material_id] = float(limit)
+
+    baseline = float(safety_factor(method, slices, tolerance=tolerance).fs)
+    fs = np.empty(total)
+    for start in range(0, total, chunk_size):
+        flat = np.arange(start, min(start + chunk_size, total))
+        index = np.unravel_index(flat, active_shape) if active else ()
+        current = {(axes[i][0], axes[i][1]): values[i][k] for i, k in zip(active, index)}
+        cohesion = np.repeat(np.asarray(slices.cohesion, dtype=np.float64)[None, :], len(flat), axis=0)
+        tan_phi = np.repeat(np.asarray(slices.tan_phi, dtype=np.float64)[None, :], len(flat), axis=0)
+        for material_id, limit in swept.items():
+            c, phi = _material_strength(by_id[material_id].material_params, material_id, current, limit)
+            mask = base_material == number[material_id]
+            cohesion[:, mask] = np.broadcast_to(c, len(flat))[:, None]
+            tan_phi[:, mask] = np.tan(np.radians(np.broadcast_to(phi, len(flat))))[:, None]
+        batch = replace(slices, cohesion=cohesion, tan_phi=tan_phi)
+        fs[flat] = safety_factor(method, batch, tolerance=tolerance).fs
+
+    # los ejes inactivos repiten el FS
+    fs = fs.reshape(active_shape)
+    fs = fs.reshape(tuple(shape[i] if i in active else 1 for i in range(len(shape))))
+    return StrengthSensitivity(
+        method=method,
+        axes=axes,
+        values=values,
+        fs=np.ascontiguousarray(np.broadcast_to(fs, shape)),
+        baseline=baseline,
+        reference=tuple(reference)
+    )
+
+
+def hoek_brown_equivalent(sigc, mb, s, a, sigma3_max) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Cohesión y ángulo de fricción (grados) de Mohr-Coulomb equivalentes al
+    criterio de Hoek-Brown generalizado, ajustados entre σ3 = 0 y sigma3_max
+    (Hoek, Carranza-Torres y Corkum, 2002)
+
+    Args:
+        sigc, mb, s, a: Parámetros de Hoek-Brown (se admiten arreglos)
+        sigma3_max: Tensión de confinamiento máxima del ajuste
+    """
+    sigc, mb, s, a, sigma3_max = np.broadcast_arrays(
+        *(np.asarray(value, dtype=np.float64) for value in (sigc, mb, s, a, sigma3_max))
+    )
+    sigma3n = sigma3_max / sigc
+    power = a * mb * (s + mb * sigma3n) ** (a - 1.0)
+    factor = (1.0 + a) * (2.0 + a)
+    phi = np.arcsin(6.0 * power / (2.0 * factor + 6.0 * power))
+    cohesion = sigc * ((1.0 + 2.0 * a) * s + (1.0 - a) * mb * sigma3n) * (s + mb * sigma3n) ** (a - 1.0) \
+        / (factor * np.sqrt(1.0 + 6.0 * power / factor))
+    return cohesion, np.degrees(phi)
+
+
+def hoek_brown_sigma3_max(sigc, mb, s, a, unit_weight: float, slope_height: float):
+    """
+    Tensión de confinamiento máxima para el ajuste de Hoek-Brown en taludes,
+    σ3max = 0.72 σcm (σcm / γH)^-0.91 (Hoek, Carranza-Torres y Corkum, 2002)
+
+    Args:
+        sigc, mb, s, a: Parámetros de Hoek-Brown
+        unit_weight: Peso unitario del macizo
+        slope_height: Altura del talud
+    """
+    strength = sigc * (mb + 4.0 * s - a * (mb - 8.0 * s)) * (mb / 4.0 + s) ** (a - 1.0) \
+        / (2.0 * (1.0 + a) * (2.0 + a))
+    return 0.72 * strength * (strength / (unit_weight * slope_height)) ** -0.91
+
+
+def _hoek_brown(params) -> tuple[float, float, float, float]:
+    """sigc, mb, s, a de los parámetros de Hoek-Brown (a = 0.5 en el original)"""
+    return params.sigc, params.mb, params.s, getattr(params, 'a', 0.5)
+
+
+def _material_strength(params, material_id, current, sigma3_max):
+    """Cohesión y ángulo de fricción del material para el bloque de combinaciones"""
+    def value(name):
+        return current.get((material_id, name), getattr(params, name))
+
+    if isinstance(params, MohrCoulombParams):
+        return value('cohesion'), value('friction_angle')
+    a = value('a') if isinstance(params, GeneralHoekBrownParams) else 0.5
+    return hoek_brown_equivalent(value('sigc'), value('mb'), value('s'), a, sigma3_max)
@@ -0,0 +1,317 @@
+from ..models.geometries import ProjectGeometry
+from ..models.loads import ProjectLoads
+from ..models.properties import ProjectProperties
+from ..models.results import SliceArrays
+from .intersections import _area_under_polyline, intersect_circles
+from .limit_equilibrium import LimitEquilibriumSlices, external_forces, slice_centroid_height
+from dataclasses import dataclass
+import numpy as np
+
+# Peso unitario del agua por sistema de unidades (ProjectMetadata.units)
+WATER_UNIT_WEIGHT = {'metric': 9.81, 'imperial': 62.4}
+
+# Número de círculos que se discretizan a la vez (limita la memoria temporal)
+_CIRCLE_CHUNK = 1 << 12
+
+
+@dataclass(eq=False)
+class CircleSlices:
+    """
+    Clase CircleSlices con las rebanadas de N superficies circulares, todas
+    con el mismo número de rebanadas n. Los círculos que no cortan la
+    pendiente tienen todos sus valores en NaN (ancho y peso 0).
+    Atributos:
+    ----------
+        xc (np.ndarray): Coordenada x del centro, (N,).
+        yc (np.ndarray): Coordenada y del centro, (N,).
+        radius (np.ndarray): Radio, (N,).
+        x (np.ndarray): Límites de las rebanadas, (N, n + 1).
+        yt (np.ndarray): Cota de la superficie en los límites, (N, n + 1).
+        yb (np.ndarray): Cota de la base (el círculo) en los límites, (N, n + 1).
+        width (np.ndarray): Ancho de cada rebanada, (N, n).
+        alpha (np.ndarray): Inclinación de la base (rad), positiva si la base
+            baja en el sentido de la falla, (N, n).
+        weight (np.ndarray): Peso de cada rebanada, (N, n).
+        base_material (np.ndarray): Número del material en el centro de la
+            base (1 = primer material de ProjectProperties.materials, 0 fuera
+            de la geometría), (N, n).
+        pore_pressure (np.ndarray): Presión de poros en el centro de la base, (N, n).
+        forces (dict[str, np.ndarray]): Cargas y soportes (external_forces):
+            load, horizontal, load_moment, passive_moment y passive_force.
+        direction (str): Sentido de la falla.
+    """
+    xc: np.ndarray
+    yc: np.ndarray
+    radius: np.ndarray
+    x: np.ndarray
+    yt: np.ndarray
+    yb: np.ndarray
+    width: np.ndarray
+    alpha: np.ndarray
+    weight: np.ndarray
+    base_material: np.ndarray
+    pore_pressure: np.ndarray
+    forces: dict[str, np.ndarray]
+    direction: str = 'left to right'
+
+    def __len__(self) -> int:
+        return len(self.xc)
+
+    @property
+    def num_slices(self) -> int:
+        return self.width.shape[1]
+
+    @property
+    def valid(self) -> np.ndarray:
+        """True para los círculos que cortan la pendiente"""
+        return ~np.isnan(self.x[:, 0])
+
+    def to_limit_equilibrium(
+            self,
+            cohesion: np.ndarray,
+            tan_phi: np.ndarray,
+            seismic: float = 0.0,
+            seismicv: float = 0.0
+            ) -> LimitEquilibriumSlices:
+        """
+        Datos de equilibrio límite de todas las superficies
+
+        Args:
+            cohesion, tan_phi: Parámetros por material, en el orden de
+                ProjectProperties.materials (strength_arrays)
+            seismic, seismicv: Coeficientes sísmicos horizontal y vertical
+        """
+        # el número 0 (fuera de la geometría) toma NaN
+        cohesion = np.r_[np.nan, cohesion][self.base_material]
+        tan_phi = np.r_[np.nan, tan_phi][self.base_material]
+        sign = -1.0 if self.direction.strip().lower() == 'right to left' else 1.0
+        middle = 0.5 * (self.x[:, 1:] + self.x[:, :-1])
+        return LimitEquilibriumSlices(
+            width=self.width,
+            alpha=self.alpha,
+            weight=self.weight,
+            cohesion=cohesion,
+            tan_phi=tan_phi,
+            pore_pressure=self.pore_pressure,
+            arm=sign * (self.xc[:, None] - middle),
+            radius=self.radius,
+            seismic_arm=self.yc[:, None] - slice_centroid_height(self.yt, self.yb),
+            seismic=np.full(len(self), float(seismic)),
+            seismicv=np.full(len(self), float(seismicv)),
+            **self.forces
+        )
+
+    def slice_arrays(self, index: int) -> SliceArrays:
+        """
+        Rebanadas de una superficie con el formato de las leídas del .s01
+        (solo los campos geométricos, de peso, material y presión de poros)
+
+        Args:
+            index: Índice de la superficie
+        """
+        return SliceArrays(
+            x=self.x[index].copy(),
+            yt=self.yt[index].copy(),
+            yb=self.yb[index].copy(),
+            slice_weight=self.weight[index].copy(),
+            pore_pressure=self.pore_pressure[index].copy(),
+            base_material=self.base_material[index].astype(np.float64),
+        )
+
+
+def slice_circles(
+        geometry: ProjectGeometry,
+        properties: ProjectProperties,
+        xc,
+        yc,
+        radius,
+        num_slices: int = 25,
+        loads: ProjectLoads | None = None,
+        supports: bool = True,
+        direction: str = 'left to right',
+        water_unit_weight: float = WATER_UNIT_WEIGHT['metric'],
+        samples: int = 16
+        ) -> CircleSlices:
+    """
+    Discretiza N superficies circulares en rebanadas de igual ancho entre la
+    entrada y la salida del círculo en la pendiente, con operaciones de NumPy
+    sobre todos los círculos a la vez.
+
+    La base de cada rebanada es la cuerda del círculo y la cara superior la
+    pendiente. El peso es el área exacta de la rebanada por el peso unitario
+    medio de `samples` puntos en la vertical del centro de la rebanada (el
+    peso saturado se usa bajo el nivel freático cuando el material lo tiene;
+    si todos los materiales pesan lo mismo solo se consulta la base).
+    La presión de poros es γw por la altura del nivel freático sobre el centro
+    de la base.
+
+    Args:
+        geometry: Geometría del proyecto
+        properties: Propiedades del proyecto (peso unitario de los materiales)
+        xc, yc, radius: Centro y radio de cada círculo, (N,)
+        num_slices: Número de rebanadas por superficie
+        loads: Cargas externas del proyecto
+        supports: Si es True se consideran los soportes de la geometría
+        direction: Sentido de la falla (ProjectMetadata.direction)
+        water_unit_weight: Peso unitario del agua
+        samples: Puntos por rebanada para promediar el peso unitario
+    """
+    xc, yc, radius = (np.atleast_1d(np.asarray(value, dtype=np.float64)) for value in (xc, yc, radius))
+    arrays = geometry.arrays
+    surface = _increasing(arrays.vertices[arrays.slope])
+    water = _increasing(arrays.vertices[arrays.water_table]) if len(arrays.water_table) >= 2 else None
+
+    gamma, gamma_sat, material_number = _unit_weights(geometry, properties)
+
+    num = len(xc)
+    shape = (num, num_slices)
+    result = {
+        'x': np.full((num, num_slices + 1), np.nan),
+        'yt': np.full((num, num_slices + 1), np.nan),
+        'yb': np.full((num, num_slices + 1), np.nan),
+        'width': np.zeros(shape),
+        'alpha': np.full(shape, np.nan),
+        'weight': np.zeros(shape),
+        'base_material': np.zeros(shape, dtype=np.int64),
+        'pore_pressure': np.full(shape, np.nan),
+    }
+    cut = intersect_circles(xc, yc, radius, surface, direction)
+    rows = np.flatnonzero(cut.valid)
+    for start in range(0, len(rows), _CIRCLE_CHUNK):
+        chunk = rows[start:start + _CIRCLE_CHUNK]
+        values = _slice_chunk(
+            geometry, surface, water, xc[chunk], yc[chunk], radius[chunk],
+            cut.x1[chunk], cut.x2[chunk], num_slices, direction,
+            gamma, gamma_sat, material_number, water_unit_weight, samples
+        )
+        for name, value in values.items():
+            result[name][chunk] = value
+
+    forces = external_forces(
+        np.nan_to_num(result['x']), xc, yc, radius, direction, loads,
+        geometry.supports if supports else None, properties.supports
+    )
+    for name, value in forces.items():
+        forces[name] = np.where(cut.valid.reshape(cut.valid.shape + (1,) * (value.ndim - 1)), value, 0.0)
+    return CircleSlices(
+        xc=xc, yc=yc, radius=radius,
+        forces=forces,
+        direction=direction,
+        **result
+    )
+
+
+def _slice_chunk(geometry, surface, water, xc, yc, radius, x1, x2, num_slices, direction,
+                 gamma, gamma_sat, material_number, water_unit_weight, samples) -> dict[str, np.ndarray]:
+    num = len(xc)
+    x = x1[:, None] + (x2 - x1)[:, None] * np.linspace(0.0, 1.0, num_slices + 1)
+    yb = yc[:, None] - np.sqrt(np.maximum(radius[:, None] ** 2 - (x - xc[:, None]) ** 2, 0.0))
+    yt = np.interp(x, surface[:, 0], surface[:, 1])
+    width = np.diff(x, axis=1)
+    sign = -1.0 if direction.strip().lower() == 'right to left' else 1.0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        alpha = np.arctan(-sign * np.diff(yb, axis=1) / width)
+
+    # área exacta: integral de la pendiente menos el trapecio bajo la cuerda
+    top = np.diff(_area_under_polyline(surface, x.ravel()).reshape(x.shape), axis=1)
+    area = np.maximum(top - 0.5 * width * (yb[:, 1:] + yb[:, :-1]), 0.0)
+
+    # peso unitario medio en la vertical del centro de cada rebanada
+    middle = 0.5 * (x[:, 1:] + x[:, :-1])
+    base = 0.5 * (yb[:, 1:] + yb[:, :-1])
+    crest = np.interp(middle, surface[:, 0], surface[:, 1])
+    fraction = (np.arange(samples) + 0.5) / samples
+    uniform = len(gamma) > 1 and np.unique(np.r_[gamma[:-1], gamma_sat[:-1]]).size == 1
+    if uniform:
+        # mismo peso unitario en todos los materiales: basta el punto de la base
+        fraction = fraction[:1]
+    ys = base[..., None] + (crest - base)[..., None] * fraction
+    xs = np.broadcast_to(middle[..., None], ys.shape)
+    codes = geometry.material_code_at(xs.ravel(), ys.ravel()).reshape(ys.shape)
+    if water is not None:
+        water_level = np.interp(middle, water[:, 0], water[:, 1])
+        unit_weight = np.where(ys < water_level[..., None], gamma_sat[codes], gamma[codes])
+        pore_pressure = water_unit_weight * np.maximum(water_level - base, 0.0)
+    else:
+        unit_weight = gamma[codes]
+        pore_pressure = np.zeros((num, num_slices))
+    if uniform:
+        unit_weight = np.full(ys.shape, gamma[0])
+
+    # material de la base: el punto más bajo de la vertical
+    return {
+        'x': x,
+        'yt': yt,
+        'yb': yb,
+        'width': width,
+        'alpha': alpha,
+        'weight': area * unit_weight.mean(axis=-1),
+        'base_material': material_number[codes[..., 0]],
+        'pore_pressure': pore_pressure,
+    }
+
+
+def weight_fractions(
+        geometry: ProjectGeometry,
+        properties: ProjectProperties,
+        x: np.ndarray,
+        yt: np.ndarray,
+        yb: np.ndarray,
+        samples: int = 16
+        ) -> np.ndarray:
+    """
+    Fracción del peso de cada rebanada que aporta cada material, con el
+    mismo muestreo en la vertical del centro de la rebanada que slice_circles
+    (peso saturado bajo el nivel freático)
+
+    Args:
+        geometry: Geometría del proyecto
+        properties: Propiedades del proyecto
+        x, yt, yb: Límites de las rebanadas y cotas de la superficie y de la base, (..., n + 1)
+        samples: Puntos por rebanada
+
+    Devuelve:
+        np.ndarray: Fracciones (..., n, m), en el orden de ProjectProperties.materials
+            (suman 1 en las rebanadas con peso)
+    """
+    x, yt, yb = (np.asarray(value, dtype=np.float64) for value in (x, yt, yb))
+    gamma, gamma_sat, material_number = _unit_weights(geometry, properties)
+    arrays = geometry.arrays
+    middle = 0.5 * (x[..., 1:] + x[..., :-1])
+    base = 0.5 * (yb[..., 1:] + yb[..., :-1])
+    crest = 0.5 * (yt[..., 1:] + yt[..., :-1])
+    ys = base[..., None] + (crest - base)[..., None] * ((np.arange(samples) + 0.5) / samples)
+    xs = np.broadcast_to(middle[..., None], ys.shape)
+    codes = geometry.material_code_at(xs.ravel(), ys.ravel()).reshape(ys.shape)
+    unit_weight = gamma[codes]
+    if len(arrays.water_table) >= 2:
+        water = _increasing(arrays.vertices[arrays.water_table])
+        water_level = np.interp(middle, water[:, 0], water[:, 1])
+        unit_weight = np.where(ys < water_level[..., None], gamma_sat[codes], unit_weight)
+    unit_weight = np.nan_to_num(unit_weight)
+
+    numbers = material_number[codes]
+    fractions = np.stack([
+        np.sum(np.where(numbers == k + 1, unit_weight, 0.0), axis=-1) for k in range(len(properties.materials))
+    ], axis=-1)
+    total = fractions.sum(axis=-1, keepdims=True)
+    return np.divide(fractions, total, out=np.zeros_like(fractions), where=total > 0)
+
+
+def _unit_weights(geometry: ProjectGeometry, properties: ProjectProperties):
+    """Peso unitario (seco y saturado) y número de material por código de la geometría (-1 = fuera)"""
+    arrays = geometry.arrays
+    by_id = {material.id: material for material in properties.materials}
+    number = {material.id: i + 1 for i, material in enumerate(properties.materials)}
+    material_number = np.array([number.get(m, 0) for m in arrays.materials] + [0], dtype=np.int64)
+    gamma = np.array([by_id[m].unit_weight if m in by_id else np.nan for m in arrays.materials] + [0.0])
+    gamma_sat = np.array([
+        by_id[m].satured_unit_weight if m in by_id and by_id[m].satured_unit_weight else gamma[i]
+        for i, m in enumerate(arrays.materials)
+    ] + [0.0])
+    return gamma, gamma_sat, material_number
+
+
+def _increasing(polyline: np.ndarray) -> np.ndarray:
+    """Polilínea ordenada con x creciente (para np.interp)"""
+    return polyline[::-1] if polyline[0, 0] > polyline[-1, 0] else polyline
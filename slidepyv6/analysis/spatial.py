@@ -0,0 +1,217 @@
+import numpy as np
+
+# Número de puntos que se consultan a la vez (limita la memoria temporal)
+_QUERY_CHUNK = 1 << 18
+
+
+def cell_bounds(vertices: np.ndarray, cell_offsets: np.ndarray, cell_vertices: np.ndarray) -> np.ndarray:
+    """
+    Caja envolvente de cada celda
+
+    Args:
+        vertices: Coordenadas de los vértices, (n, 2)
+        cell_offsets: Inicio de los vértices de cada celda (CSR), (m + 1,)
+        cell_vertices: Índices de los vértices de las celdas (CSR)
+
+    Devuelve:
+        np.ndarray: (m, 4) con xmin, ymin, xmax, ymax (NaN para celdas sin vértices)
+    """
+    num_cells = len(cell_offsets) - 1
+    bounds = np.full((num_cells, 4), np.nan)
+    filled = np.diff(cell_offsets) > 0
+    if not filled.any():
+        return bounds
+
+    xs = np.ascontiguousarray(vertices[:, 0])[cell_vertices]
+    ys = np.ascontiguousarray(vertices[:, 1])[cell_vertices]
+    starts = cell_offsets[:-1][filled]
+    bounds[filled, 0] = np.minimum.reduceat(xs, starts)
+    bounds[filled, 1] = np.minimum.reduceat(ys, starts)
+    bounds[filled, 2] = np.maximum.reduceat(xs, starts)
+    bounds[filled, 3] = np.maximum.reduceat(ys, starts)
+    return bounds
+
+
+def points_in_cells(
+        xs: np.ndarray,
+        ys: np.ndarray,
+        cells: np.ndarray,
+        vertices: np.ndarray,
+        cell_offsets: np.ndarray,
+        cell_vertices: np.ndarray
+        ) -> np.ndarray:
+    """
+    Prueba punto en polígono (regla par-impar) para pares (punto, celda),
+    evaluando todas las aristas de todos los pares a la vez
+
+    Args:
+        xs, ys: Coordenadas de cada punto, (p,)
+        cells: Celda de cada par, (p,)
+        vertices, cell_offsets, cell_vertices: Geometría en formato CSR
+
+    Devuelve:
+        np.ndarray: (p,) True si el punto está dentro de su celda
+    """
+    num_pairs = len(cells)
+    if num_pairs == 0:
+        return np.zeros(0, dtype=bool)
+
+    # se indexa por columnas: es bastante más rápido que indexar filas de (n, 2)
+    vx = np.ascontiguousarray(vertices[:, 0])
+    vy = np.ascontiguousarray(vertices[:, 1])
+    sizes = np.diff(cell_offsets)
+
+    if len(sizes) and sizes.min() == sizes.max():
+        # todas las celdas con el mismo número de vértices (por ejemplo, triángulos)
+        k = int(sizes[0])
+        first = cells * k
+        corners = [cell_vertices[first + a] for a in range(k)]
+        inside = np.zeros(num_pairs, dtype=bool)
+        for a in range(k):
+            i, j = corners[a], corners[(a + 1) % k]
+            inside ^= _crosses(xs, ys, vx[i], vy[i], vx[j], vy[j])
+        return inside
+
+    starts = cell_offsets[cells]
+    sizes = sizes[cells]
+    edge_pair = np.repeat(np.arange(num_pairs), sizes)
+    first_edge = np.cumsum(sizes) - sizes
+    k = np.arange(len(edge_pair)) - np.repeat(first_edge, sizes)
+
+    edge_start = starts[edge_pair]
+    i = cell_vertices[edge_start + k]
+    j = cell_vertices[edge_start + (k + 1) % sizes[edge_pair]]
+    crosses = _crosses(xs[edge_pair], ys[edge_pair], vx[i], vy[i], vx[j], vy[j])
+
+    count = np.bincount(edge_pair[crosses], minlength=num_pairs)
+    return (count & 1).astype(bool)
+
+
+def _crosses(px, py, xi, yi, xj, yj) -> np.ndarray:
+    """La arista (xi, yi)-(xj, yj) cruza la semirrecta horizontal a la derecha del punto"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return ((yi > py) != (yj > py)) & (px < (xj - xi) * (py - yi) / (yj - yi) + xi)
+
+
+class CellGrid:
+    def __init__(
+            self,
+            vertices: np.ndarray,
+            cell_offsets: np.ndarray,
+            cell_vertices: np.ndarray,
+            cells_per_bin: float = 1.0
+            ):
+        """
+        Índice espacial de celdas sobre una grilla uniforme.
+
+        Cada celda se registra en todas las casillas que toca su caja
+        envolvente; las casillas se guardan en formato CSR (bin_offsets,
+        bin_cells). Una consulta solo prueba las celdas de la casilla de cada
+        punto, por lo que el costo no depende del número total de celdas.
+
+        Args:
+            vertices: Coordenadas de los vértices, (n, 2)
+            cell_offsets: Inicio de los vértices de cada celda (CSR), (m + 1,)
+            cell_vertices: Índices de los vértices de las celdas (CSR)
+            cells_per_bin: Número medio de celdas por casilla
+        """
+        self.vertices = np.asarray(vertices, dtype=np.float64)
+        self.cell_offsets = np.asarray(cell_offsets, dtype=np.int64)
+        self.cell_vertices = np.asarray(cell_vertices, dtype=np.int64)
+        self.bounds = cell_bounds(self.vertices, self.cell_offsets, self.cell_vertices)
+        self._bound_columns = tuple(np.ascontiguousarray(column) for column in self.bounds.T)
+
+        num_cells = len(self.bounds)
+        valid = ~np.isnan(self.bounds[:, 0])
+        if valid.any():
+            x0, y0 = self.bounds[valid, 0].min(), self.bounds[valid, 1].min()
+            x1, y1 = self.bounds[valid, 2].max(), self.bounds[valid, 3].max()
+        else:
+            x0 = y0 = 0.0
+            x1 = y1 = 1.0
+        width = max(x1 - x0, 1e-12)
+        height = max(y1 - y0, 1e-12)
+
+        # casillas aproximadamente cuadradas
+        num_bins = max(1.0, valid.sum() / cells_per_bin)
+        self.nx = max(1, int(np.ceil(np.sqrt(num_bins * width / height))))
+        self.ny = max(1, int(np.ceil(num_bins / self.nx)))
+        self.origin = (x0, y0)
+        self.size = (width / self.nx, height / self.ny)
+
+        # pares (celda, casilla) para las casillas que toca cada celda
+        cells = np.flatnonzero(valid)
+        ix0, iy0 = self._bin_coords(self.bounds[cells, 0], self.bounds[cells, 1])
+        ix1, iy1 = self._bin_coords(self.bounds[cells, 2], self.bounds[cells, 3])
+        wide = ix1 - ix0 + 1
+        counts = wide * (iy1 - iy0 + 1)
+        pair_cell = np.repeat(np.arange(len(cells)), counts)
+        local = np.arange(len(pair_cell)) - np.repeat(np.cumsum(counts) - counts, counts)
+        bins = (iy0[pair_cell] + local // wide[pair_cell]) * self.nx + ix0[pair_cell] + local % wide[pair_cell]
+
+        order = np.argsort(bins, kind='stable')
+        self.bin_cells = cells[pair_cell[order]]
+        self.bin_offsets = np.zeros(self.nx * self.ny + 1, dtype=np.int64)
+        np.cumsum(np.bincount(bins, minlength=self.nx * self.ny), out=self.bin_offsets[1:])
+        self.num_cells = num_cells
+
+    def _bin_coords(self, xs: np.ndarray, ys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Columna y fila de la casilla de cada punto (recortadas a la grilla)"""
+        ix = np.floor((xs - self.origin[0]) / self.size[0]).astype(np.int64)
+        iy = np.floor((ys - self.origin[1]) / self.size[1]).astype(np.int64)
+        return np.clip(ix, 0, self.nx - 1), np.clip(iy, 0, self.ny - 1)
+
+    def locate(self, xs, ys) -> np.ndarray:
+        """
+        Celda que contiene cada punto
+
+        Args:
+            xs, ys: Coordenadas de los puntos (escalares o arreglos)
+
+        Devuelve:
+            np.ndarray: Índice de la celda de cada punto, -1 si está fuera de
+                la geometría. Si un punto está en el borde entre dos celdas
+                se devuelve una de ellas
+        """
+        xs, ys = np.broadcast_arrays(np.asarray(xs, dtype=np.float64), np.asarray(ys, dtype=np.float64))
+        shape = xs.shape
+        xs, ys = xs.ravel(), ys.ravel()
+        result = np.full(len(xs), -1, dtype=np.int64)
+
+        for start in range(0, len(xs), _QUERY_CHUNK):
+            chunk = slice(start, start + _QUERY_CHUNK)
+            result[chunk] = self._locate_chunk(xs[chunk], ys[chunk])
+        return result.reshape(shape)
+
+    def _locate_chunk(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        result = np.full(len(xs), -1, dtype=np.int64)
+        x0, y0 = self.origin
+        inside = (
+            (xs >= x0) & (xs <= x0 + self.size[0] * self.nx) &
+            (ys >= y0) & (ys <= y0 + self.size[1] * self.ny)
+        )
+        points = np.flatnonzero(inside)
+        if len(points) == 0:
+            return result
+
+        ix, iy = self._bin_coords(xs[points], ys[points])
+        bins = iy * self.nx + ix
+        starts = self.bin_offsets[bins]
+        counts = self.bin_offsets[bins + 1] - starts
+
+        # pares (punto, celda candidata)
+        pair_point = np.repeat(points, counts)
+        local = np.arange(len(pair_point)) - np.repeat(np.cumsum(counts) - counts, counts)
+        pair_cell = self.bin_cells[np.repeat(starts, counts) + local]
+
+        # descarta primero por caja envolvente
+        px, py = xs[pair_point], ys[pair_point]
+        xmin, ymin, xmax, ymax = self._bound_columns
+        near = ((px >= xmin[pair_cell]) & (px <= xmax[pair_cell]) &
+                (py >= ymin[pair_cell]) & (py <= ymax[pair_cell]))
+        pair_point, pair_cell = pair_point[near], pair_cell[near]
+
+        hit = points_in_cells(xs[pair_point], ys[pair_point], pair_cell,
+                              self.vertices, self.cell_offsets, self.cell_vertices)
+        result[pair_point[hit]] = pair_cell[hit]
+        return result
@@ -0,0 +1,322 @@
+from ..utils.exceptions import SlideError
+from .measures import next_positions, cell_signed_areas
+from dataclasses import dataclass, field
+import numpy as np
+
+
+@dataclass(eq=False)
+class TopologyReport:
+    """
+    Clase TopologyReport con los problemas encontrados al validar la malla.
+    Atributos:
+    ----------
+        unclosed_cells (np.ndarray): Celdas que no forman un polígono cerrado
+            (menos de 3 vértices distintos o vértices consecutivos repetidos).
+        degenerate_cells (np.ndarray): Celdas de área nula.
+        invalid_references (np.ndarray): Celdas que usan índices de vértices inexistentes.
+        duplicate_vertices (np.ndarray): Pares (i, j) de vértices distintos con las mismas coordenadas.
+        orphan_vertices (np.ndarray): Vértices que no pertenecen a ninguna celda ni a otra lista de vértices.
+        non_manifold_edges (np.ndarray): Aristas (i, j) compartidas por más de dos celdas.
+        inconsistent_edges (np.ndarray): Aristas (i, j) recorridas en el mismo sentido por las dos celdas que las comparten.
+    """
+    unclosed_cells: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    degenerate_cells: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    invalid_references: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    duplicate_vertices: np.ndarray = field(default_factory=lambda: np.empty((0, 2), dtype=np.int64))
+    orphan_vertices: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    non_manifold_edges: np.ndarray = field(default_factory=lambda: np.empty((0, 2), dtype=np.int64))
+    inconsistent_edges: np.ndarray = field(default_factory=lambda: np.empty((0, 2), dtype=np.int64))
+
+    @property
+    def ok(self) -> bool:
+        """True si no se encontró ningún problema"""
+        return all(len(getattr(self, name)) == 0 for name in self.__dataclass_fields__)
+
+    def summary(self) -> dict[str, int]:
+        """Número de problemas de cada tipo"""
+        return {name: len(getattr(self, name)) for name in self.__dataclass_fields__}
+
+
+class MeshTopology:
+    def __init__(
+            self,
+            num_vertices: int,
+            cell_offsets: np.ndarray,
+            cell_vertices: np.ndarray,
+            cell_material: np.ndarray | None = None
+            ):
+        """
+        Estructura de semiaristas (half-edge) de la malla de celdas.
+
+        Cada posición p de cell_vertices es una semiarista que va del vértice
+        cell_vertices[p] al siguiente de su celda. Las semiaristas gemelas
+        (la misma arista recorrida por la celda vecina) se encuentran
+        ordenando una clave por arista, sin comparar listas de vértices.
+
+        Atributos:
+        ----------
+            origin (np.ndarray): Vértice de origen de cada semiarista.
+            target (np.ndarray): Vértice de destino de cada semiarista.
+            cell (np.ndarray): Celda de cada semiarista.
+            next (np.ndarray): Semiarista siguiente dentro de la celda.
+            twin (np.ndarray): Semiarista gemela en la celda vecina, -1 en el borde.
+
+        Args:
+            num_vertices: Número de vértices de la geometría
+            cell_offsets: Inicio de los vértices de cada celda (CSR), (m + 1,)
+            cell_vertices: Índices de los vértices de las celdas (CSR)
+            cell_material: Código del material de cada celda (opcional)
+        """
+        self.num_vertices = num_vertices
+        self.cell_offsets = np.asarray(cell_offsets, dtype=np.int64)
+        self.cell_material = None if cell_material is None else np.asarray(cell_material)
+        self.num_cells = len(self.cell_offsets) - 1
+
+        self.next = next_positions(self.cell_offsets)
+        self.origin = np.asarray(cell_vertices, dtype=np.int64)
+        self.target = self.origin[self.next]
+        self.cell = np.repeat(np.arange(self.num_cells), np.diff(self.cell_offsets))
+
+        # clave de la arista sin orientación: (menor, mayor)
+        low = np.minimum(self.origin, self.target)
+        high = np.maximum(self.origin, self.target)
+        keys = low * max(num_vertices, 1) + high
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+
+        # grupos de semiaristas con la misma arista
+        starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+        counts = np.diff(np.r_[starts, len(keys)])
+        self._edge_counts = np.zeros(len(keys), dtype=np.int64)
+        self._edge_counts[order] = np.repeat(counts, counts)
+
+        self.twin = np.full(len(keys), -1, dtype=np.int64)
+        pairs = starts[counts == 2]
+        first, second = order[pairs], order[pairs + 1]
+        self.twin[first] = second
+        self.twin[second] = first
+
+    # Vecindad  -------------------------------------------------
+    def half_edges(self, cell: int) -> np.ndarray:
+        """Semiaristas de la celda, en orden"""
+        return np.arange(self.cell_offsets[cell], self.cell_offsets[cell + 1])
+
+    def neighbors(self, cell: int) -> np.ndarray:
+        """Celdas que comparten una arista con la celda (en el orden de sus aristas)"""
+        twins = self.twin[self.cell_offsets[cell]:self.cell_offsets[cell + 1]]
+        return self.cell[twins[twins >= 0]]
+
+    def adjacency(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Pares de celdas vecinas (a, b) con a < b, una vez por arista compartida
+        """
+        inner = np.flatnonzero(self.twin > np.arange(len(self.twin)))
+        a, b = self.cell[inner], self.cell[self.twin[inner]]
+        return np.minimum(a, b), np.maximum(a, b)
+
+    def boundary_edges(self) -> np.ndarray:
+        """Aristas (origen, destino) del borde de la malla, (k, 2)"""
+        border = self.twin < 0
+        return np.column_stack([self.origin[border], self.target[border]])
+
+    # Fronteras de material  -------------------------------------------------
+    def material_boundary_edges(self, include_exterior: bool = True) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Aristas entre celdas de distinto material
+
+        Args:
+            include_exterior: Si es True se incluyen las aristas del borde de
+                la malla (con material -1 hacia afuera)
+
+        Devuelve:
+            tuple: (aristas (k, 2), material de un lado (k,), material del otro lado (k,))
+        """
+        if self.cell_material is None:
+            raise SlideError("La topología se construyó sin materiales")
+
+        index = np.arange(len(self.twin))
+        inner = (self.twin > index)
+        inner[inner] &= self.cell_material[self.cell[inner]] != self.cell_material[self.cell[self.twin[inner]]]
+        selected = np.flatnonzero(inner | ((self.twin < 0) & include_exterior))
+
+        side_a = self.cell_material[self.cell[selected]]
+        twins = self.twin[selected]
+        side_b = np.where(twins >= 0, self.cell_material[self.cell[np.maximum(twins, 0)]], -1)
+        edges = np.column_stack([self.origin[selected], self.target[selected]])
+        return edges, side_a, side_b
+
+    def material_boundaries(self, include_exterior: bool = False) -> dict[tuple[int, int], list[np.ndarray]]:
+        """
+        Polilíneas de las fronteras entre materiales
+
+        Args:
+            include_exterior: Si es True se incluye el borde de la malla (material -1)
+
+        Devuelve:
+            dict: (material menor, material mayor) => lista de polilíneas, cada
+                una un arreglo de índices de vértices
+        """
+        edges, side_a, side_b = self.material_boundary_edges(include_exterior)
+        low, high = np.minimum(side_a, side_b), np.maximum(side_a, side_b)
+
+        boundaries = {}
+        for key in sorted(set(zip(low.tolist(), high.tolist()))):
+            selected = (low == key[0]) & (high == key[1])
+            boundaries[key] = chain_edges(edges[selected])
+        return boundaries
+
+    # Conectividad  -------------------------------------------------
+    def regions(self, by_material: bool = False) -> np.ndarray:
+        """
+        Etiqueta de región conexa de cada celda (0, 1, ...), uniendo celdas
+        que comparten una arista
+
+        Args:
+            by_material: Si es True solo se unen celdas del mismo material
+        """
+        a, b = self.adjacency()
+        if by_material:
+            if self.cell_material is None:
+                raise SlideError("La topología se construyó sin materiales")
+            same = self.cell_material[a] == self.cell_material[b]
+            a, b = a[same], b[same]
+        return connected_components(self.num_cells, a, b)
+
+    def is_connected(self) -> bool:
+        """True si todas las celdas forman una única región"""
+        return self.num_cells == 0 or self.regions().max() == 0
+
+    # Validación  -------------------------------------------------
+    def validate(self, vertices: np.ndarray, tolerance: float = 1e-9,
+                 referenced: np.ndarray | None = None) -> TopologyReport:
+        """
+        Busca celdas abiertas o degeneradas, vértices duplicados o huérfanos y
+        aristas mal compartidas
+
+        Args:
+            vertices: Coordenadas de los vértices, (n, 2)
+            tolerance: Distancia bajo la cual dos vértices se consideran iguales
+            referenced: Vértices usados fuera de las celdas (por ejemplo el
+                nivel freático), que no se consideran huérfanos
+        """
+        sizes = np.diff(self.cell_offsets)
+
+        # referencias a vértices inexistentes
+        bad = (self.origin < 0) | (self.origin >= len(vertices))
+        invalid = np.unique(self.cell[bad])
+        origin = np.where(bad, 0, self.origin)
+        target = np.where(bad[self.next], 0, self.target)
+
+        # celdas abiertas: aristas de longitud nula o menos de 3 vértices distintos
+        repeated = np.bincount(self.cell[origin == target], minlength=self.num_cells) > 0
+        order = np.lexsort((origin, self.cell))
+        same = np.r_[False, (self.cell[order][1:] == self.cell[order][:-1]) & (origin[order][1:] == origin[order][:-1])]
+        distinct = sizes - np.bincount(self.cell[order][same], minlength=self.num_cells)
+        unclosed = np.flatnonzero(repeated | (distinct < 3))
+
+        safe = np.where(bad, 0, self.origin)
+        areas = cell_signed_areas(vertices, self.cell_offsets, safe)
+        degenerate = np.setdiff1d(np.flatnonzero(np.abs(areas) <= tolerance), np.r_[unclosed, invalid])
+
+        # vértices repetidos (mismas coordenadas redondeadas a la tolerancia)
+        grid = np.round(np.asarray(vertices) / max(tolerance, 1e-300)).astype(np.int64) if len(vertices) else np.empty((0, 2), dtype=np.int64)
+        _, first, inverse = np.unique(grid, axis=0, return_index=True, return_inverse=True)
+        inverse = inverse.ravel()
+        repeated_vertices = np.flatnonzero(first[inverse] != np.arange(len(vertices)))
+        duplicates = np.column_stack([first[inverse[repeated_vertices]], repeated_vertices])
+
+        used = np.zeros(len(vertices), dtype=bool)
+        used[safe] = True
+        if referenced is not None:
+            referenced = np.asarray(referenced, dtype=np.int64)
+            used[referenced[(referenced >= 0) & (referenced < len(vertices))]] = True
+        orphans = np.flatnonzero(~used)
+
+        # aristas compartidas por más de dos celdas o con la misma orientación
+        many = self._edge_counts > 2
+        edges = np.unique(np.column_stack([np.minimum(self.origin, self.target)[many],
+                                           np.maximum(self.origin, self.target)[many]]), axis=0)
+        index = np.arange(len(self.twin))
+        paired = self.twin > index
+        same_way = paired.copy()
+        same_way[paired] = self.origin[paired] == self.origin[self.twin[paired]]
+        inconsistent = np.column_stack([self.origin[same_way], self.target[same_way]])
+
+        return TopologyReport(
+            unclosed_cells=unclosed,
+            degenerate_cells=degenerate,
+            invalid_references=invalid,
+            duplicate_vertices=duplicates,
+            orphan_vertices=orphans,
+            non_manifold_edges=edges.reshape(-1, 2),
+            inconsistent_edges=inconsistent
+        )
+
+
+def connected_components(num_nodes: int, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Componentes conexas de un grafo dado por sus aristas (a, b), por
+    enganche de raíces y compresión de caminos vectorizados
+
+    Devuelve:
+        np.ndarray: Etiqueta (0, 1, ...) de cada nodo, en orden de aparición
+    """
+    parent = np.arange(num_nodes)
+    while True:
+        root_a, root_b = parent[a], parent[b]
+        differ = root_a != root_b
+        if not differ.any():
+            break
+        low = np.minimum(root_a[differ], root_b[differ])
+        high = np.maximum(root_a[differ], root_b[differ])
+        np.minimum.at(parent, high, low)
+        # compresión: cada nodo apunta directamente a su raíz
+        while True:
+            grand = parent[parent]
+            if np.array_equal(grand, parent):
+                break
+            parent = grand
+
+    _, labels = np.unique(parent, return_inverse=True)
+    return labels.ravel()
+
+
+def chain_edges(edges: np.ndarray) -> list[np.ndarray]:
+    """
+    Une aristas (i, j) en polilíneas de índices de vértices. Las cadenas se
+    cortan en los vértices donde se juntan más de dos aristas; una cadena
+    cerrada repite el primer vértice al final
+    """
+    adjacency = {}
+    for e, (i, j) in enumerate(edges.tolist()):
+        adjacency.setdefault(i, []).append(e)
+        adjacency.setdefault(j, []).append(e)
+
+    used = np.zeros(len(edges), dtype=bool)
+    edge_list = edges.tolist()
+
+    def walk(start_vertex, start_edge):
+        chain = [start_vertex]
+        vertex, edge = start_vertex, start_edge
+        while edge is not None:
+            used[edge] = True
+            i, j = edge_list[edge]
+            vertex = j if i == vertex else i
+            chain.append(vertex)
+            candidates = adjacency[vertex]
+            edge = None
+            if len(candidates) == 2:
+                edge = next((c for c in candidates if not used[c]), None)
+        return np.array(chain, dtype=np.int64)
+
+    # primero desde los extremos y las uniones, luego los ciclos
+    chains = []
+    for vertex, incident in adjacency.items():
+        if len(incident) != 2:
+            for edge in incident:
+                if not used[edge]:
+                    chains.append(walk(vertex, edge))
+    for edge in range(len(edge_list)):
+        if not used[edge]:
+            chains.append(walk(edge_list[edge][0], edge))
+    return chains
@@ -0,0 +1,148 @@
+#  imports
+from .core import SlideProject
+from .io.cache import ParseCache
+from .models.metadata import ProjectMetadata
+from .utils.exceptions import SlideError
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+import logging
+
+# logging
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchSummary:
+    """
+    Clase BatchSummary con el resumen compacto de un proyecto que devuelve
+    load_many por defecto (sin las secciones completas).
+    Atributos:
+    ----------
+        metadata (ProjectMetadata): Metadata del proyecto.
+        has_results (bool): Indica si el proyecto tiene resultados.
+        min_fs (dict[str, float]): FS del mínimo global de cada método.
+    """
+    metadata: ProjectMetadata
+    has_results: bool
+    min_fs: dict[str, float]
+
+
+def summarize(project: SlideProject) -> BatchSummary:
+    """Resumen compacto de un proyecto: metadata y FS mínimo de cada método"""
+    has_results = project.has_results()
+    minimums = project.results.index.minimums if has_results else {}
+    return BatchSummary(
+        metadata=project.metadata,
+        has_results=has_results,
+        min_fs={method: float(minimum.surface.fs) for method, minimum in minimums.items()}
+    )
+
+
+@dataclass
+class BatchResult:
+    """
+    Clase BatchResult que representa el resultado de cargar un proyecto en un lote.
+    Atributos:
+    ----------
+        path (Path): Ruta al archivo .slim.
+        value (Any): Valor devuelto por extract (por defecto un BatchSummary),
+            o las secciones serializadas del proyecto (bytes) con full=True.
+        error (SlideError | None): Error al cargar el proyecto (SlideFileError,
+            SlideParsingError, ...), None si se cargó correctamente.
+    """
+    path: Path
+    value: Any = None
+    error: SlideError | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def project(self) -> SlideProject:
+        """
+        Reconstruye el SlideProject a partir de las secciones serializadas
+        (solo si el lote se cargó con full=True)
+        """
+        if self.error is not None:
+            raise self.error
+        if not isinstance(self.value, bytes):
+            raise SlideError("El resultado no contiene el proyecto serializado (cargar con full=True)")
+        return SlideProject.from_payload(self.path, self.value)
+
+
+def _load_one(
+        path: Path,
+        extract: Callable[[SlideProject], Any] | None,
+        backend: str,
+        cache: ParseCache | str | Path | None
+        ) -> BatchResult:
+    """
+    Carga un proyecto en el proceso de trabajo; los errores se devuelven, no
+    se lanzan. Sin extract devuelve las secciones serializadas
+    """
+    try:
+        # en modo perezoso los errores de parseo se reportan como SlideParsingError
+        project = SlideProject(path, backend=backend, lazy=True, cache=cache)
+        if extract is None:
+            return BatchResult(path=path, value=project.to_payload())
+        return BatchResult(path=path, value=extract(project))
+    except SlideError as e:
+        return BatchResult(path=path, error=e)
+    except Exception as e:
+        return BatchResult(path=path, error=SlideError(f"Error procesando {path}: {e}"))
+
+
+def load_many(
+        paths: Iterable[str | Path],
+        workers: int | None = None,
+        extract: Callable[[SlideProject], Any] | None = None,
+        backend: str = 'memory',
+        cache: ParseCache | str | Path | None = None,
+        full: bool = False
+        ) -> Iterator[BatchResult]:
+    """
+    Carga varios proyectos .slim en paralelo (un proceso por núcleo) y
+    devuelve los resultados a medida que terminan, no en el orden de paths.
+
+    Un error en un proyecto no detiene el lote: se devuelve en BatchResult.error.
+
+    Args:
+        paths: Rutas a los archivos .slim
+        workers: Número de procesos (por defecto el número de núcleos)
+        extract: Función que recibe el SlideProject y devuelve solo lo
+            necesario (por ejemplo el FS mínimo). Debe poder serializarse con
+            pickle, es decir, definirse a nivel de módulo. Por defecto
+            summarize (metadata y FS mínimo de cada método)
+        backend: Forma de leer el .slim, 'memory' (por defecto) o 'tempdir'
+        cache: Caché en disco compartido por los procesos (ParseCache o ruta)
+        full: Si es True cada resultado contiene las secciones serializadas
+            del proyecto (BatchResult.project lo reconstruye); se ignora
+            extract. Cada proceso serializa todas las secciones y el proceso
+            principal las deserializa, por lo que es mucho más costoso
+
+    Devuelve:
+        Iterator[BatchResult]: Un resultado por proyecto
+    """
+    paths = [Path(path) for path in paths]
+    if not paths:
+        return
+    extract = None if full else (extract or summarize)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(_load_one, path, extract, backend, cache): path
+            for path in paths
+        }
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                yield future.result()
+            except BrokenProcessPool as e:
+                yield BatchResult(path=path, error=SlideError(f"El proceso de trabajo terminó inesperadamente: {e}"))
+            except Exception as e:
+                # por ejemplo, un valor de extract que no se puede serializar
+                logger.error(f"Error en el lote con {path}: {e}")
+                yield BatchResult(path=path, error=SlideError(f"Error procesando {path}: {e}"))
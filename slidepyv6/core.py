@@ -1,12 +1,24 @@
 #  imports
 from .io.io import SlideProjectIO
 from .utils.exceptions import SlideError
-from .models.metadata import ProjectMetadata
+from .models.metadata import ProjectMetadata, ProjectSummary
 from .models.properties import ProjectProperties
 from .models.geometries import ProjectGeometry
 from .models.loads import ProjectLoads
-from .models.results import ProjectResults
+from .models.results import ProjectResults, Surface
+from .models.properties import MohrCoulombParams
+from .io.cache import ParseCache
+from .analysis.grid_search import grid_search
+from .analysis.back_analysis import BackAnalysis, back_analysis
+from .analysis.probabilistic import Distribution, MonteCarloStatistics, ProbabilisticSurface, monte_carlo
+from .analysis.sensitivity import StrengthSensitivity, strength_sensitivity
+from .analysis.slicing import WATER_UNIT_WEIGHT, CircleSlices, slice_circles, weight_fractions
+from .analysis.limit_equilibrium import (
+    METHODS, SafetyFactors, critical_seismic_coefficient, safety_factor, slices_from_slice_data, strength_arrays
+)
 from pathlib import Path
+from typing import Iterator
+import numpy as np
 import logging
 
 # logging
@@ -14,15 +26,55 @@ logger = logging.getLogger(__name__)
 
 class SlideProject:
     
-    def __init__(self, project_path: str):
+    def __init__(
+            self,
+            project_path: str,
+            backend: str = 'memory',
+            lazy: bool = False,
+            cache: ParseCache | str | Path | None = None
+            ):
         """
         Clase principal que representa un proyecto de Slide V6
         
         Args:
             project_path: Ruta al archivo .slim original
+            backend: Forma de leer el .slim, 'memory' (por defecto) o 'tempdir'
+            lazy: Si es True cada sección se parsea al accederla por primera vez
+            cache: Caché en disco (ParseCache o ruta a su directorio); los
+                proyectos que ya están en el caché no se vuelven a parsear
         """
         logger.debug("Inicializando proyecto: %s", project_path)
-        self._io = SlideProjectIO(Path(project_path))
+        self._io = SlideProjectIO(Path(project_path), backend=backend, lazy=lazy, cache=cache)
+
+    @staticmethod
+    def peek(project_path: str) -> ProjectSummary:
+        """
+        Resumen rápido del proyecto (metadata, si tiene resultados y tamaño de
+        sus archivos) sin parsear el proyecto completo. Puede usarse desde
+        varios hilos a la vez
+
+        Args:
+            project_path: Ruta al archivo .slim
+        """
+        return SlideProjectIO.peek(Path(project_path))
+
+    @classmethod
+    def from_payload(cls, project_path: str, payload: bytes) -> 'SlideProject':
+        """
+        Crea el proyecto a partir de las secciones serializadas con to_payload,
+        sin volver a leer ni parsear el .slim
+
+        Args:
+            project_path: Ruta al archivo .slim original
+            payload: Secciones serializadas
+        """
+        project = cls.__new__(cls)
+        project._io = SlideProjectIO.from_payload(Path(project_path), payload)
+        return project
+
+    def to_payload(self) -> bytes:
+        """Serializa todas las secciones del proyecto en un bloque de bytes compacto"""
+        return self._io.to_payload()
 
 
     def __del__(self):
@@ -66,24 +118,41 @@ class SlideProject:
 
     # Métodos  ---------------------------------------------------------
 
+    # Recorre las superficies sin construir la lista completa
+    def iter_surfaces(self, method: str | None = None, fs_max: float | None = None) -> Iterator[Surface]:
+        """
+        Recorre las superficies una a una. Con lazy=True y los resultados aún
+        sin parsear, se leen directamente de los bloques del .s01 a medida
+        que se descomprimen (la memoria no depende del número de superficies);
+        si no, se recorre la tabla de resultados (ProjectResults.iter_surfaces)
+
+        Args:
+            method: Nombre del método (por defecto todos)
+            fs_max: Si se indica, solo las superficies con 0 < FS <= fs_max
+                (se omiten los códigos de error)
+        """
+        if not self._io.get_has_results():
+            raise SlideError("El proyecto no tiene resultados")
+        return self._io.iter_surfaces(method, fs_max)
+
     # Obtiene el FS mínimo de todos los métodos
     def get_min_safety_factor(self) -> float:
         """Obtiene el FS mínimo de todos los métodos"""
         if not self._io.get_has_results():
             raise SlideError("El proyecto no tiene resultados")
-        return min(min.surface.fs for min in self._io.results.global_minimums)
+        critical = self._io.results.index.critical()
+        if critical is None:
+            raise SlideError("El proyecto no tiene mínimos globales")
+        return critical.surface.fs
 
     # Obtiene la superficie crítica con menor FS
     def get_critical_surface(self) -> dict:
         """Obtiene la superficie crítica con menor FS"""
         if not self._io.get_has_results():
             raise SlideError("El proyecto no tiene resultados")
-        
-        min_fs = self.get_min_safety_factor()
-        critical = next(
-            (m for m in self._io.results.global_minimums if m.surface.fs == min_fs), 
-            None
-        )
+        critical = self._io.results.index.critical()
+        if critical is None:
+            raise SlideError("El proyecto no tiene mínimos globales")
         surface_critical = critical.surface
         return {
             "center": (surface_critical.point_center.x, surface_critical.point_center.y),
@@ -92,6 +161,366 @@ class SlideProject:
             "method": surface_critical.method
         }
 
+    # Recalcula el FS de los mínimos globales con otros parámetros
+    def evaluate_safety_factors(
+            self,
+            strength: dict[str, MohrCoulombParams] | None = None,
+            pore_pressure: float | None = None,
+            include_loads: bool = True,
+            tolerance: float = 1e-6
+            ) -> dict[str, SafetyFactors]:
+        """
+        Recalcula el FS de la superficie de cada mínimo global con Bishop o
+        Janbu simplificado a partir de sus rebanadas, sin ejecutar Slide
+
+        Args:
+            strength: Parámetros de Mohr-Coulomb que reemplazan a los del
+                proyecto, por id de material (por ejemplo {'soil1': MohrCoulombParams(8, 25)})
+            pore_pressure: Presión de poros en la base de todas las rebanadas
+                (por defecto la calculada por Slide)
+            include_loads: Si es True se consideran las cargas y los soportes del proyecto
+            tolerance: Diferencia máxima de FS entre dos iteraciones
+
+        Devuelve:
+            dict[str, SafetyFactors]: método => resultado (solo los métodos soportados)
+        """
+        if not self._io.get_has_results():
+            raise SlideError("El proyecto no tiene resultados")
+        table = None
+        if strength:
+            table = strength_arrays(self.properties.materials, overrides=strength)
+        loads = self.loads if include_loads else None
+        supports = self.geometry.supports if include_loads else None
+
+        factors = {}
+        for minimum in self._io.results.global_minimums:
+            surface = minimum.surface
+            if surface.method not in METHODS or minimum.slice_data is None:
+                continue
+            slices = slices_from_slice_data(
+                minimum.slice_data,
+                surface.point_center.x,
+                surface.point_center.y,
+                surface.radius,
+                direction=self.metadata.direction,
+                strength=table,
+                pore_pressure=pore_pressure,
+                loads=loads,
+                supports=supports,
+                support_properties=self.properties.supports,
+                seismic=self.metadata.seismic,
+                seismicv=self.metadata.seismicv
+            )
+            factors[surface.method] = safety_factor(surface.method, slices, tolerance=tolerance)
+        return factors
+
+    # Sensibilidad del FS a los parámetros de resistencia
+    def strength_sensitivity(
+            self,
+            ranges: dict[str, dict[str, np.ndarray]],
+            methods: tuple[str, ...] | None = None,
+            sigma3_max: dict[str, float] | None = None,
+            include_loads: bool = True,
+            tolerance: float = 1e-6
+            ) -> dict[str, StrengthSensitivity]:
+        """
+        FS de la superficie de cada mínimo global para todas las combinaciones
+        de los rangos de parámetros de resistencia (strength_sensitivity)
+
+        Args:
+            ranges: Valores de cada parámetro por id de material, por ejemplo
+                {'soil1': {'cohesion': np.linspace(2, 8, 50)}}
+            methods: Métodos a evaluar (por defecto todos los soportados)
+            sigma3_max: Tensión de confinamiento máxima de los materiales de
+                Hoek-Brown (por defecto según la altura del talud)
+            include_loads: Si es True se consideran las cargas y los soportes del proyecto
+            tolerance: Diferencia máxima de FS entre dos iteraciones
+
+        Devuelve:
+            dict[str, StrengthSensitivity]: método => tensor de FS
+        """
+        slope = self.geometry.arrays.vertices[self.geometry.arrays.slope, 1]
+        sensitivity = {}
+        for minimum, slices in self._critical_slices(methods, include_loads):
+            sensitivity[minimum.surface.method] = strength_sensitivity(
+                slices,
+                minimum.slice_data.base_material,
+                self.properties.materials,
+                ranges,
+                method=minimum.surface.method,
+                sigma3_max=sigma3_max,
+                slope_height=float(slope.max() - slope.min()),
+                tolerance=tolerance
+            )
+        return sensitivity
+
+    # Análisis probabilístico de Monte Carlo
+    def monte_carlo(
+            self,
+            distributions: dict[str, dict[str, Distribution]],
+            realizations: int = 10000,
+            seed: int | None = None,
+            chunk_size: int = 10000,
+            workers: int | None = None,
+            methods: tuple[str, ...] | None = None,
+            include_loads: bool = True,
+            fs_range: tuple[float, float] = (0.0, 3.0),
+            bins: int = 60
+            ) -> Iterator[dict[str, MonteCarloStatistics]]:
+        """
+        Análisis de Monte Carlo de la superficie de cada mínimo global: entrega
+        la probabilidad de falla, el índice de confiabilidad y el histograma
+        de FS acumulados después de cada bloque de realizaciones (monte_carlo)
+
+        Args:
+            distributions: Distribución de cada parámetro por id de material, por
+                ejemplo {'soil1': {'cohesion': Distribution('normal', 5, 1)}}
+            realizations: Número total de realizaciones
+            seed: Semilla (por defecto una aleatoria, guardada en los resultados)
+            chunk_size: Realizaciones por bloque
+            workers: Número de procesos (por defecto el número de núcleos)
+            methods: Métodos a evaluar (por defecto todos los soportados)
+            include_loads: Si es True se consideran las cargas y los soportes del proyecto
+            fs_range: Rango del histograma de FS
+            bins: Número de intervalos del histograma
+        """
+        surfaces = [
+            ProbabilisticSurface(
+                method=minimum.surface.method,
+                slices=slices,
+                base_material=np.asarray(minimum.slice_data.base_material).astype(np.int64),
+                weight_fractions=weight_fractions(
+                    self.geometry, self.properties,
+                    minimum.slice_data.x, minimum.slice_data.yt, minimum.slice_data.yb
+                )
+            )
+            for minimum, slices in self._critical_slices(methods, include_loads)
+        ]
+        return monte_carlo(
+            surfaces,
+            self.properties.materials,
+            distributions,
+            realizations=realizations,
+            seed=seed,
+            chunk_size=chunk_size,
+            workers=workers,
+            fs_range=fs_range,
+            bins=bins
+        )
+
+    # Coeficiente sísmico crítico (aceleración de fluencia)
+    def critical_seismic_coefficients(
+            self,
+            surfaces: str = 'minimums',
+            results: ProjectResults | None = None,
+            vertical_ratio: float | None = None,
+            num_slices: int = 25,
+            include_loads: bool = True
+            ) -> dict[str, np.ndarray]:
+        """
+        Coeficiente sísmico horizontal kc con el que FS = 1, por método
+        (critical_seismic_coefficient)
+
+        Args:
+            surfaces: 'minimums' para la superficie de cada mínimo global (con
+                sus rebanadas) o 'all' para todas las superficies de la tabla
+                (discretizadas con slice_circles)
+            results: Resultados a usar (por defecto los del proyecto; por
+                ejemplo los de grid_search)
+            vertical_ratio: Cociente entre los coeficientes vertical y horizontal
+                (por defecto seismicv / seismic del proyecto, o 0)
+            num_slices: Número de rebanadas por superficie con surfaces='all'
+            include_loads: Si es True se consideran las cargas y los soportes del proyecto
+
+        Devuelve:
+            dict[str, np.ndarray]: método => kc (un valor por mínimo global o
+                uno por fila de la tabla de superficies, NaN en las superficies
+                no válidas)
+        """
+        if vertical_ratio is None:
+            seismic = self.metadata.seismic
+            vertical_ratio = self.metadata.seismicv / seismic if seismic else 0.0
+
+        if surfaces == 'minimums':
+            return {
+                minimum.surface.method: critical_seismic_coefficient(minimum.surface.method, slices, vertical_ratio)
+                for minimum, slices in self._critical_slices(None, include_loads, results)
+            }
+        if surfaces != 'all':
+            raise SlideError(f"surfaces debe ser 'minimums' o 'all', no {surfaces!r}")
+
+        if results is None:
+            if not self._io.get_has_results():
+                raise SlideError("El proyecto no tiene resultados")
+            results = self._io.results
+        table = results.surface_table
+        slices = slice_circles(
+            self.geometry,
+            self.properties,
+            table.xc, table.yc, table.radius,
+            num_slices=num_slices,
+            loads=self.loads if include_loads else None,
+            supports=include_loads,
+            direction=self.metadata.direction,
+            water_unit_weight=self._water_unit_weight()
+        )
+        data = slices.to_limit_equilibrium(*strength_arrays(self.properties.materials))
+        coefficients = {}
+        for column, method in enumerate(table.methods):
+            if method in METHODS:
+                kc = critical_seismic_coefficient(method, data, vertical_ratio)
+                coefficients[method] = np.where(table.fs[:, column] > 0, kc, np.nan)
+        return coefficients
+
+    # Retroanálisis de la resistencia con FS = 1
+    def back_analysis(
+            self,
+            material_id: str,
+            friction_angles=None,
+            surfaces: tuple | None = None,
+            method: str = 'bishop simplified',
+            num_slices: int = 25,
+            include_loads: bool = True
+            ) -> BackAnalysis:
+        """
+        Curva c–φ de un material de Mohr-Coulomb que lleva el FS a 1 en la
+        superficie observada (back_analysis)
+
+        Args:
+            material_id: Id del material a retroanalizar
+            friction_angles: Ángulos de fricción de la curva (grados), por
+                defecto de 0 a 45 cada 0.5
+            surfaces: Círculos candidatos (xc, yc, radius), discretizados con
+                slice_circles; por defecto la superficie del mínimo global del método
+            method: Método de equilibrio límite
+            num_slices: Número de rebanadas de los círculos candidatos
+            include_loads: Si es True se consideran las cargas y los soportes del proyecto
+
+        Devuelve:
+            BackAnalysis: Cohesión con FS = 1 por ángulo (y por círculo candidato)
+        """
+        if friction_angles is None:
+            friction_angles = np.linspace(0.0, 45.0, 91)
+        if surfaces is None:
+            critical = list(self._critical_slices((method,), include_loads))
+            if not critical:
+                raise SlideError(f"No hay un mínimo global con rebanadas para el método {method}")
+            minimum, data = critical[0]
+            base_material = minimum.slice_data.base_material
+        else:
+            xc, yc, radius = surfaces
+            slices = slice_circles(
+                self.geometry,
+                self.properties,
+                xc, yc, radius,
+                num_slices=num_slices,
+                loads=self.loads if include_loads else None,
+                supports=include_loads,
+                direction=self.metadata.direction,
+                water_unit_weight=self._water_unit_weight()
+            )
+            data = slices.to_limit_equilibrium(
+                *strength_arrays(self.properties.materials),
+                seismic=self.metadata.seismic,
+                seismicv=self.metadata.seismicv
+            )
+            base_material = slices.base_material
+        return back_analysis(data, base_material, self.properties.materials, material_id, friction_angles, method)
+
+    def _critical_slices(
+            self,
+            methods: tuple[str, ...] | None,
+            include_loads: bool,
+            results: ProjectResults | None = None):
+        """Mínimos globales de los métodos soportados y sus datos de equilibrio límite"""
+        if results is None:
+            if not self._io.get_has_results():
+                raise SlideError("El proyecto no tiene resultados")
+            results = self._io.results
+        for minimum in results.global_minimums:
+            surface = minimum.surface
+            if surface.method not in METHODS or minimum.slice_data is None:
+                continue
+            if methods is not None and surface.method not in methods:
+                continue
+            yield minimum, slices_from_slice_data(
+                minimum.slice_data,
+                surface.point_center.x,
+                surface.point_center.y,
+                surface.radius,
+                direction=self.metadata.direction,
+                loads=self.loads if include_loads else None,
+                supports=self.geometry.supports if include_loads else None,
+                support_properties=self.properties.supports,
+                seismic=self.metadata.seismic,
+                seismicv=self.metadata.seismicv
+            )
+
+    # Discretiza superficies circulares en rebanadas
+    def slice_circles(self, xc, yc, radius, num_slices: int = 25) -> CircleSlices:
+        """
+        Rebanadas de N superficies circulares a partir de la geometría, los
+        materiales, el nivel freático, las cargas y los soportes del proyecto
+
+        Args:
+            xc, yc, radius: Centro y radio de cada círculo
+            num_slices: Número de rebanadas por superficie
+        """
+        return slice_circles(
+            self.geometry,
+            self.properties,
+            xc, yc, radius,
+            num_slices=num_slices,
+            loads=self.loads,
+            direction=self.metadata.direction,
+            water_unit_weight=self._water_unit_weight()
+        )
+
+    # Búsqueda en grilla de superficies circulares
+    def grid_search(
+            self,
+            grid: tuple[int, int] = (20, 20),
+            radius_increments: int = 10,
+            num_slices: int = 25,
+            methods: tuple[str, ...] = ('bishop simplified', 'janbu simplified'),
+            strength: dict[str, MohrCoulombParams] | None = None,
+            workers: int | None = None
+            ) -> ProjectResults:
+        """
+        Búsqueda en grilla de superficies circulares con los datos actuales del
+        proyecto (sin ejecutar Slide), repartida entre varios procesos
+
+        Args:
+            grid: Número de centros en x y en y sobre los límites de la pendiente
+            radius_increments: Número de radios por centro
+            num_slices: Número de rebanadas por superficie
+            methods: Métodos a evaluar
+            strength: Parámetros de Mohr-Coulomb que reemplazan a los del proyecto, por id de material
+            workers: Número de procesos (por defecto el número de núcleos)
+
+        Devuelve:
+            ProjectResults: Superficies evaluadas y mínimo global de cada método
+        """
+        return grid_search(
+            self.geometry,
+            self.properties,
+            loads=self.loads,
+            direction=self.metadata.direction,
+            grid=grid,
+            radius_increments=radius_increments,
+            num_slices=num_slices,
+            methods=methods,
+            strength=strength,
+            workers=workers,
+            water_unit_weight=self._water_unit_weight(),
+            seismic=self.metadata.seismic,
+            seismicv=self.metadata.seismicv
+        )
+
+    def _water_unit_weight(self) -> float:
+        """Peso unitario del agua según las unidades del proyecto"""
+        return WATER_UNIT_WEIGHT.get(self.metadata.units.strip().lower(), WATER_UNIT_WEIGHT['metric'])
+
     # verifica si el proyecto ha sido ejecutado (tiene o no reusltados)
     def has_results(self) -> bool:
         """Verifica si el proyecto ha sido ejecutado"""
@@ -0,0 +1,375 @@
+from ..utils.exceptions import SlideFileError, SlideTempDirectoryError
+from pathlib import Path, PurePosixPath
+from typing import TextIO, Union
+import zipfile
+import io
+import re
+import struct
+import tempfile
+import shutil
+import logging
+
+logger = logging.getLogger(__name__)
+
+#-------------------------------------------
+# los archivos de un .slim sin analisis son:
+# .sli: Configuración principal *
+# .slv: Slide View Options File *
+#-------------------------------------------
+# los archivos de un .slim con analisis son:
+# .emf: parece un archivo binario
+# .s01: Resultados
+# .sli: Configuración principal *
+# .sltm: Slide Tools File
+# .slv: Slide View Options File *
+# .slvi: Slide Interpret View States Filee *
+#-------------------------------------------
+# los archivos con * son los mismos para ambos
+# tipos de proyectos
+#-------------------------------------------
+REQUIRED_FILES = {
+    '.sli',  # requerido (escritura)
+    '.s01'   # requerido (lectura)
+}
+
+FILE_TYPES = {
+    'input': '.sli',
+    'output': '.s01'
+}
+
+
+def _suffix_for(type_file: str) -> str:
+    """Traduce el tipo de archivo (input/output) a su extensión"""
+    if type_file not in FILE_TYPES:
+        raise SlideFileError(f"Tipo de archivo inválido: {type_file}")
+    return FILE_TYPES[type_file]
+
+
+def _decode(data: bytes) -> Union[str, bytes]:
+    """
+    Decodifica el contenido como UTF-8, devolviendo bytes si no es posible.
+    Los saltos de línea se normalizan igual que en Path.read_text
+    """
+    try:
+        # Asumimos que los archivos de texto usan UTF-8
+        return data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+    except UnicodeDecodeError:
+        # Fallback para archivos binarios como .emf
+        return data
+
+
+def scan_members(zip_ref: zipfile.ZipFile) -> dict[str, zipfile.ZipInfo]:
+    """
+    Miembros del zip por extensión, leídos solo del directorio central
+    (si hay varios con la misma extensión se toma el primero)
+    """
+    infos = {}
+    for info in zip_ref.infolist():
+        if info.is_dir():
+            continue
+        infos.setdefault(PurePosixPath(info.filename).suffix, info)
+    return infos
+
+
+def read_member_head(zip_ref: zipfile.ZipFile, info: zipfile.ZipInfo, end: re.Pattern,
+                     chunk_size: int = 4096) -> bytes:
+    """
+    Descomprime el inicio de un miembro del zip, por bloques, hasta encontrar
+    el patrón end. Devuelve el contenido hasta el final del patrón (o el
+    miembro completo si el patrón no aparece)
+
+    Args:
+        zip_ref: Archivo zip abierto
+        info: Miembro a leer
+        end: Patrón (bytes) que marca dónde dejar de leer
+        chunk_size: Tamaño de cada bloque descomprimido
+    """
+    data = bytearray()
+    with zip_ref.open(info) as member:
+        while True:
+            chunk = member.read(chunk_size)
+            if not chunk:
+                return bytes(data)
+            data += chunk
+            match = end.search(data)
+            if match:
+                return bytes(data[:match.end()])
+
+
+def pack_members(path: Path, infos: list[zipfile.ZipInfo]) -> bytes:
+    """
+    Arma un zip en memoria con algunos miembros de otro, copiando sus datos
+    comprimidos tal cual (sin descomprimir ni volver a comprimir)
+
+    Args:
+        path: Ruta al zip original
+        infos: Miembros a copiar
+    """
+    records = bytearray()
+    directory = bytearray()
+    with open(path, 'rb') as file:
+        for info in infos:
+            # encabezado local: firma, ..., largo del nombre y del campo extra
+            file.seek(info.header_offset)
+            header = file.read(30)
+            if len(header) != 30 or header[:4] != b'PK\x03\x04':
+                raise SlideFileError(f"Encabezado inválido en el miembro {info.filename}")
+            name_size, extra_size = struct.unpack('<2H', header[26:30])
+            local = header + file.read(name_size + extra_size + info.compress_size)
+
+            name = info.orig_filename.encode('utf-8' if info.flag_bits & 0x800 else 'cp437')
+            year, month, day, hour, minute, second = info.date_time
+            directory += struct.pack(
+                '<4s4B4HL2L5H2L', b'PK\x01\x02',
+                info.create_version, info.create_system, info.extract_version, info.reserved,
+                info.flag_bits, info.compress_type,
+                hour << 11 | minute << 5 | second // 2, (year - 1980) << 9 | month << 5 | day,
+                info.CRC, info.compress_size, info.file_size,
+                len(name), 0, 0, 0, info.internal_attr, info.external_attr, len(records)
+            ) + name
+            records += local
+
+    end = struct.pack('<4s4H2LH', b'PK\x05\x06', 0, 0, len(infos), len(infos),
+                      len(directory), len(records), 0)
+    return bytes(records + directory + end)
+
+
+def _warn_no_results() -> None:
+    print(f"WARNING: No se encontró el archivo de resultados en el proyecto")
+    print(f"WARNING: Las funcionalidades de lectura de resultados podran generar errores o comportamientos inesperados")
+
+
+class MemoryArchive:
+    def __init__(self, project_path: Path, keep_compressed: bool = False):
+        """
+        Lee los archivos del proyecto directamente desde el .slim en memoria.
+
+        Solo se descomprimen los miembros .sli y .s01, el resto del archivo
+        (.emf, .slv, ...) nunca se lee.
+
+        Args:
+            project_path: Ruta al archivo .slim original
+            keep_compressed: Si es True se guardan en memoria los datos
+                comprimidos del .sli y del .s01 (no el resto del .slim) y cada
+                uno se descomprime solo cuando se lee (modo perezoso)
+        """
+        self._project_path = project_path
+        self._keep_compressed = keep_compressed
+        self._compressed = None
+        self._names = {}
+        self.has_results = False
+
+    def open(self) -> None:
+        """Valida el .slim y localiza sus miembros esenciales"""
+        with zipfile.ZipFile(self._project_path, 'r') as zip_ref:
+            infos = scan_members(zip_ref)
+        self._verify_members(set(infos))
+        self._names = {
+            suffix: infos[suffix].filename
+            for suffix in REQUIRED_FILES if suffix in infos
+        }
+
+        if self._keep_compressed:
+            self._compressed = pack_members(
+                self._project_path, [infos[suffix] for suffix in REQUIRED_FILES if suffix in infos]
+            )
+
+    def _source(self):
+        """Origen del zip: el .slim guardado en memoria o la ruta original"""
+        if self._compressed is not None:
+            return io.BytesIO(self._compressed)
+        return self._project_path
+
+    def _verify_members(self, existing_files: set) -> None:
+        """Verifica la presencia de archivos esenciales"""
+        missing = REQUIRED_FILES - existing_files
+        logging.debug(f"Archivos encontrados: {existing_files}, faltantes: {missing}")
+        self.has_results = True
+
+        if '.sli' not in existing_files:
+            raise SlideFileError(
+                f"Archivos esenciales faltantes en el proyecto: {', '.join(missing)}"
+            )
+
+        if '.s01' not in existing_files:
+            self.has_results = False
+            _warn_no_results()
+
+    def _member_name(self, type_file: str) -> str | None:
+        """Nombre del miembro del zip para el tipo de archivo (None si no hay resultados)"""
+        suffix = _suffix_for(type_file)
+        if not self._names:
+            raise SlideFileError("Proyecto no descomprimido")
+
+        if suffix in self._names:
+            return self._names[suffix]
+        if suffix == '.s01' and not self.has_results:
+            return None
+        raise SlideFileError(f"Archivo con extensión {suffix} no encontrado")
+
+    def read(self, type_file: str) -> Union[str, bytes]:
+        """
+        Lee el contenido de un archivo del proyecto por su tipo
+
+        Args:
+            type_file: Tipo de archivo input => sli output => s01
+
+        Devuelve:
+            str: Contenido del archivo decodificado
+        """
+        name = self._member_name(type_file)
+        if name is None:
+            return ''
+
+        with zipfile.ZipFile(self._source(), 'r') as zip_ref:
+            return _decode(zip_ref.read(name))
+
+    def open_stream(self, type_file: str) -> TextIO:
+        """
+        Abre un archivo del proyecto como flujo de texto, descomprimiéndolo a
+        medida que se lee (sin cargarlo completo en memoria)
+
+        Args:
+            type_file: Tipo de archivo input => sli output => s01
+        """
+        name = self._member_name(type_file)
+        if name is None:
+            return io.StringIO('')
+
+        # el miembro abierto mantiene el archivo abierto hasta cerrarse
+        with zipfile.ZipFile(self._source(), 'r') as zip_ref:
+            member = zip_ref.open(name)
+        return io.TextIOWrapper(member, encoding='utf-8', errors='ignore')
+
+    def cleanup(self) -> None:
+        """Libera el contenido guardado en memoria"""
+        self._compressed = None
+        self._names = {}
+
+
+class TempDirArchive:
+    def __init__(self, project_path: Path):
+        """
+        Descomprime el proyecto completo en un directorio temporal.
+
+        Args:
+            project_path: Ruta al archivo .slim original
+        """
+        self._project_path = project_path
+        self._temp_dir = None
+        self.has_results = False
+
+    def open(self) -> Path:
+        """
+        Descomprime el proyecto .slim al directorio temporal
+
+        Devuelve:
+        ----------
+            Path: Ruta al directorio temporal con los archivos descomprimidos
+        """
+        if not self._temp_dir:
+            self._create_temp_dir()
+
+        with zipfile.ZipFile(self._project_path, 'r') as zip_ref:
+            zip_ref.extractall(self._temp_dir)
+
+        self._verify_decompressed_files()
+        return self._temp_dir
+
+    def _create_temp_dir(self) -> Path:
+        """
+        Crea un directorio temporal único y seguro para trabajar
+
+        Devuelve:
+        ----------
+            Path: Ruta al directorio temporal creado
+        """
+        if self._temp_dir and self._temp_dir.exists():
+            self.cleanup()
+
+        try:
+            # Usamos tempfile para mejor manejo de permisos y seguridad
+            temp_dir = tempfile.mkdtemp(prefix="slidepyv6_")
+            self._temp_dir = Path(temp_dir)
+            logger.debug(f"Directorio temporal creado: {self._temp_dir}")
+            return self._temp_dir
+        except OSError as e:
+            raise SlideTempDirectoryError(f"Error creando directorio temporal: {e}")
+
+    def _verify_decompressed_files(self) -> None:
+        """Verifica la presencia de archivos esenciales"""
+        existing_files = {f.suffix for f in self._temp_dir.glob('*')}
+        missing = REQUIRED_FILES - existing_files
+        logging.debug(f"Archivos encontrados: {existing_files}, faltantes: {missing}")
+        self.has_results = True
+
+        if '.sli' not in existing_files:
+            raise SlideFileError(
+                f"Archivos esenciales faltantes en el proyecto: {', '.join(missing)}"
+            )
+
+        if '.s01' not in existing_files:
+            self.has_results = False
+            _warn_no_results()
+
+            # Crear archivo de salida temporal en la carpeta temporal
+            name = "no_results"
+            output_file = self._temp_dir / f"{name}.s01"
+            output_file.touch()
+
+    def read(self, type_file: str) -> Union[str, bytes]:
+        """
+        Lee el contenido de un archivo del proyecto por su tipo
+
+        Args:
+            type_file: Tipo de archivo input => sli output => s01
+
+        Devuelve:
+            str: Contenido del archivo decodificado
+        """
+        if not self._temp_dir:
+            raise SlideFileError("Proyecto no descomprimido")
+
+        suffix = _suffix_for(type_file)
+        target_file = next(self._temp_dir.glob(f"*{suffix}"), None)
+
+        if not target_file or not target_file.exists():
+            raise SlideFileError(f"Archivo con extensión {suffix} no encontrado")
+
+        return _decode(target_file.read_bytes())
+
+    def open_stream(self, type_file: str) -> TextIO:
+        """
+        Abre un archivo del proyecto como flujo de texto
+
+        Args:
+            type_file: Tipo de archivo input => sli output => s01
+        """
+        if not self._temp_dir:
+            raise SlideFileError("Proyecto no descomprimido")
+
+        suffix = _suffix_for(type_file)
+        target_file = next(self._temp_dir.glob(f"*{suffix}"), None)
+
+        if not target_file or not target_file.exists():
+            raise SlideFileError(f"Archivo con extensión {suffix} no encontrado")
+
+        return open(target_file, 'r', encoding='utf-8', errors='ignore')
+
+    def cleanup(self) -> None:
+        """Elimina de forma segura el directorio temporal"""
+
+        if self._temp_dir and self._temp_dir.exists():
+            try:
+                shutil.rmtree(self._temp_dir)
+                logger.debug(f"Directorio temporal eliminado: {self._temp_dir}")
+            except Exception as e:
+                logger.error(f"Error limpiando directorio temporal: {e}")
+            finally:
+                self._temp_dir = None
+
+
+ARCHIVE_BACKENDS = {
+    'memory': MemoryArchive,
+    'tempdir': TempDirArchive
+}
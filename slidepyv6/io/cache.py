@@ -0,0 +1,172 @@
+from .archive import REQUIRED_FILES
+from pathlib import Path, PurePosixPath
+import hashlib
+import os
+import pickle
+import tempfile
+import zipfile
+import zlib
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Se incrementa cuando cambian los modelos o los parsers, para no leer
+# entradas guardadas con una versión anterior
+CACHE_VERSION = 4
+
+# Extensión de las entradas del caché
+_ENTRY_SUFFIX = '.slc'
+
+# Tamaño máximo por defecto del directorio de caché (512 MB)
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def dump_payload(entry: dict) -> bytes:
+    """Serializa las secciones parseadas de un proyecto (pickle comprimido con zlib)"""
+    return zlib.compress(pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def load_payload(data: bytes) -> dict:
+    """Recupera las secciones serializadas con dump_payload"""
+    return pickle.loads(zlib.decompress(data))
+
+
+class ParseCache:
+    def __init__(self, directory: str | Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Caché en disco de proyectos ya parseados.
+
+        Cada entrada guarda las secciones parseadas (metadata, properties,
+        geometry, loads, results) serializadas con pickle y comprimidas con
+        zlib. La clave se obtiene de los CRC de los miembros .sli y .s01 leídos
+        del directorio central del zip, sin descomprimir nada.
+
+        Las entradas se escriben en un archivo temporal y se renombran con
+        os.replace, por lo que varios procesos pueden escribir a la vez sin
+        dejar entradas a medias. Al superar max_bytes se eliminan las entradas
+        usadas hace más tiempo (la fecha de modificación se actualiza en cada
+        lectura).
+
+        Args:
+            directory: Directorio del caché (se crea si no existe)
+            max_bytes: Tamaño máximo del directorio en bytes
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def key_for(self, project_path: Path) -> str:
+        """
+        Calcula la clave de un proyecto a partir del directorio central del zip
+
+        Args:
+            project_path: Ruta al archivo .slim
+
+        Devuelve:
+            str: Hash hexadecimal de los CRC y tamaños de los miembros .sli y .s01
+        """
+        members = {}
+        with zipfile.ZipFile(project_path, 'r') as zip_ref:
+            for info in zip_ref.infolist():
+                suffix = PurePosixPath(info.filename).suffix
+                if suffix in REQUIRED_FILES and not info.is_dir():
+                    members.setdefault(suffix, f"{suffix}:{info.CRC:08x}:{info.file_size}")
+
+        digest = hashlib.sha256(f"v{CACHE_VERSION}".encode())
+        for suffix in sorted(members):
+            digest.update(members[suffix].encode())
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}{_ENTRY_SUFFIX}"
+
+    def get(self, key: str) -> dict | None:
+        """
+        Lee una entrada del caché
+
+        Args:
+            key: Clave del proyecto (ver key_for)
+
+        Devuelve:
+            dict | None: Secciones parseadas, o None si la entrada no existe o
+                no se puede leer
+        """
+        path = self._entry_path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"No se pudo leer la entrada de caché {path}: {e}")
+            return None
+
+        try:
+            entry = load_payload(data)
+        except Exception as e:
+            logger.warning(f"Entrada de caché inválida {path}, se descarta: {e}")
+            self._remove(path)
+            return None
+
+        # marca la entrada como usada recientemente (LRU)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def put(self, key: str, entry: dict) -> None:
+        """
+        Guarda una entrada en el caché y aplica el límite de tamaño
+
+        Args:
+            key: Clave del proyecto (ver key_for)
+            entry: Secciones parseadas
+        """
+        data = dump_payload(entry)
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix='.tmp-', suffix=_ENTRY_SUFFIX)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                os.replace(temp_path, self._entry_path(key))
+            except BaseException:
+                self._remove(Path(temp_path))
+                raise
+        except OSError as e:
+            logger.warning(f"No se pudo escribir en el caché {self.directory}: {e}")
+            return
+
+        self.evict()
+
+    def evict(self) -> None:
+        """Elimina las entradas usadas hace más tiempo hasta quedar bajo max_bytes"""
+        entries = []
+        for path in self.directory.glob(f"*{_ENTRY_SUFFIX}"):
+            if path.name.startswith('.tmp-'):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                # eliminada por otro proceso
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    def clear(self) -> None:
+        """Elimina todas las entradas del caché"""
+        for path in self.directory.glob(f"*{_ENTRY_SUFFIX}"):
+            self._remove(path)
+
+    def _remove(self, path: Path) -> None:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"No se pudo eliminar {path}: {e}")
@@ -1,39 +1,141 @@
-from ..utils.exceptions import SlideFileError, SlideTempDirectoryError
-from ..models.metadata import ProjectMetadata
+from ..utils.exceptions import SlideError, SlideFileError, SlideTempDirectoryError, SlideParsingError
+from .archive import ARCHIVE_BACKENDS, MemoryArchive, scan_members, read_member_head
+from .cache import ParseCache, dump_payload, load_payload
+from ..models.metadata import ProjectMetadata, ProjectSummary
 from ..models.properties import ProjectProperties
 from ..models.geometries import ProjectGeometry
 from ..models.loads import ProjectLoads
-from ..models.results import ProjectResults
+from ..models.results import ProjectResults, Surface
 from .parsers.input_parser import InputParser
 from .parsers.output_parser import OutputParser
 import zipfile
-import tempfile
-import shutil
+import re
 from pathlib import Path
+from typing import Iterator, TextIO
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Fin del bloque "model description" del .sli: primera línea no indentada
+# después del encabezado
+_MODEL_DESCRIPTION_END = re.compile(rb"model description:.*?\n(?=\w)", re.DOTALL)
+
 class SlideProjectIO:
-    def __init__(self, project_path: Path):
+    # Parser de cada sección del archivo de entrada (.sli)
+    _INPUT_PARSERS = {
+        'metadata': InputParser.parse_metadata,
+        'properties': InputParser.parse_properties,
+        'geometry': InputParser.parse_geometry,
+        'loads': InputParser.parse_loads
+    }
+
+    def __init__(
+            self,
+            project_path: Path,
+            backend: str = 'memory',
+            lazy: bool = False,
+            cache: ParseCache | str | Path | None = None
+            ):
         """
         Maneja la lectura/escritura segura de proyectos Slide V6
         
         Args:
             project_path: Ruta al archivo .slim original
+            backend: Forma de leer el .slim, 'memory' (por defecto) lee los
+                archivos directamente del zip y 'tempdir' los descomprime
+                en un directorio temporal
+            lazy: Si es True cada sección (metadata, properties, geometry,
+                loads, results) se parsea al accederla por primera vez
+            cache: Caché en disco de proyectos parseados (ParseCache o ruta a
+                su directorio). Si el proyecto está en el caché no se parsea
         """
+        if backend not in ARCHIVE_BACKENDS:
+            raise SlideFileError(f"Backend de archivo inválido: {backend}")
+
+        # En modo perezoso los archivos quedan comprimidos en memoria
+        # (backend memory) o descomprimidos en disco (backend tempdir)
+        options = {'keep_compressed': True} if lazy and backend == 'memory' else {}
+
         self._original_path = project_path.absolute()      
-        self._temp_dir = None
+        self._archive = ARCHIVE_BACKENDS[backend](self._original_path, **options)
+        self._lazy = lazy
+        self._cache = ParseCache(cache) if isinstance(cache, (str, Path)) else cache
+        self._cache_key = None
+        self._input_sections = None
         self._parsed_data = {
             'metadata': None,
             'properties': None,
             'loads': None,
-            'geometrys': None,
+            'geometry': None,
             'results': None
         }
         self.has_results = False
-        self._full_parse()
 
+        if lazy:
+            self._open_project()
+        else:
+            self._full_parse()
+
+    @classmethod
+    def from_payload(cls, project_path: Path, payload: bytes) -> 'SlideProjectIO':
+        """
+        Crea el proyecto a partir de sus secciones serializadas con to_payload,
+        sin leer el .slim
+
+        Args:
+            project_path: Ruta al archivo .slim original
+            payload: Secciones serializadas
+        """
+        project_io = cls.__new__(cls)
+        project_io._original_path = Path(project_path).absolute()
+        project_io._archive = MemoryArchive(project_io._original_path)
+        project_io._lazy = False
+        project_io._cache = None
+        project_io._cache_key = None
+        project_io._input_sections = None
+        project_io._parsed_data = {}
+        project_io._apply_entry(load_payload(payload))
+        return project_io
+
+
+    @staticmethod
+    def peek(project_path: Path) -> ProjectSummary:
+        """
+        Lee solo la metadata del proyecto y el directorio central del zip.
+
+        Del .sli se descomprime únicamente el bloque "model description" y la
+        presencia de resultados se toma del directorio central. No guarda
+        estado, por lo que puede usarse desde varios hilos a la vez.
+
+        Args:
+            project_path: Ruta al archivo .slim
+        """
+        project_path = Path(project_path)
+        if not project_path.exists():
+            raise SlideFileError(f"Archivo no encontrado: {project_path}")
+        if project_path.suffix.lower() != '.slim':
+            raise SlideFileError("Extensión de archivo inválida. Debe ser .slim")
+
+        try:
+            with zipfile.ZipFile(project_path, 'r') as zip_ref:
+                infos = scan_members(zip_ref)
+                if '.sli' not in infos:
+                    raise SlideFileError("Archivos esenciales faltantes en el proyecto: .sli")
+                head = read_member_head(zip_ref, infos['.sli'], _MODEL_DESCRIPTION_END)
+        except zipfile.BadZipFile as e:
+            raise SlideFileError("Archivo .slim corrupto o inválido") from e
+
+        try:
+            metadata = InputParser.parse_metadata(InputParser.split_sections(head))
+        except Exception as e:
+            raise SlideParsingError(f"Error parseando la sección model description: {e}") from e
+
+        return ProjectSummary(
+            path=str(project_path),
+            metadata=metadata,
+            has_results='.s01' in infos,
+            member_sizes={info.filename: info.file_size for info in infos.values()}
+        )
 
     # ---------------------------------------------------------
     #                      Metodos Protegidos 
@@ -44,8 +146,11 @@ class SlideProjectIO:
         try:
             # *****************************************************
             self._validate_input_file()
+            if self._load_from_cache():
+                return
             self._decompress_project()
             self._parse_files()
+            self._store_in_cache()
             
             '''
             # esto es temporal para debug
@@ -61,6 +166,19 @@ class SlideProjectIO:
             self.cleanup()
     
 
+    def _open_project(self):
+        """Realiza la validación del proyecto sin parsear ninguna sección"""
+
+        try:
+            self._validate_input_file()
+            if self._load_from_cache():
+                self._lazy = False
+                return
+            self._decompress_project()
+        except Exception as e:
+            self.cleanup()
+            raise SlideFileError(f"Error al validar el archivo de entrada: {e}") from e
+
     def _validate_input_file(self) -> None:
         """Verifica que el archivo de entrada sea válido"""
         if not self._original_path.exists():
@@ -69,94 +187,19 @@ class SlideProjectIO:
         if self._original_path.suffix.lower() != '.slim':
             raise SlideFileError("Extensión de archivo inválida. Debe ser .slim")
 
-    def _decompress_project(self) -> Path:
-        """
-        Descomprime el proyecto .slim al directorio temporal
-
-        Devuelve:
-        ----------
-            Path: Ruta al directorio temporal con los archivos descomprimidos
-        """
-        if not self._temp_dir:
-            self._create_temp_dir()
-
+    def _decompress_project(self) -> None:
+        """Abre el proyecto .slim con el backend de archivo configurado"""
         try:
-            with zipfile.ZipFile(self._original_path, 'r') as zip_ref:
-                zip_ref.extractall(self._temp_dir)
-                
-            self._verify_decompressed_files()
-            return self._temp_dir
-            
+            self._archive.open()
+            self.has_results = self._archive.has_results
+
         except zipfile.BadZipFile as e:
             raise SlideFileError("Archivo .slim corrupto o inválido") from e
+        except SlideTempDirectoryError:
+            raise
         except Exception as e:
             raise SlideFileError(f"Error descomprimiendo archivo: {e}") from e
 
-    def _create_temp_dir(self) -> Path:
-        """
-        Crea un directorio temporal único y seguro para trabajar
-
-        Devuelve:
-        ----------
-            Path: Ruta al directorio temporal creado
-        """
-        if self._temp_dir and self._temp_dir.exists():
-            self.cleanup()
-            
-        try:
-            # Usamos tempfile para mejor manejo de permisos y seguridad
-            temp_dir = tempfile.mkdtemp(prefix="slidepyv6_")
-            self._temp_dir = Path(temp_dir)
-            logger.debug(f"Directorio temporal creado: {self._temp_dir}")
-            return self._temp_dir
-        except OSError as e:
-            raise SlideTempDirectoryError(f"Error creando directorio temporal: {e}")
-
-    def _verify_decompressed_files(self) -> None:
-        """Verifica la presencia de archivos esenciales"""
-        #-------------------------------------------
-        # los archivos de un .slim sin analisis son:
-        # .sli: Configuración principal *
-        # .slv: Slide View Options File *
-        #-------------------------------------------
-        # los archivos de un .slim con analisis son:
-        # .emf: parece un archivo binario
-        # .s01: Resultados
-        # .sli: Configuración principal *
-        # .sltm: Slide Tools File
-        # .slv: Slide View Options File *
-        # .slvi: Slide Interpret View States Filee *
-        #------------------------------------------- 
-        # los archivos con * son los mismos para ambos 
-        # tipos de proyectos
-        #-------------------------------------------
-
-        required_files = {
-            '.sli',  # requerido (escritura)
-            '.s01'   # requerido (lectura)
-        } 
-        existing_files = {f.suffix for f in self._temp_dir.glob('*')}
-        missing = required_files - existing_files
-        logging.debug(f"Archivos encontrados: {existing_files}, faltantes: {missing}")
-        self.has_results = True
-
-
-        if '.sli' not in existing_files:
-            raise SlideFileError(
-                f"Archivos esenciales faltantes en el proyecto: {', '.join(missing)}"
-            )
-        
-        if '.s01' not in existing_files:
-            self.has_results = False
-            print(f"WARNING: No se encontró el archivo de resultados en el proyecto")
-            print(f"WARNING: Las funcionalidades de lectura de resultados podran generar errores o comportamientos inesperados")            
-           
-            # Crear archivo de salida temporal en la carpeta temporal            
-            name = "no_results"
-            output_file = self._temp_dir / f"{name}.s01"
-            output_file.touch()
-
-
     def _parse_files(self):
         """Parsea y carga todos los datos a memoria"""
 
@@ -169,10 +212,8 @@ class SlideProjectIO:
         
         # Leer y parsear output si existe       
         if self.has_results:
-            output_content = self._read_project_file('output')
-            #if isinstance(output_content, bytes):
-            #    output_content = output_content.decode('utf-8', errors='ignore')
-            results = OutputParser.parse(output_content)
+            with self._open_project_stream('output') as output_stream:
+                results = OutputParser.parse_stream(output_stream)
 
             self._parsed_data['results']  = results
         try:
@@ -182,30 +223,103 @@ class SlideProjectIO:
             self.cleanup()
             raise SlideFileError(f"Error parsing files: {e}") from e
 
+    def _get_section(self, name: str):
+        """Devuelve una sección parseada, parseándola primero en modo perezoso"""
+        if self._lazy and self._parsed_data[name] is None:
+            self._parsed_data[name] = self._parse_section(name)
+            self._release_if_parsed()
+        return self._parsed_data[name]
+
+    def _parse_section(self, name: str):
+        """Parsea una única sección del proyecto"""
+        try:
+            if name == 'results':
+                if not self.has_results:
+                    return None
+                with self._open_project_stream('output') as output_stream:
+                    return OutputParser.parse_stream(output_stream)
+
+            if self._input_sections is None:
+                self._input_sections = InputParser.split_sections(
+                    self._read_project_file('input'))
+            return self._INPUT_PARSERS[name](self._input_sections)
+
+        except SlideError:
+            raise
+        except Exception as e:
+            raise SlideParsingError(f"Error parseando la sección {name}: {e}") from e
+
+    def _release_if_parsed(self):
+        """Libera el contenido de los archivos cuando ya no se necesita"""
+        if all(self._parsed_data[name] is not None for name in self._INPUT_PARSERS):
+            self._input_sections = None
+
+            if self._parsed_data['results'] is not None or not self.has_results:
+                self.cleanup()
+                self._store_in_cache()
+
+    def _load_from_cache(self) -> bool:
+        """Carga las secciones desde el caché en disco, si el proyecto está en él"""
+        if self._cache is None:
+            return False
+
+        try:
+            self._cache_key = self._cache.key_for(self._original_path)
+        except zipfile.BadZipFile as e:
+            raise SlideFileError("Archivo .slim corrupto o inválido") from e
+
+        entry = self._cache.get(self._cache_key)
+        if entry is None:
+            return False
+
+        logger.debug(f"Proyecto cargado desde el caché: {self._original_path}")
+        self._apply_entry(entry)
+        return True
+
+    def _apply_entry(self, entry: dict) -> None:
+        """Carga las secciones de una entrada serializada (caché o payload)"""
+        self.has_results = entry['has_results']
+        self._parsed_data.update(entry['sections'])
+
+    def _entry(self) -> dict:
+        """Secciones parseadas del proyecto, parseando las que falten"""
+        return {
+            'has_results': self.has_results,
+            'sections': {name: self._get_section(name) for name in self._parsed_data}
+        }
+
+    def _store_in_cache(self) -> None:
+        """Guarda las secciones parseadas en el caché en disco"""
+        if self._cache is None or self._cache_key is None:
+            return
+
+        key, self._cache_key = self._cache_key, None
+        self._cache.put(key, self._entry())
+
 
     # ---------------------------------------------------------
     #                      Metodos Publicos 
     # ---------------------------------------------------------
     @property
     def metadata(self) -> ProjectMetadata:
-        return self._parsed_data['metadata']
+        return self._get_section('metadata')
     
     @property
     def properties(self) -> ProjectProperties:    
-        return self._parsed_data['properties']
+        return self._get_section('properties')
 
     @property
     def geometry(self) -> ProjectGeometry:
-        return self._parsed_data['geometry']
+        return self._get_section('geometry')
     
 
     @property
     def loads(self) -> ProjectLoads:
-        return self._parsed_data['loads']
+        return self._get_section('loads')
     
     @property
     def results(self) -> ProjectResults:
-        return self._parsed_data['results']
+        return self._get_section('results')
 
 
     # ##################################################
@@ -222,44 +336,53 @@ class SlideProjectIO:
         Devuelve:
             str: Contenido del archivo decodificado
         """
-   
-        if not self._temp_dir:
-            raise SlideFileError("Proyecto no descomprimido")
-
-        if type_file == 'input':
-            suffix = '.sli'
-        elif type_file == 'output':
-            suffix = '.s01'
-        else:
-            raise SlideFileError(f"Tipo de archivo inválido: {type_file}")
-            
-        target_file = next(self._temp_dir.glob(f"*{suffix}"), None)
-        
-        if not target_file or not target_file.exists():
-            raise SlideFileError(f"Archivo con extensión {suffix} no encontrado")
-            
-        try:
-            # Asumimos que los archivos de texto usan UTF-8
-            return target_file.read_text(encoding='utf-8')
-        except UnicodeDecodeError:
-            # Fallback para archivos binarios como .emf
-            return target_file.read_bytes()
+        return self._archive.read(type_file)
+
+    def _open_project_stream(self, type_file: str) -> TextIO:
+        """
+        Abre un archivo del proyecto como flujo de texto, para leerlo línea
+        a línea sin cargarlo completo en memoria
+
+        Args:
+            type_file: Tipo de archivo input => sli output => s01
+        """
+        return self._archive.open_stream(type_file)
 
     def cleanup(self) -> None:
-        """Elimina de forma segura el directorio temporal"""
-        
-        if self._temp_dir and self._temp_dir.exists():
-            try:
-                shutil.rmtree(self._temp_dir)
-                logger.debug(f"Directorio temporal eliminado: {self._temp_dir}")
-            except Exception as e:
-                logger.error(f"Error limpiando directorio temporal: {e}")
-            finally:
-                self._temp_dir = None
+        """Libera los recursos del backend de archivo (memoria o directorio temporal)"""
+        self._archive.cleanup()
+
+    def iter_surfaces(self, method: str | None = None, fs_max: float | None = None) -> Iterator[Surface]:
+        """
+        Superficies del proyecto una a una: desde la tabla si los resultados
+        ya están parseados, o leyendo los bloques de grilla del .s01 a medida
+        que se descomprimen (modo perezoso), sin parsear los resultados
+
+        Args:
+            method: Nombre del método (por defecto todos)
+            fs_max: Si se indica, solo las superficies con 0 < FS <= fs_max
+        """
+        if not self.has_results:
+            return
+        results = self._parsed_data.get('results')
+        if results is not None:
+            yield from results.iter_surfaces(method, fs_max)
+            return
+        try:
+            with self._open_project_stream('output') as output_stream:
+                yield from OutputParser.iter_surfaces(output_stream, method, fs_max)
+        except (SlideError, KeyError):
+            raise
+        except Exception as e:
+            raise SlideParsingError(f"Error leyendo las superficies: {e}") from e
 
     def get_has_results(self) -> bool:
         return self.has_results
 
+    def to_payload(self) -> bytes:
+        """Serializa todas las secciones del proyecto (ver from_payload)"""
+        return dump_payload(self._entry())
+
     # ##################################################
     #           METODOS TEMPORALES PARA DEBUG
     # ##################################################
@@ -4,15 +4,107 @@ from ...models.properties import ProjectProperties, PropertyMaterial, PropertySu
 from ...models.loads import ProjectLoads
 from ...models.properties import MohrCoulombParams, UndrainedParams, NoStrengthParams, InfiniteStrengthParams, HoekBrownParams, GeneralHoekBrownParams
 from ...models.properties import EndAnchoredParams, GeoTextileParams, GroutedTiebackParams, GroutedTiebackFrictionParams, MicroPileParams, SoilNailParams
-from ...models.geometries import Vertex, Cell, Point, Support
+from ...models.geometries import Point, Support, GeometryArrays
 from ...models.loads import LinearLoad, DistributedLoad, Load
 from ...models.properties import Color
 
+import itertools
 import re
-from typing import Tuple
+import numpy as np
+from typing import Iterable, Tuple
+
+
+# Línea de primer nivel (no indentada): "nombre de sección:" o cualquier
+# otra línea que empiece por un carácter de palabra. Se busca a partir del
+# "\n" anterior, lo que permite a re saltar directamente entre saltos de línea
+_FIRST_LINE = re.compile(r"(\w[^:\n]*)(:?)")
+_TOP_LEVEL_LINE = re.compile(r"\n(\w[^:\n]*)(:?)")
+
+# Línea de la sección "cells": "id  vertices: [a,b,c] material: nombre"
+_CELL_LINE = re.compile(r"^\s*(\d+)\s+vertices:\s*\[([^\]]*)\]\s+material:\s*(\S+)", re.MULTILINE)
+
+# Ids de celda y listas de vértices sin espacios del camino rápido de _parse_cell_arrays
+_CELL_IDS = re.compile(r"\d+( \d+)*")
+_VERTEX_LISTS = re.compile(r"\d+(,\d+)*( \d+(,\d+)*)*")
+
+
+class SectionSpans:
+    def __init__(self, content: str, spans: dict[str, tuple[int, int]]):
+        """
+        Secciones de un archivo .sli, guardadas como posiciones (inicio, fin)
+        sobre el contenido original. El texto de cada sección se obtiene
+        recortando el contenido solo cuando se pide.
+
+        Args:
+            content: Contenido completo del archivo .sli
+            spans: Posiciones (inicio, fin) de cada sección dentro de content
+        """
+        self.content = content
+        self.spans = spans
+
+    @classmethod
+    def scan(cls, content: str, sections: Iterable[str]) -> "SectionSpans":
+        """
+        Recorre el contenido una sola vez registrando el inicio y fin de
+        cada sección. Una sección empieza después de "nombre:" y termina
+        en la siguiente línea no indentada (igual que la búsqueda anterior
+        ^nombre\\b:(.*?)(?=\\n\\w|\\Z)). Solo se guarda la primera aparición.
+
+        Args:
+            content: Contenido del archivo como string
+            sections: Nombres de las secciones a registrar
+        """
+        wanted = set(sections)
+        spans = {}
+        current = None
+        first_line = _FIRST_LINE.match(content)
+        matches = _TOP_LEVEL_LINE.finditer(content)
+        if first_line:
+            matches = itertools.chain([first_line], matches)
+
+        for match in matches:
+            if current is not None:
+                # la sección termina en el "\n" que precede a la línea
+                spans[current] = (spans[current][0], match.start())
+                current = None
+
+            name = match.group(1)
+            if match.group(2) and name in wanted and name not in spans:
+                spans[name] = (match.end(), len(content))
+                current = name
+
+        return cls(content, spans)
+
+    def __getitem__(self, name: str) -> str:
+        start, end = self.spans[name]
+        return self.content[start:end].strip()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.spans
+
+    def get(self, name: str, default: str | None = None) -> str | None:
+        return self[name] if name in self.spans else default
 
 
 class InputParser:
+
+    # Secciones del archivo .sli que se leen
+    #------------------------------------------------
+    SECTIONS = [
+        "model description",
+        "material types",
+        "anchor types",
+        "vertices",
+        "cells",
+        "anchors",
+        "water table",
+        "slope",
+        "exterior",
+        "forces",
+        "slope limits",
+        "material properties"
+    ]
+
     @staticmethod
     def parse(content: str) -> Tuple[ProjectMetadata, ProjectProperties, ProjectGeometry, ProjectLoads]:
         """
@@ -21,58 +113,67 @@ class InputParser:
         Args:
             content: Contenido del archivo como string
         """
+        sections = InputParser.split_sections(content)
+
+        # Parsear cada sección
+        #------------------------------------------------
+        project_metadata = InputParser.parse_metadata(sections)
+        project_properties = InputParser.parse_properties(sections)
+        project_geometry = InputParser.parse_geometry(sections)
+        project_loads = InputParser.parse_loads(sections)
+
+        return (project_metadata,project_properties, project_geometry, project_loads)  
+
+    @staticmethod
+    def split_sections(content: str) -> "SectionSpans":
+        """
+        Separa el contenido del archivo de entrada en sus secciones
+
+        Args:
+            content: Contenido del archivo como string
+
+        Devuelve:
+            SectionSpans: Secciones encontradas, indexables por nombre
+        """
         # Asegurarnos que content sea string
         #------------------------------------------------
         if isinstance(content, bytes):
             content = content.decode('utf-8', errors='ignore')
         
-        # Separar el contenido en secciones
-        #------------------------------------------------
-        sections = [
-            "model description",
-            "material types",
-            "anchor types",
-            "vertices",
-            "cells",
-            "anchors",
-            "water table",
-            "slope",
-            "exterior",
-            "forces",
-            "slope limits",
-            "material properties"
-        ]
-
-        extracted_data = {}        
-        for section in sections:
-            pattern = rf"^{section}\b:(.*?)(?=\n\w|\Z)"
-            match = re.search(pattern, content, re.DOTALL | re.MULTILINE)
-            if match:
-                extracted_data[section] = match.group(1).strip()
- 
-        # Parsear cada sección
-        #------------------------------------------------
-        project_metadata = InputParser._parse_project_metadata(
-            content=extracted_data['model description'])
-        
-        project_properties = InputParser._parse_project_properties(
-            material_styles=extracted_data['material properties'],
-            material_properties=extracted_data['material types'],
-            anchor_properties=extracted_data['anchor types']
+        return SectionSpans.scan(content, InputParser.SECTIONS)
+
+    @staticmethod
+    def parse_metadata(sections: SectionSpans) -> ProjectMetadata:
+        """Parsea la metadata a partir de las secciones del archivo"""
+        return InputParser._parse_project_metadata(
+            content=sections['model description'])
+
+    @staticmethod
+    def parse_properties(sections: SectionSpans) -> ProjectProperties:
+        """Parsea las propiedades a partir de las secciones del archivo"""
+        return InputParser._parse_project_properties(
+            material_styles=sections['material properties'],
+            material_properties=sections['material types'],
+            anchor_properties=sections['anchor types']
             )
-         
-        project_geometry, project_loads = InputParser._parse_project_geometry(
-                vertices=extracted_data['vertices'],
-                cells=extracted_data['cells'],
-                anchors=extracted_data['anchors'],
-                water_table=extracted_data['water table'],
-                slope=extracted_data['slope'],
-                exterior=extracted_data['exterior'],
-                forces=extracted_data['forces'],
-                slope_limits=extracted_data['slope limits']                
-            )     
-        
-        return (project_metadata,project_properties, project_geometry, project_loads)  
+
+    @staticmethod
+    def parse_geometry(sections: SectionSpans) -> ProjectGeometry:
+        """Parsea la geometría a partir de las secciones del archivo"""
+        return InputParser._parse_project_geometry(
+                vertices=sections['vertices'],
+                cells=sections['cells'],
+                anchors=sections['anchors'],
+                water_table=sections['water table'],
+                slope=sections['slope'],
+                exterior=sections['exterior'],
+                slope_limits=sections['slope limits']                
+            )
+
+    @staticmethod
+    def parse_loads(sections: SectionSpans) -> ProjectLoads:
+        """Parsea las cargas a partir de las secciones del archivo"""
+        return InputParser._parse_project_loads(forces=sections['forces'])
 
     def _parse_project_metadata(content: str) -> ProjectMetadata:
         lines = content.splitlines()
@@ -339,47 +440,15 @@ class InputParser:
                 water_table: str,
                 slope: str,
                 exterior: str,
-                forces: str,
-                slope_limits: str ) -> tuple [ProjectGeometry, ProjectLoads]:
-        
-        #------------------------------------------------
-        # vertices
-        # ------------------------------------------------
-        lines = vertices.splitlines()
-        list_vertices = []
-        for i, line in enumerate(lines):
-            data_vertex  = line.strip().split(' ')
-            num = data_vertex[0]
-            x = data_vertex[2]
-            y = data_vertex[5]
-            point = Point(x=float(x), y=float(y))
-            list_vertices.append(Vertex(
-                id= int(num),
-                point= point
-            ))
+                slope_limits: str ) -> ProjectGeometry:
         
         #------------------------------------------------
-        # cells
+        # vertices y celdas
         # ------------------------------------------------
-        lines = cells.splitlines()
-        list_cells = []
-        for i, line in enumerate(lines):
-            data_cell  = line.strip().split(' ')
-            num = data_cell[0]
-            vertices_id = data_cell[3].strip('[]').split(',')
-
-            cell_list_vertices = []
-            for i in range(len(vertices_id)):
-                vertices_id[i] = int(vertices_id[i])
-                cell_list_vertices.append(list_vertices[vertices_id[i]-1])           
+        vertex_ids, vertex_coords = InputParser._parse_vertex_arrays(vertices)
+        cell_ids, cell_offsets, cell_vertices, cell_material, materials = \
+            InputParser._parse_cell_arrays(cells)
 
-            material = data_cell[-1]
-            list_cells.append(Cell(
-                id= int(num),
-                vertices= cell_list_vertices,
-                property_id= material
-            ))
-        
         #------------------------------------------------
         # supports
         # ------------------------------------------------
@@ -399,20 +468,6 @@ class InputParser:
                 property_id= data_anchor[-5],
             ))  
         
-        #------------------------------------------------
-        # water table
-        # ------------------------------------------------
-        if water_table.strip():           
-            list_water_table_vertices = []
-            data_water_table  = water_table.split(':', 1)[1].strip().strip('[]').split(',')
-            for i in range(len(data_water_table)):
-                data_water_table_id = int(data_water_table[i])
-                list_water_table_vertices.append(
-                    list_vertices[data_water_table_id-1]
-                )
-        else:
-            list_water_table_vertices = []
-        
         #------------------------------------------------
         # slope limits
         # ------------------------------------------------
@@ -429,32 +484,86 @@ class InputParser:
             slope_limits = None
 
         #------------------------------------------------
-        # slope
+        # nivel freático, pendiente y exterior
         # ------------------------------------------------
-        if slope.strip():            
-            list_slope_vertices = []
-            data_slope  = slope.split(':', 1)[1].strip().strip('[]').split(',')
-            for i in range(len(data_slope)):
-                data_slope_id = int(data_slope[i])
-                list_slope_vertices.append(
-                    list_vertices[data_slope_id-1]
-                )                
-        else:
-            list_slope_vertices = []
-        
-        #------------------------------------------------
-        # exterior
-        # ------------------------------------------------   
-        if exterior.strip():            
-            list_exterior_vertices = []
-            data_exterior  = exterior.split(':', 1)[1].strip().strip('[]').split(',')
-            for i in range(len(data_exterior)):
-                data_exterior_id = int(data_exterior[i])
-                list_exterior_vertices.append(
-                    list_vertices[data_exterior_id-1]
-                )
-        else:
-            list_exterior_vertices = []
+        arrays = GeometryArrays(
+            vertex_ids= vertex_ids,
+            vertices= vertex_coords,
+            cell_ids= cell_ids,
+            cell_offsets= cell_offsets,
+            cell_vertices= cell_vertices,
+            cell_material= cell_material,
+            materials= materials,
+            exterior= InputParser._parse_vertex_indices(exterior),
+            slope= InputParser._parse_vertex_indices(slope),
+            water_table= InputParser._parse_vertex_indices(water_table)
+        )
+
+        return ProjectGeometry(
+            arrays= arrays,
+            supports= list_anchors,
+            limits= slope_limits
+        )
+
+    def _parse_vertex_arrays(vertices: str) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Convierte las líneas "id x: valor y: valor" en los ids (n,) y las
+        coordenadas (n, 2) de los vértices, en una sola conversión de NumPy
+        """
+        values = vertices.replace('x:', ' ').replace('y:', ' ')
+        data = np.fromstring(values, sep=' ', dtype=np.float64).reshape(-1, 3)
+        return data[:, 0].astype(np.int64), np.ascontiguousarray(data[:, 1:])
+
+    def _parse_cell_arrays(cells: str) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, list[str]]:
+        """
+        Convierte las líneas "id vertices: [a,b,c] material: nombre" en los
+        arreglos CSR de las celdas (los ids de vértices pasan a índices desde 0)
+        """
+        # "id vertices: [a,b,c] material: nombre" => "id a,b,c nombre"
+        tokens = cells.replace('vertices:', ' ').replace('material:', ' ') \
+                      .replace('[', ' ').replace(']', ' ').split()
+        # camino rápido solo si cada celda da exactamente 3 tokens: id, lista sin espacios y material
+        count = cells.count('vertices:')
+        cell_ids, vertex_lists, material_names = tokens[0::3], tokens[1::3], tokens[2::3]
+        if not (len(tokens) == 3 * count
+                and _CELL_IDS.fullmatch(' '.join(cell_ids))
+                and _VERTEX_LISTS.fullmatch(' '.join(vertex_lists))):
+            # listas con espacios u otro formato: se lee línea a línea
+            rows = _CELL_LINE.findall(cells)
+            cell_ids = [row[0] for row in rows]
+            vertex_lists = [row[1].replace(' ', '') for row in rows]
+            material_names = [row[2] for row in rows]
+
+        # se parsean todas las listas juntas separadas por 0 (los ids empiezan en 1)
+        values = np.fromstring(',0,'.join(vertex_lists), sep=',', dtype=np.int64)
+        separators = np.flatnonzero(values == 0)
+        cell_offsets = np.zeros(len(vertex_lists) + 1, dtype=np.int64)
+        if vertex_lists:
+            cell_offsets[1:-1] = separators - np.arange(len(separators))
+            cell_offsets[-1] = len(values) - len(separators)
+        cell_vertices = np.delete(values, separators) - 1
+
+        # códigos de material en orden de aparición
+        names, first, inverse = np.unique(np.array(material_names, dtype=str), return_index=True, return_inverse=True)
+        order = np.argsort(first)
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        cell_material = rank[inverse].astype(np.int32)
+
+        return (np.array(cell_ids, dtype=np.int64), cell_offsets, cell_vertices,
+                cell_material, names[order].tolist())
+
+    def _parse_vertex_indices(content: str) -> np.ndarray:
+        """
+        Índices (desde 0) de la lista de vértices "...: [a,b,c]" de una
+        sección como water table, slope o exterior
+        """
+        if not content.strip():
+            return np.empty(0, dtype=np.int64)
+        data = content.split(':', 1)[1].strip().strip('[]').split(',')
+        return np.array(data, dtype=np.int64) - 1
+
+    def _parse_project_loads(forces: str) -> ProjectLoads:
 
         #------------------------------------------------
         # forces
@@ -505,19 +614,7 @@ class InputParser:
 
         #------------------------------------------------
         
-        project_loads = ProjectLoads(
+        return ProjectLoads(
                 linear = list_linear_loads, 
                 distributed = list_distributed_loads
             )
-              
-        project_geometry =ProjectGeometry(
-            vertex= list_vertices,
-            cells= list_cells,
-            supports= list_anchors,
-            water_table_vertex= list_water_table_vertices,
-            limits= slope_limits,
-            slope= list_slope_vertices,
-            exterior= list_exterior_vertices
-        )
-
-        return project_geometry, project_loads
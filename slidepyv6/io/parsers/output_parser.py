@@ -1,188 +1,424 @@
-
-from ...models.results import ProjectResults
+from ...models.results import ProjectResults, SurfaceTable, SliceArrays, SupportResults, CenterGrid
 from ...models.results import GlobalMinimum, Surface,  Point, Method, EquilibriumTerms
+from array import array
+from typing import Iterable, Iterator
+import numpy as np
+import io
 import re
 
+
+# Términos de equilibrio del bloque "* Global Minimum Text"
+_EQUILIBRIUM_PATTERN = re.compile(
+    r"^(Resisting Moment|Driving Moment|Resisting Horizontal Force|Driving Horizontal Force)=(\d+(?:\.\d+)?)")
+
+
 class OutputParser:
     @staticmethod
     def parse(content: str) -> ProjectResults:
+        """
+        Parsea el contenido completo del archivo de resultados (.s01)
 
+        Args:
+            content: Contenido del archivo como string o bytes
+        """
         # Si 'content' es bytes, decodificamos a string
         if isinstance(content, bytes):
             content = content.decode('utf-8', errors='ignore')
-        
-
-        # Bloque de información general
-        #--------------------------------
-        pattern_inf  = r"(?ms)(\* Version.*?)(?=\* Three Point Surfaces.*?|\* grid#.*?)"
-        match_inf = next(re.finditer(pattern_inf, content, re.MULTILINE), None)
-        block_inf = match_inf.group(1).strip() 
-  
-        # Bloque de superficies
-        #--------------------------------
-        # Definir patrón para el bloque que inicia con "* grid#"
-        pattern_grid = r"(?ms)(\* grid#.*?)(?=\* Global Minimum FS \(xc,yc,r,x1,y1,x2,y2,fs,name\))"
-        # Definir patrón para el bloque que inicia con "* Three Point Surfaces (xc,yc,r,yleft,x1,y1,x2,y2,yright,fs1,fs2,...,b1)"
-        pattern_three  = r"(?ms)(\* Three Point Surfaces.*?)(?=\* Global Minimum FS \(xc,yc,r,x1,y1,x2,y2,fs,name\))"
-
-        match_grid = next(re.finditer(pattern_grid, content, re.MULTILINE), None)
-        match_three = next(re.finditer(pattern_three, content, re.MULTILINE), None)
-
-    
-        if match_grid :
-            block_surface = match_grid.group(1).strip()
-        elif match_three:
-            block_surface = match_three.group(1).strip()
-        else:
-            block_surface = None
-
-        # Bloque de mínimos globales
-        #--------------------------------
-        pattern_min  = r"(?ms)(\* Global Minimum FS.*?)(?=\* #data)"
-        match_min = next(re.finditer(pattern_min, content, re.MULTILINE), None)
-        block_min = match_min.group(1).strip()
-
-        # Bloque de resultados de dobelas
-        #--------------------------------
-        pattern_data  = r"(?ms)(\* #data.*?)(?=\* bolt data \(#bolts,nummethods\))"
-        match_data = next(re.finditer(pattern_data, content, re.MULTILINE), None)
-        block_data = match_data.group(1).strip() 
-
-        methods = OutputParser._parse_project_results_methods(block_inf)
-        surfaces = OutputParser._parse_project_results_surfaces(block_surface, methods)        
-        global_minimums = OutputParser._parse_project_results_global_minimums(block_min, block_data)
-
-        project_results = ProjectResults(
+
+        return OutputParser.parse_stream(io.StringIO(content))
+
+    @staticmethod
+    def parse_stream(stream: Iterable[str]) -> ProjectResults:
+        """
+        Parsea el archivo de resultados (.s01) línea a línea.
+
+        El archivo se recorre una sola vez como una máquina de estados guiada
+        por los encabezados "* ..." (* Analysis names, * grid#, * Three Point
+        Surfaces, * Global Minimum FS, * Global Minimum Text, * #data,
+        * bolt data, * forces along bolt, ...),
+        sin guardar copias del texto, por lo que la memoria usada no depende
+        del tamaño del archivo.
+
+        Args:
+            stream: Archivo de texto abierto (o cualquier iterable de líneas),
+                por ejemplo un miembro del .slim abierto con zipfile
+        """
+        methods = []
+        surface_rows = array('d')
+        grid_centers = array('d')
+        grids = 0
+        minimum_rows = []
+        minimum_texts = []
+        slice_info = {}
+        slice_data = {}
+        bolt_columns = []
+        bolt_rows = {}
+        bolt_forces = {}
+
+        section = None
+        xc = yc = None
+        pending_rows = 0
+        slice_method = None
+        data_name = None
+        bolt_method = None
+        bolt_index = None
+
+        for raw_line in stream:
+            line = raw_line.strip()
+            if not line:
+                continue
+
+            # Encabezados de sección
+            #--------------------------------
+            if line.startswith('*'):
+                header = line[1:].strip()
+                section = OutputParser._classify_header(header)
+                if section == 'grid':
+                    pending_rows = 0
+                    grids += 1
+                elif section == 'slice info':
+                    # * minimum slice info(x,yt,yb loc.) method=<nombre>
+                    slice_method = header.split('method=', 1)[-1].strip()
+                    slice_info[slice_method] = array('d')
+                elif section == 'bolt rows':
+                    # * minimum bolt data(x1,y1,x2,y2,exists,...)
+                    bolt_columns = OutputParser._header_columns(header)
+                    bolt_rows[bolt_method] = []
+                elif section == 'bolt forces count':
+                    # * bolt #<n> (#forces)
+                    bolt_index = int(header[len('bolt #'):].split()[0]) - 1
+                    bolt_forces[bolt_index] = array('d')
+                continue
+
+            if line == '$end':
+                section = None
+                continue
+
+            # Contenido de cada sección
+            #--------------------------------
+            if section == 'names':
+                methods.append(Method(id=len(methods), name=line))
+
+            elif section == 'three':
+                # xc yc r yleft x1 y1 x2 y2 yright fs1 fs2 ... b1
+                OutputParser._append_surface_row(surface_rows, line.split(), len(methods))
+
+            elif section == 'grid':
+                parts = line.split()
+                if pending_rows > 0:
+                    # r yleft x1 y1 x2 y2 yright fs1 fs2 ... b1 (el centro viene del encabezado)
+                    OutputParser._append_surface_row(surface_rows, [xc, yc] + parts, len(methods))
+                    pending_rows -= 1
+                elif len(parts) == 3:
+                    # encabezado del centro: xc yc #superficies (también los centros sin superficies)
+                    xc, yc, pending_rows = float(parts[0]), float(parts[1]), int(parts[2])
+                    grid_centers.extend((xc, yc))
+
+            elif section == 'minimum':
+                minimum_rows.append(line.split())
+
+            elif section == 'minimum text':
+                OutputParser._parse_minimum_text_line(line, minimum_texts)
+
+            elif section == 'slice info':
+                slice_info[slice_method].extend(map(float, line.split()[:4]))
+
+            elif section == 'data name':
+                data_name = line
+
+            elif section == 'data':
+                # una columna por método
+                slice_data.setdefault(data_name, array('d')).extend(map(float, line.split()))
+
+            elif section == 'bolt method':
+                bolt_method = line
+
+            elif section == 'bolt rows':
+                bolt_rows[bolt_method].append([float(part) for part in line.split()])
+
+            elif section == 'bolt forces':
+                # xi yi force mode
+                bolt_forces[bolt_index].extend(map(float, line.split()[:4]))
+
+        slices = OutputParser._build_slice_arrays(methods, slice_info, slice_data)
+        global_minimums = OutputParser._build_global_minimums(minimum_rows, minimum_texts, slices)
+
+        # la grilla de centros solo se guarda si el archivo tiene una única grilla
+        centers = np.frombuffer(grid_centers, dtype=np.float64).reshape(-1, 2)
+        surface_table = SurfaceTable.from_rows(
+            rows = np.frombuffer(surface_rows, dtype=np.float64),
+            methods = [method.name for method in methods],
+            grid = CenterGrid.from_centers(centers[:, 0], centers[:, 1]) if grids == 1 else None
+        )
+
+        return ProjectResults(
             methods = methods,
-            surfaces = surfaces,
-            global_minimums = global_minimums
-            
+            surface_table = surface_table,
+            global_minimums = global_minimums,
+            supports = OutputParser._build_supports(bolt_columns, bolt_rows, bolt_forces)
         )
 
-        return project_results
-
-    def _parse_project_results_methods( content: str) -> list[Method]:
-        pattern = r"(?ms)^\*\s*(?P<key>.*?)\s*\n(?P<value>.*?)(?=^\*\s|\Z)"
-        matches = re.finditer(pattern, content)
-        data = {match.group("key"): match.group("value").strip() for match in matches}
-        list_methods = []
-        lines = data['Analysis names'].split('\n')
-        i = 0
-        for line in lines:
-            name =line
-            id_method = i
-            list_methods.append(Method(id=id_method,name=name))
-            i += 1
-        return list_methods
-       
-
-
-    def _parse_project_results_surfaces( content: str, methods: list[Method]) -> list[Surface]:        
-        methods = {method.id: method.name for method in methods}
-        lines = content.split('\n')
-
-        # Eliminar el primer  y ultimo caracter
-        surfaces = []
-
-        if lines[0] == '* grid#':
-            grid_pattern = r"(?ms)(\* grid#.*?)(?=^\* grid#|\Z)"
-            grid_blocks = [m.group(1).strip() for m in re.finditer(grid_pattern, content, re.MULTILINE)]
-            sub_pattern = r"(?ms)(^\d+\.\d+\s+\d+\.\d+\s+\d+)(.*?)(?=^\d+\.\d+\s+\d+\.\d+\s+\d+|\Z)"
-
-            for grid in grid_blocks:
-           
-                # Separamos los sub-bloques dentro del bloque actual:
-                sub_blocks = [ (m.group(1).strip(), m.group(2).strip()) 
-                            for m in re.finditer(sub_pattern, grid, re.MULTILINE) ]
-                for header, data in sub_blocks:
-                    line_header = header.split()
-                    xc = float(line_header[0])
-                    yc = float(line_header[1])
-                    num_surfaces = int(line_header[2])
-                    lines_data = data.split('\n')          
-                    for line_data in lines_data:
-                        parts = line_data.split()
-                        i= 0
-                        for j in range(7, len(parts)-1):
-                            fs = float(parts[j])
-                            method = methods[i]
-                            surfaces.append(Surface(
-                                method=method,
-                                radius=float(parts[0]),
-                                point1=Point(x=float(parts[2]), y=float(parts[3])),
-                                point2=Point(x=float(parts[4]), y=float(parts[5])),
-                                yleft=float(parts[1]),
-                                yright=float(parts[6]),
-                                fs=fs,
-                                point_center=Point(x=xc, y=yc),
-                                b1=parts[-1]
-                            ))        
-                            i += 1
-
-            
-        else:
-            
-            lines = lines[1:-1]
-            for line in lines:
-                parts = line.split() 
-                i = 0                         
-                for j in range(9, len(parts)-1):
-                    fs =float(parts[j])  
-                    method = methods[i]
-                    surfaces.append(Surface(
-                        method=method,
-                        radius=parts[2],
-                        point1=Point(x=parts[4], y=parts[5]),
-                        point2=Point(x=parts[6], y=parts[7]),
-                        yleft=parts[3],
-                        yright=parts[8],
-                        fs=fs,
-                        point_center=Point(x=parts[0], y=parts[1]),
-                        b1=parts[-1]
-                    ))
-                    i += 1
-
-        return surfaces
-
-
-    def _parse_project_results_global_minimums( content_min: str, content_data: str) -> list[GlobalMinimum]:                                             
-        pattern = r"(?ms)^\*\s*(?P<key>.*?)\s*\n(?P<value>.*?)(?=^\*\s|\Z)"
-        matches = re.finditer(pattern, content_min)
-        data = {match.group("key"): match.group("value").strip() for match in matches}
-        list_global_minimums = []
+    @staticmethod
+    def iter_surfaces(
+            stream: Iterable[str],
+            method: str | None = None,
+            fs_max: float | None = None
+            ) -> Iterator[Surface]:
+        """
+        Recorre las superficies de los bloques de grilla y de tres puntos del
+        archivo de resultados (.s01) a medida que se leen, sin construir la
+        tabla ni la lista de superficies (la memoria no depende del número de
+        superficies). La lectura termina al llegar a los mínimos globales.
+
+        Args:
+            stream: Archivo de texto abierto (o cualquier iterable de líneas)
+            method: Nombre del método (por defecto todos)
+            fs_max: Si se indica, solo las superficies con 0 < FS <= fs_max
+                (se omiten los códigos de error)
 
-        # procesamos la información de los mínimos globales → text
-        # ---------------------------------------------------------
-        lines_text = data['Global Minimum Text']
-        blocks = re.split(r"^\s*\d+\s*$", lines_text, flags=re.MULTILINE)
-        blocks = [b.strip() for b in blocks if b.strip()]
-        pattern = r"^(Resisting Moment|Driving Moment|Resisting Horizontal Force|Driving Horizontal Force)=(\d+(?:\.\d+)?)"
-        results_text = []
-        for block in blocks:
-            pairs = re.findall(pattern, block, flags=re.MULTILINE)
+        Devuelve:
+            Iterator[Surface]: Superficies en el orden del archivo (por fila, un
+                Surface por método con FS)
+        """
+        names = []
+        columns = None
+        section = None
+        xc = yc = None
+        pending_rows = 0
+
+        for raw_line in stream:
+            line = raw_line.strip()
+            if not line:
+                continue
+
+            if line.startswith('*'):
+                section = OutputParser._classify_header(line[1:].strip())
+                if section == 'grid':
+                    pending_rows = 0
+                elif section == 'minimum':
+                    # las superficies están antes de los mínimos globales
+                    return
+                continue
+
+            if line == '$end':
+                section = None
+                continue
+
+            if section == 'names':
+                names.append(line)
+                columns = None
+                continue
+
+            if section == 'three':
+                parts = line.split()
+            elif section == 'grid':
+                parts = line.split()
+                if pending_rows <= 0:
+                    if len(parts) == 3:
+                        xc, yc, pending_rows = float(parts[0]), float(parts[1]), int(parts[2])
+                    continue
+                # r yleft x1 y1 x2 y2 yright fs1 ... b1 (el centro viene del encabezado)
+                parts[:0] = (xc, yc)
+                pending_rows -= 1
+            else:
+                continue
+
+            if columns is None:
+                columns = OutputParser._method_columns(names, method)
+                width = len(SurfaceTable.COLUMNS) + len(names) + 1
+            if len(parts) != width:
+                parts = OutputParser._surface_row(parts, len(names))
+            # solo se convierte la fila completa si algún FS pasa el filtro
+            for column in columns:
+                fs = float(parts[len(SurfaceTable.COLUMNS) + column])
+                if fs != fs or (fs_max is not None and not 0.0 < fs <= fs_max):
+                    continue
+                yield Surface(
+                    method=names[column],
+                    radius=float(parts[2]),
+                    point1=Point(x=float(parts[4]), y=float(parts[5])),
+                    point2=Point(x=float(parts[6]), y=float(parts[7])),
+                    yleft=float(parts[3]),
+                    yright=float(parts[8]),
+                    fs=fs,
+                    point_center=Point(x=float(parts[0]), y=float(parts[1])),
+                    b1=float(parts[-1])
+                )
+
+    def _method_columns(names: list[str], method: str | None) -> list[int]:
+        """Columnas de fs a recorrer (todas o la del método)"""
+        if method is None:
+            return list(range(len(names)))
+        name = method.strip().lower()
+        if name not in names:
+            raise KeyError(f"Método sin resultados: {method} (disponibles: {', '.join(names)})")
+        return [names.index(name)]
+
+    def _classify_header(header: str) -> str | None:
+        """Identifica la sección a partir del texto de su encabezado"""
+        if header == 'Analysis names':
+            return 'names'
+        if header.startswith('grid#'):
+            return 'grid'
+        if header.startswith('Three Point Surfaces'):
+            return 'three'
+        if header.startswith('Global Minimum FS'):
+            return 'minimum'
+        if header == 'Global Minimum Text':
+            return 'minimum text'
+        if header.startswith('minimum slice info'):
+            return 'slice info'
+        if header == 'name':
+            return 'data name'
+        if header == 'data':
+            return 'data'
+        if header == 'method':
+            return 'bolt method'
+        if header.startswith('minimum bolt data'):
+            return 'bolt rows'
+        if header.startswith('bolt #'):
+            return 'bolt forces count'
+        if header.startswith('forces along bolt'):
+            return 'bolt forces'
+        return None
+
+    def _header_columns(header: str) -> list[str]:
+        """Nombres entre paréntesis de un encabezado, por ejemplo "datos(x1,y1,x2)" """
+        inside = header[header.find('(') + 1:header.rfind(')')]
+        return [name.strip() for name in inside.split(',') if name.strip()]
+
+    def _append_surface_row(surface_rows: array, parts: list, num_methods: int) -> None:
+        """
+        Agrega una fila xc yc r yleft x1 y1 x2 y2 yright fs1 ... fsn b1 a la
+        tabla de superficies. Si la fila trae menos factores de seguridad que
+        métodos, los faltantes quedan como NaN
+        """
+        if len(parts) == len(SurfaceTable.COLUMNS) + num_methods + 1:
+            surface_rows.extend(map(float, parts))
+            return
+        surface_rows.extend(OutputParser._surface_row(parts, num_methods))
+
+    def _surface_row(parts: list, num_methods: int) -> list[float]:
+        """Fila xc yc r yleft x1 y1 x2 y2 yright fs1 ... fsn b1, completando con NaN los fs faltantes"""
+        values = [float(part) for part in parts]
+        if len(values) == len(SurfaceTable.COLUMNS) + num_methods + 1:
+            return values
+        fs = values[len(SurfaceTable.COLUMNS):-1][:num_methods]
+        fs += [float('nan')] * (num_methods - len(fs))
+        return values[:len(SurfaceTable.COLUMNS)] + fs + values[-1:]
+
+    def _parse_minimum_text_line(line: str, minimum_texts: list[dict]) -> None:
+        """
+        Línea del bloque "* Global Minimum Text". Cada mínimo empieza con una
+        línea con el número de términos, seguida de líneas "Término=valor unidad"
+        """
+        if line.isdigit() or not minimum_texts:
             # Inicializamos todas las claves a None
-            d = {
+            minimum_texts.append({
                 "Resisting Moment": None,
                 "Driving Moment": None,
                 "Resisting Horizontal Force": None,
                 "Driving Horizontal Force": None
-            }
-            for key, value in pairs:
-                d[key] = float(value)
-            results_text.append(d)
+            })
+            if line.isdigit():
+                return
+
+        match = _EQUILIBRIUM_PATTERN.match(line)
+        if match:
+            minimum_texts[-1][match.group(1)] = float(match.group(2))
+
+    def _build_slice_arrays(
+            methods: list[Method],
+            slice_info: dict[str, array],
+            slice_data: dict[str, array]
+            ) -> dict[str, SliceArrays]:
+        """
+        Arma las rebanadas de cada método a partir de los bloques
+        "* minimum slice info" (x, yt, yb, loc) y de los registros "* #data"
+        (una columna por método)
+        """
+        num_methods = len(methods)
+        slices = {}
+        for method in methods:
+            columns = {}
+            extra = {}
+
+            info = slice_info.get(method.name)
+            if info is not None:
+                info = np.frombuffer(info, dtype=np.float64).reshape(-1, 4)
+                for i, name in enumerate(('x', 'yt', 'yb', 'loc')):
+                    columns[name] = np.ascontiguousarray(info[:, i])
 
+            for data_name, values in slice_data.items():
+                if num_methods == 0 or len(values) % num_methods:
+                    continue
+                values = np.frombuffer(values, dtype=np.float64).reshape(-1, num_methods)
+                name = SliceArrays.field_name(data_name)
+                target = columns if name in SliceArrays.__dataclass_fields__ and name != 'extra' else extra
+                target[name] = np.ascontiguousarray(values[:, method.id])
 
-        # procesamos la información de los mínimos globales → fs
-        # ---------------------------------------------------------
-        lines_fs = data['Global Minimum FS (xc,yc,r,x1,y1,x2,y2,fs,name)'].split('\n')
-        for i, line in enumerate(lines_fs):
+            if columns or extra:
+                slices[method.name] = SliceArrays(extra=extra, **columns)
+
+        return slices
+
+    def _build_supports(
+            columns: list[str],
+            bolt_rows: dict[str, list[list[float]]],
+            bolt_forces: dict[int, array]
+            ) -> SupportResults | None:
+        """
+        Arma los resultados de los soportes a partir de los bloques
+        "* minimum bolt data" (uno por método) y "* forces along bolt" (uno por soporte)
+        """
+        if not bolt_rows and not bolt_forces:
+            return None
+
+        methods = list(bolt_rows)
+        num_supports = max([len(rows) for rows in bolt_rows.values()] + [max(bolt_forces, default=-1) + 1])
+        width = max([len(row) for rows in bolt_rows.values() for row in rows] + [len(columns)])
+        # las filas pueden traer más valores que los nombrados en el encabezado
+        columns = columns + [f'col{i}' for i in range(len(columns), width)]
+
+        bolt_data = np.full((len(methods), num_supports, width), np.nan)
+        for i, method in enumerate(methods):
+            for j, row in enumerate(bolt_rows[method]):
+                bolt_data[i, j, :len(row)] = row
+
+        counts = [len(bolt_forces.get(i, ())) // 4 for i in range(num_supports)]
+        force_offsets = np.zeros(num_supports + 1, dtype=np.int64)
+        np.cumsum(counts, out=force_offsets[1:])
+
+        values = array('d')
+        for i in range(num_supports):
+            values.extend(bolt_forces.get(i, array('d'))[:counts[i] * 4])
+        values = np.frombuffer(values, dtype=np.float64).reshape(-1, 4)
+
+        return SupportResults(
+            methods = methods,
+            columns = columns,
+            bolt_data = bolt_data,
+            force_offsets = force_offsets,
+            force_xi = np.ascontiguousarray(values[:, 0]),
+            force_yi = np.ascontiguousarray(values[:, 1]),
+            force = np.ascontiguousarray(values[:, 2]),
+            force_mode = np.ascontiguousarray(values[:, 3])
+        )
+
+    def _build_global_minimums(
+            minimum_rows: list[list[str]],
+            minimum_texts: list[dict],
+            slices: dict[str, SliceArrays]
+            ) -> list[GlobalMinimum]:
+        """Combina las filas de "* Global Minimum FS" con sus términos de equilibrio"""
+        list_global_minimums = []
+        for i, parts in enumerate(minimum_rows):
 
             # 1.
-            parts = line.split()       
-            method = ' '.join(parts[8:]) 
-            
+            method = ' '.join(parts[8:])
+
             # 2.
-            surface = Surface( 
+            surface = Surface(
                 method=method,
                 radius=float(parts[2]),
                 point1=Point(x=float(parts[3]), y=float(parts[4])),
@@ -193,26 +429,21 @@ class OutputParser:
                 point_center=Point(x=float(parts[0]), y=float(parts[1])),
                 b1=None
             )
-            
-            # 3.
-            resisting_moment = results_text[i]["Resisting Moment"]
-            driving_moment = results_text[i]["Driving Moment"]
-            resisting_force = results_text[i]["Resisting Horizontal Force"]
-            driving_force = results_text[i]["Driving Horizontal Force"]
 
+            # 3.
+            text = minimum_texts[i] if i < len(minimum_texts) else {}
             equilibriums =  EquilibriumTerms(
-                resisting_moment=resisting_moment,
-                driving_moment=driving_moment,
-                resisting_force=resisting_force,
-                driving_force=driving_force
+                resisting_moment=text.get("Resisting Moment"),
+                driving_moment=text.get("Driving Moment"),
+                resisting_force=text.get("Resisting Horizontal Force"),
+                driving_force=text.get("Driving Horizontal Force")
             )
 
             # 4.
-   
-            list_global_minimums.append(GlobalMinimum(    
+            list_global_minimums.append(GlobalMinimum(
                 surface=surface,
-                equilibrium_terms=equilibriums
+                equilibrium_terms=equilibriums,
+                slice_data=slices.get(method)
             ))
-                    
+
         return list_global_minimums
-     
\ No newline at end of file
@@ -1,5 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List
+import numpy as np
 
 #####################################
 #       clase base
@@ -67,6 +68,127 @@ class Support:
     point2: Point
     property_id: str  # Referencia a property.support
 
+@dataclass(eq=False)
+class GeometryArrays:
+    """
+    Clase GeometryArrays que guarda la geometría en arreglos de NumPy.
+
+    Las celdas se guardan en formato CSR: los vértices de la celda i son
+    cell_vertices[cell_offsets[i]:cell_offsets[i+1]]. Todos los índices
+    son posiciones (desde 0) en el arreglo vertices, no ids del .sli.
+    Atributos:
+    ----------
+        vertex_ids (np.ndarray): Id de cada vértice, (n,).
+        vertices (np.ndarray): Coordenadas x, y de cada vértice, (n, 2).
+        cell_ids (np.ndarray): Id de cada celda, (m,).
+        cell_offsets (np.ndarray): Inicio de los vértices de cada celda, (m + 1,).
+        cell_vertices (np.ndarray): Índices de los vértices de todas las celdas, concatenados.
+        cell_material (np.ndarray): Código del material de cada celda, índice en materials, (m,).
+        materials (list[str]): Id del material (property_id) de cada código.
+        exterior (np.ndarray): Índices de los vértices del exterior.
+        slope (np.ndarray): Índices de los vértices de la pendiente.
+        water_table (np.ndarray): Índices de los vértices del nivel freático.
+    """
+    vertex_ids: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    vertices: np.ndarray = field(default_factory=lambda: np.empty((0, 2)))
+    cell_ids: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    cell_offsets: np.ndarray = field(default_factory=lambda: np.zeros(1, dtype=np.int64))
+    cell_vertices: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    cell_material: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32))
+    materials: list[str] = field(default_factory=list)
+    exterior: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    slope: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    water_table: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+
+    ARRAYS = ('vertex_ids', 'vertices', 'cell_ids', 'cell_offsets', 'cell_vertices',
+              'cell_material', 'exterior', 'slope', 'water_table')
+
+    @property
+    def num_vertices(self) -> int:
+        return len(self.vertices)
+
+    @property
+    def num_cells(self) -> int:
+        return len(self.cell_ids)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, GeometryArrays):
+            return NotImplemented
+        return self.materials == other.materials and all(
+            np.array_equal(getattr(self, name), getattr(other, name)) for name in self.ARRAYS
+        )
+
+    def cell(self, index: int) -> np.ndarray:
+        """Índices de los vértices de la celda index (vista sin copia)"""
+        return self.cell_vertices[self.cell_offsets[index]:self.cell_offsets[index + 1]]
+
+    def cell_coords(self, index: int) -> np.ndarray:
+        """Coordenadas (k, 2) de los vértices de la celda index"""
+        return self.vertices[self.cell(index)]
+
+    def cell_sizes(self) -> np.ndarray:
+        """Número de vértices de cada celda"""
+        return np.diff(self.cell_offsets)
+
+    @classmethod
+    def from_objects(
+            cls,
+            vertex: List[Vertex],
+            cells: List[Cell],
+            exterior: List[Vertex] = (),
+            slope: List[Vertex] = (),
+            water_table: List[Vertex] = ()
+            ) -> "GeometryArrays":
+        """
+        Construye los arreglos a partir de listas de objetos Vertex y Cell
+        (los vértices de las celdas y de las polilíneas se buscan por id en vertex)
+        """
+        position = {v.id: i for i, v in enumerate(vertex)}
+        materials = list(dict.fromkeys(cell.property_id for cell in cells))
+        code = {material: i for i, material in enumerate(materials)}
+
+        def indices(points) -> np.ndarray:
+            return np.array([position[v.id] for v in points], dtype=np.int64)
+
+        sizes = [len(cell.vertices) for cell in cells]
+        return cls(
+            vertex_ids=np.array([v.id for v in vertex], dtype=np.int64),
+            vertices=np.array([(v.point.x, v.point.y) for v in vertex], dtype=np.float64).reshape(-1, 2),
+            cell_ids=np.array([cell.id for cell in cells], dtype=np.int64),
+            cell_offsets=np.concatenate([[0], np.cumsum(sizes, dtype=np.int64)]).astype(np.int64),
+            cell_vertices=indices([v for cell in cells for v in cell.vertices]),
+            cell_material=np.array([code[cell.property_id] for cell in cells], dtype=np.int32),
+            materials=materials,
+            exterior=indices(exterior),
+            slope=indices(slope),
+            water_table=indices(water_table)
+        )
+
+    def material_of(self, index: int) -> str:
+        """Id del material de la celda index"""
+        return self.materials[self.cell_material[index]]
+
+    def to_vertices(self) -> list[Vertex]:
+        """Construye la lista de objetos Vertex"""
+        return [
+            Vertex(id=vertex_id, point=Point(x=x, y=y))
+            for vertex_id, (x, y) in zip(self.vertex_ids.tolist(), self.vertices.tolist())
+        ]
+
+    def to_cells(self, vertices: list[Vertex]) -> list[Cell]:
+        """Construye la lista de objetos Cell, compartiendo los Vertex de vertices"""
+        offsets = self.cell_offsets.tolist()
+        indices = self.cell_vertices.tolist()
+        return [
+            Cell(
+                id=cell_id,
+                vertices=[vertices[j] for j in indices[offsets[i]:offsets[i + 1]]],
+                property_id=self.materials[code]
+            )
+            for i, (cell_id, code) in enumerate(zip(self.cell_ids.tolist(), self.cell_material.tolist()))
+        ]
+
+
 #####################################
 #       clase principal
 #####################################
@@ -76,20 +198,252 @@ class ProjectGeometry:
     """
     Clase que representa la geometría de un proyecto.
 
+    La geometría se guarda en arrays (GeometryArrays); las listas de objetos
+    Vertex y Cell se construyen a partir de ellos la primera vez que se accede.
+    Para crearla desde las listas de objetos se usa ProjectGeometry.from_lists.
+
     Atributos:
     ----------
+        arrays (GeometryArrays): Geometría en arreglos de NumPy.
+        supports (List[Support]): Lista de soportes que definen la geometría.
+        limits (tuple[Point, Point]|None): Límites de la geometría.
         vertex (List[Vertex]): Lista de vértices que definen la geometría.
         cells (List[Cell]): Lista de celdas que definen la geometría.
-        supports (List[Support]): Lista de soportes que definen la geometría.
         water_table_vertex (List[Vertex]): Lista de vértices que definen la tabla de agua.
-        limits (tuple[Point, Point]|None): Límites de la geometría.
         slope (List[Vertex]): Lista de vértices que definen la pendiente de la geometría.
         exterior (List[Vertex]): Lista de vértices que definen el exterior de la geometría.
     """
-    vertex: List[Vertex]
-    cells: List[Cell]
+    arrays: GeometryArrays
     supports: List[Support]
-    water_table_vertex: List[Vertex]    
     limits: tuple[Point, Point]|None
-    slope: List[Vertex]
-    exterior: List[Vertex]
\ No newline at end of file
+    _vertex: List[Vertex] | None = field(default=None, init=False, repr=False, compare=False)
+    _cells: List[Cell] | None = field(default=None, init=False, repr=False, compare=False)
+    _spatial_index: object = field(default=None, init=False, repr=False, compare=False)
+    _topology: object = field(default=None, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_lists(
+            cls,
+            vertex: List[Vertex],
+            cells: List[Cell],
+            supports: List[Support],
+            water_table_vertex: List[Vertex],
+            limits: tuple[Point, Point]|None,
+            slope: List[Vertex],
+            exterior: List[Vertex]
+            ) -> "ProjectGeometry":
+        """
+        Crea la geometría a partir de las listas de objetos, con los mismos
+        argumentos que el constructor anterior a GeometryArrays. Las listas
+        recibidas se conservan como vertex y cells.
+        """
+        geometry = cls(
+            arrays=GeometryArrays.from_objects(vertex, cells, exterior, slope, water_table_vertex),
+            supports=supports,
+            limits=limits
+        )
+        geometry._vertex = list(vertex)
+        geometry._cells = list(cells)
+        return geometry
+
+    @property
+    def vertex(self) -> List[Vertex]:
+        if self._vertex is None:
+            self._vertex = self.arrays.to_vertices()
+        return self._vertex
+
+    @property
+    def cells(self) -> List[Cell]:
+        if self._cells is None:
+            self._cells = self.arrays.to_cells(self.vertex)
+        return self._cells
+
+    @property
+    def water_table_vertex(self) -> List[Vertex]:
+        return self._vertices_at(self.arrays.water_table)
+
+    @property
+    def slope(self) -> List[Vertex]:
+        return self._vertices_at(self.arrays.slope)
+
+    @property
+    def exterior(self) -> List[Vertex]:
+        return self._vertices_at(self.arrays.exterior)
+
+    def _vertices_at(self, indices: np.ndarray) -> List[Vertex]:
+        vertex = self.vertex
+        return [vertex[i] for i in indices.tolist()]
+
+    @property
+    def spatial_index(self) -> "CellGrid":
+        """Índice espacial de las celdas, construido al primer acceso"""
+        if self._spatial_index is None:
+            from ..analysis.spatial import CellGrid
+            self._spatial_index = CellGrid(
+                self.arrays.vertices, self.arrays.cell_offsets, self.arrays.cell_vertices)
+        return self._spatial_index
+
+    def cell_at(self, xs, ys) -> np.ndarray:
+        """
+        Índice de la celda (en arrays) que contiene cada punto, -1 si está fuera
+
+        Args:
+            xs, ys: Coordenadas de los puntos (escalares o arreglos)
+        """
+        return self.spatial_index.locate(xs, ys)
+
+    def material_at(self, xs, ys) -> np.ndarray:
+        """
+        Id del material (PropertyMaterial.id) en cada punto, None si está fuera
+        de la geometría
+
+        Args:
+            xs, ys: Coordenadas de los puntos (escalares o arreglos)
+        """
+        codes = self.material_code_at(xs, ys)
+        names = np.array(self.arrays.materials + [None], dtype=object)
+        return names[codes]
+
+    def material_code_at(self, xs, ys) -> np.ndarray:
+        """
+        Código del material (índice en arrays.materials) en cada punto, -1 si
+        está fuera de la geometría
+
+        Args:
+            xs, ys: Coordenadas de los puntos (escalares o arreglos)
+        """
+        cells = self.cell_at(xs, ys)
+        codes = np.full(cells.shape, -1, dtype=np.int64)
+        found = cells >= 0
+        codes[found] = self.arrays.cell_material[cells[found]]
+        return codes
+
+    # Topología  -------------------------------------------------
+    @property
+    def topology(self) -> "MeshTopology":
+        """Estructura de semiaristas de las celdas, construida al primer acceso"""
+        if self._topology is None:
+            from ..analysis.topology import MeshTopology
+            self._topology = MeshTopology(
+                self.arrays.num_vertices, self.arrays.cell_offsets,
+                self.arrays.cell_vertices, self.arrays.cell_material)
+        return self._topology
+
+    def neighbors(self, cell: int) -> np.ndarray:
+        """Índices de las celdas que comparten una arista con la celda cell"""
+        return self.topology.neighbors(cell)
+
+    def material_boundaries(self, include_exterior: bool = False) -> dict[tuple[str | None, str | None], list[np.ndarray]]:
+        """
+        Polilíneas de las fronteras entre materiales
+
+        Args:
+            include_exterior: Si es True se incluye el borde de la malla (material None)
+
+        Devuelve:
+            dict: (material, material) => lista de polilíneas, cada una un
+                arreglo (k, 2) de coordenadas
+        """
+        names = self.arrays.materials
+        boundaries = {}
+        for (low, high), chains in self.topology.material_boundaries(include_exterior).items():
+            key = (names[low] if low >= 0 else None, names[high] if high >= 0 else None)
+            boundaries[key] = [self.arrays.vertices[chain] for chain in chains]
+        return boundaries
+
+    def regions(self, by_material: bool = False) -> np.ndarray:
+        """
+        Región conexa de cada celda (0, 1, ...)
+
+        Args:
+            by_material: Si es True solo se unen celdas vecinas del mismo material
+        """
+        return self.topology.regions(by_material)
+
+    def validate_topology(self, tolerance: float = 1e-9) -> "TopologyReport":
+        """
+        Valida la malla: celdas abiertas o degeneradas, vértices duplicados o
+        huérfanos (sin celda, exterior, pendiente ni nivel freático) y aristas
+        compartidas por más de dos celdas
+
+        Args:
+            tolerance: Distancia bajo la cual dos vértices se consideran iguales
+        """
+        arrays = self.arrays
+        referenced = np.concatenate([arrays.exterior, arrays.slope, arrays.water_table])
+        return self.topology.validate(arrays.vertices, tolerance, referenced)
+
+    # Cantidades derivadas  -------------------------------------------------
+    def cell_areas(self) -> np.ndarray:
+        """Área de cada celda, (m,)"""
+        from ..analysis.measures import cell_areas
+        return cell_areas(self.arrays.vertices, self.arrays.cell_offsets, self.arrays.cell_vertices)
+
+    def cell_centroids(self) -> np.ndarray:
+        """Centroide de cada celda, (m, 2)"""
+        from ..analysis.measures import cell_centroids
+        return cell_centroids(self.arrays.vertices, self.arrays.cell_offsets, self.arrays.cell_vertices)
+
+    def cell_bounds(self) -> np.ndarray:
+        """Caja envolvente de cada celda, (m, 4) con xmin, ymin, xmax, ymax"""
+        from ..analysis.measures import cell_bounds
+        return cell_bounds(self.arrays.vertices, self.arrays.cell_offsets, self.arrays.cell_vertices)
+
+    def material_areas(self) -> dict[str, float]:
+        """Área total de cada material (id del material => área)"""
+        from ..analysis.measures import material_totals
+        totals = material_totals(self.cell_areas(), self.arrays.cell_material, len(self.arrays.materials))
+        return dict(zip(self.arrays.materials, totals.tolist()))
+
+    def material_weights(self, properties: "ProjectProperties") -> dict[str, float]:
+        """
+        Peso total de cada material por unidad de espesor (área por
+        PropertyMaterial.unit_weight)
+
+        Args:
+            properties: Propiedades del proyecto
+
+        Devuelve:
+            dict[str, float]: id del material => peso (NaN si el material no
+                está en properties)
+        """
+        unit_weights = {material.id: material.unit_weight for material in properties.materials}
+        return {
+            material_id: area * unit_weights.get(material_id, float('nan'))
+            for material_id, area in self.material_areas().items()
+        }
+
+    def exterior_length(self) -> float:
+        """Perímetro del contorno exterior"""
+        from ..analysis.measures import polyline_length
+        return polyline_length(self.arrays.vertices, self.arrays.exterior, closed=True)
+
+    def slope_length(self) -> float:
+        """Longitud de la polilínea de la pendiente"""
+        from ..analysis.measures import polyline_length
+        return polyline_length(self.arrays.vertices, self.arrays.slope)
+
+    def intersect_circles(self, xc, yc, radius, direction: str = 'left to right') -> "CircleIntersections":
+        """
+        Intersección de N círculos de falla con la pendiente, en una sola
+        pasada de NumPy
+
+        Args:
+            xc, yc, radius: Centro y radio de cada círculo, (N,)
+            direction: Sentido de la falla (ProjectMetadata.direction)
+
+        Devuelve:
+            CircleIntersections: Entrada, salida, longitud del arco y área de
+                la masa deslizante de cada círculo
+        """
+        from ..analysis.intersections import intersect_circles
+        return intersect_circles(xc, yc, radius, self.arrays.vertices[self.arrays.slope], direction)
+
+    def __getstate__(self) -> dict:
+        # las listas de objetos, el índice espacial y la topología se reconstruyen desde los arrays
+        state = self.__dict__.copy()
+        state['_vertex'] = None
+        state['_cells'] = None
+        state['_spatial_index'] = None
+        state['_topology'] = None
+        return state
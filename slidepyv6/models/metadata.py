@@ -51,4 +51,21 @@ class ProjectMetadata:
 
     # Seismic
     seismic: float
-    seismicv: float
\ No newline at end of file
+    seismicv: float
+
+@dataclass
+class ProjectSummary:
+    """
+    Clase para almacenar el resumen de un proyecto obtenido sin parsearlo completo.
+
+    Attributes:
+    ----------
+        path (str): Ruta al archivo .slim.
+        metadata (ProjectMetadata): Metadata del proyecto.
+        has_results (bool): Indica si el proyecto tiene archivo de resultados (.s01).
+        member_sizes (dict[str, int]): Tamaño sin comprimir de cada archivo del proyecto.
+    """
+    path: str
+    metadata: ProjectMetadata
+    has_results: bool
+    member_sizes: dict[str, int]
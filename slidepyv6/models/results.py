@@ -1,5 +1,17 @@
-from dataclasses import dataclass
-from .geometries import Point
+from dataclasses import dataclass, field
+from .geometries import Point, ProjectGeometry, Support
+from .properties import ProjectProperties, PropertySupport
+from typing import Iterator
+import numpy as np
+
+# Filas de la tabla que se filtran a la vez en ProjectResults.iter_surfaces
+_ITER_CHUNK = 1 << 16
+
+# Decimales con los que se comparan las coordenadas de los centros
+_CENTER_DECIMALS = 8
+
+# Máximo de posiciones por coordenada distinta al completar una grilla regular
+_MAX_GRID_FILL = 4
 
 
 #####################################
@@ -45,6 +57,227 @@ class Surface:
     b1: float | None
 
 
+@dataclass(eq=False)
+class CenterGrid:
+    """
+    Clase CenterGrid con la grilla rectangular de centros de una búsqueda en
+    grilla, incluidos los centros sin superficies.
+    Atributos:
+    ----------
+        x (np.ndarray): Coordenadas x de las columnas, crecientes, (nx,).
+        y (np.ndarray): Coordenadas y de las filas, crecientes, (ny,).
+    """
+    x: np.ndarray
+    y: np.ndarray
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self.y), len(self.x)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CenterGrid):
+            return NotImplemented
+        return np.array_equal(self.x, other.x) and np.array_equal(self.y, other.y)
+
+    @classmethod
+    def from_centers(cls, xc, yc) -> "CenterGrid | None":
+        """
+        Grilla de un conjunto de centros, o None si no forman una grilla
+        rectangular completa (cada x con cada y)
+
+        Args:
+            xc, yc: Coordenadas de los centros
+        """
+        xc = np.round(np.asarray(xc, dtype=np.float64), _CENTER_DECIMALS)
+        yc = np.round(np.asarray(yc, dtype=np.float64), _CENTER_DECIMALS)
+        x, ix = np.unique(xc, return_inverse=True)
+        y, iy = np.unique(yc, return_inverse=True)
+        if len(x) == 0 or len(np.unique(iy.ravel() * len(x) + ix.ravel())) != len(x) * len(y):
+            return None
+        return cls(x=x, y=y)
+
+    @classmethod
+    def infer(cls, xc, yc) -> "CenterGrid":
+        """
+        Grilla de los centros cuando no se conoce la de la búsqueda: en cada
+        eje, si las coordenadas distintas son múltiplos de un paso se completan
+        las posiciones faltantes (centros sin superficies); si no, se usan las
+        coordenadas distintas tal cual
+
+        Args:
+            xc, yc: Coordenadas de los centros
+        """
+        return cls(x=_regular_axis(xc), y=_regular_axis(yc))
+
+    def locate(self, xc, yc) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Fila y columna de la grilla de cada centro (-1 si no está en la grilla)
+
+        Args:
+            xc, yc: Coordenadas de los centros
+        """
+        return (_axis_index(self.y, np.round(np.asarray(yc, dtype=np.float64), _CENTER_DECIMALS)),
+                _axis_index(self.x, np.round(np.asarray(xc, dtype=np.float64), _CENTER_DECIMALS)))
+
+
+def _regular_axis(values) -> np.ndarray:
+    """Coordenadas distintas de un eje, completadas con el paso mínimo si son regulares"""
+    axis = np.unique(np.round(np.asarray(values, dtype=np.float64), _CENTER_DECIMALS))
+    if len(axis) < 3:
+        return axis
+    step = np.diff(axis).min()
+    position = (axis - axis[0]) / step
+    count = int(round(position[-1])) + 1
+    if count > _MAX_GRID_FILL * len(axis) or not np.allclose(position, np.round(position), rtol=0.0, atol=1e-6):
+        return axis
+    # las posiciones faltantes se interpolan entre los extremos (menos error que con el paso mínimo)
+    missing = np.setdiff1d(np.arange(count), np.round(position).astype(np.int64))
+    filled = axis[0] + (axis[-1] - axis[0]) * missing / (count - 1)
+    return np.sort(np.concatenate([axis, np.round(filled, _CENTER_DECIMALS)]))
+
+
+def _axis_index(axis: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Posición de cada valor (redondeado) en el eje ordenado, -1 si no está"""
+    if len(axis) == 0:
+        return np.full(values.shape, -1, dtype=np.int64)
+    index = np.clip(np.searchsorted(axis, values), 0, len(axis) - 1)
+    return np.where(axis[index] == values, index, -1)
+
+
+@dataclass(eq=False)
+class SurfaceTable:
+    """
+    Clase SurfaceTable que guarda las superficies de falla en columnas
+    (arreglos contiguos de NumPy), una fila por superficie de prueba.
+    Atributos:
+    ----------
+        methods (list[str]): Nombre de los métodos, en el orden de las columnas de fs.
+        xc (np.ndarray): Coordenada x del centro.
+        yc (np.ndarray): Coordenada y del centro.
+        radius (np.ndarray): Radio de la superficie.
+        x1 (np.ndarray): Coordenada x del primer punto.
+        y1 (np.ndarray): Coordenada y del primer punto.
+        x2 (np.ndarray): Coordenada x del segundo punto.
+        y2 (np.ndarray): Coordenada y del segundo punto.
+        yleft (np.ndarray): Coordenada y del punto izquierdo.
+        yright (np.ndarray): Coordenada y del punto derecho.
+        b1 (np.ndarray): Parámetro b1.
+        fs (np.ndarray): Factores de seguridad, matriz (n_superficies, n_metodos).
+        grid (CenterGrid | None): Grilla de centros de la búsqueda (None si
+            las superficies no vienen de una única grilla rectangular).
+    """
+    methods: list[str]
+    xc: np.ndarray
+    yc: np.ndarray
+    radius: np.ndarray
+    x1: np.ndarray
+    y1: np.ndarray
+    x2: np.ndarray
+    y2: np.ndarray
+    yleft: np.ndarray
+    yright: np.ndarray
+    b1: np.ndarray
+    fs: np.ndarray
+    grid: CenterGrid | None = None
+
+    # Columnas por superficie (sin fs), en el orden del archivo .s01
+    COLUMNS = ('xc', 'yc', 'radius', 'yleft', 'x1', 'y1', 'x2', 'y2', 'yright')
+
+    @classmethod
+    def from_rows(cls, rows: np.ndarray, methods: list[str], grid: CenterGrid | None = None) -> "SurfaceTable":
+        """
+        Crea la tabla a partir de una matriz de filas con el formato
+        xc yc r yleft x1 y1 x2 y2 yright fs1 ... fsn b1
+
+        Args:
+            rows: Matriz (n_superficies, 10 + n_metodos)
+            methods: Nombre de los métodos
+            grid: Grilla de centros de la búsqueda
+        """
+        rows = np.asarray(rows, dtype=np.float64).reshape(-1, len(cls.COLUMNS) + len(methods) + 1)
+        columns = {name: np.ascontiguousarray(rows[:, i]) for i, name in enumerate(cls.COLUMNS)}
+        return cls(
+            methods=list(methods),
+            b1=np.ascontiguousarray(rows[:, -1]),
+            fs=np.ascontiguousarray(rows[:, len(cls.COLUMNS):-1]),
+            grid=grid,
+            **columns
+        )
+
+    def __len__(self) -> int:
+        return len(self.radius)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, SurfaceTable):
+            return NotImplemented
+        return self.methods == other.methods and self.grid == other.grid and all(
+            np.array_equal(getattr(self, name), getattr(other, name), equal_nan=True)
+            for name in self.COLUMNS + ('b1', 'fs')
+        )
+
+    def to_surfaces(self) -> list[Surface]:
+        """
+        Construye la lista de objetos Surface, una por superficie y método
+        (las columnas de fs vacías, NaN, se omiten)
+        """
+        surfaces = []
+        xc, yc, radius = self.xc.tolist(), self.yc.tolist(), self.radius.tolist()
+        x1, y1, x2, y2 = self.x1.tolist(), self.y1.tolist(), self.x2.tolist(), self.y2.tolist()
+        yleft, yright, b1 = self.yleft.tolist(), self.yright.tolist(), self.b1.tolist()
+        for i, row_fs in enumerate(self.fs.tolist()):
+            point_center = Point(x=xc[i], y=yc[i])
+            point1 = Point(x=x1[i], y=y1[i])
+            point2 = Point(x=x2[i], y=y2[i])
+            for method, fs in zip(self.methods, row_fs):
+                if fs != fs:
+                    continue
+                surfaces.append(Surface(
+                    method=method,
+                    radius=radius[i],
+                    point1=point1,
+                    point2=point2,
+                    yleft=yleft[i],
+                    yright=yright[i],
+                    fs=fs,
+                    point_center=point_center,
+                    b1=b1[i]
+                ))
+        return surfaces
+
+    def surface(self, row: int, method: str) -> Surface:
+        """
+        Superficie de una fila de la tabla para un método
+
+        Args:
+            row: Fila de la tabla
+            method: Nombre del método (columna de fs)
+        """
+        return Surface(
+            method=method,
+            radius=float(self.radius[row]),
+            point1=Point(x=float(self.x1[row]), y=float(self.y1[row])),
+            point2=Point(x=float(self.x2[row]), y=float(self.y2[row])),
+            yleft=float(self.yleft[row]),
+            yright=float(self.yright[row]),
+            fs=float(self.fs[row, self.methods.index(method)]),
+            point_center=Point(x=float(self.xc[row]), y=float(self.yc[row])),
+            b1=float(self.b1[row])
+        )
+
+    def intersect(self, geometry: ProjectGeometry, direction: str = 'left to right') -> "CircleIntersections":
+        """
+        Recalcula la entrada, la salida, la longitud del arco y el área de la
+        masa deslizante de todas las superficies contra la pendiente de la
+        geometría. deviation(x1, y1, x2, y2) sobre el resultado compara con
+        los puntos leídos del archivo
+
+        Args:
+            geometry: Geometría del proyecto
+            direction: Sentido de la falla (ProjectMetadata.direction)
+        """
+        return geometry.intersect_circles(self.xc, self.yc, self.radius, direction)
+
+
 @dataclass
 class Slice:
     """
@@ -93,6 +326,100 @@ class Slice:
     base_cohesion: float
     base_material: str
 
+@dataclass(eq=False)
+class SliceArrays:
+    """
+    Clase SliceArrays que guarda las rebanadas de una superficie en columnas
+    (un arreglo de NumPy por campo de Slice).
+
+    x, yt, yb, loc y las fuerzas entre rebanadas (interslice_*, thrust_line_elevation)
+    se dan en los límites entre rebanadas (n+1 valores); el resto de campos
+    se dan por rebanada (n valores).
+    Atributos:
+    ----------
+        x: np.ndarray
+        yt: np.ndarray
+        yb: np.ndarray
+        loc: np.ndarray
+        frictional_strength: np.ndarray
+        cohesive_strength: np.ndarray
+        base_normal_force: np.ndarray
+        base_friction_angle: np.ndarray
+        interslice_normal_force: np.ndarray
+        interslice_shear_force: np.ndarray
+        slice_weight: np.ndarray
+        pore_pressure: np.ndarray
+        m_alpha: np.ndarray
+        thrust_line_elevation: np.ndarray
+        initial_pore_pressure: np.ndarray
+        horizontal_seismic_force: np.ndarray
+        vertical_seismic_force: np.ndarray
+        phib: np.ndarray
+        base_cohesion: np.ndarray
+        base_material: np.ndarray
+        extra (dict[str, np.ndarray]): Datos de rebanada con nombres no reconocidos.
+    """
+    x: np.ndarray = field(default_factory=lambda: np.empty(0))
+    yt: np.ndarray = field(default_factory=lambda: np.empty(0))
+    yb: np.ndarray = field(default_factory=lambda: np.empty(0))
+    loc: np.ndarray = field(default_factory=lambda: np.empty(0))
+    frictional_strength: np.ndarray = field(default_factory=lambda: np.empty(0))
+    cohesive_strength: np.ndarray = field(default_factory=lambda: np.empty(0))
+    base_normal_force: np.ndarray = field(default_factory=lambda: np.empty(0))
+    base_friction_angle: np.ndarray = field(default_factory=lambda: np.empty(0))
+    interslice_normal_force: np.ndarray = field(default_factory=lambda: np.empty(0))
+    interslice_shear_force: np.ndarray = field(default_factory=lambda: np.empty(0))
+    slice_weight: np.ndarray = field(default_factory=lambda: np.empty(0))
+    pore_pressure: np.ndarray = field(default_factory=lambda: np.empty(0))
+    m_alpha: np.ndarray = field(default_factory=lambda: np.empty(0))
+    thrust_line_elevation: np.ndarray = field(default_factory=lambda: np.empty(0))
+    initial_pore_pressure: np.ndarray = field(default_factory=lambda: np.empty(0))
+    horizontal_seismic_force: np.ndarray = field(default_factory=lambda: np.empty(0))
+    vertical_seismic_force: np.ndarray = field(default_factory=lambda: np.empty(0))
+    phib: np.ndarray = field(default_factory=lambda: np.empty(0))
+    base_cohesion: np.ndarray = field(default_factory=lambda: np.empty(0))
+    base_material: np.ndarray = field(default_factory=lambda: np.empty(0))
+    extra: dict[str, np.ndarray] = field(default_factory=dict)
+
+    @staticmethod
+    def field_name(data_name: str) -> str:
+        """Nombre del campo para un dato de rebanada del .s01 ("M-Alpha" → "m_alpha")"""
+        return data_name.strip().lower().replace('-', '_').replace(' ', '_')
+
+    def columns(self) -> dict[str, np.ndarray]:
+        """Diccionario campo → arreglo (sin extra)"""
+        return {name: getattr(self, name) for name in Slice.__dataclass_fields__}
+
+    def __len__(self) -> int:
+        """Número de rebanadas"""
+        return max(len(self.slice_weight), len(self.x) - 1, 0)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, SliceArrays):
+            return NotImplemented
+        mine, theirs = self.columns(), other.columns()
+        return self.extra.keys() == other.extra.keys() and all(
+            np.array_equal(mine[name], theirs[name], equal_nan=True) for name in mine
+        ) and all(
+            np.array_equal(self.extra[name], other.extra[name], equal_nan=True) for name in self.extra
+        )
+
+    def to_slices(self) -> list[Slice]:
+        """
+        Construye la lista de objetos Slice. Para los campos dados en los
+        límites entre rebanadas se toma el límite izquierdo de cada rebanada
+        """
+        columns = {name: values.tolist() for name, values in self.columns().items()}
+        slices = []
+        for i in range(len(self)):
+            row = {name: values[i] if i < len(values) else None for name, values in columns.items()}
+            if row['loc'] is not None:
+                row['loc'] = int(row['loc'])
+            if row['base_material'] is not None:
+                row['base_material'] = str(int(row['base_material']))
+            slices.append(Slice(**row))
+        return slices
+
 @dataclass
 class EquilibriumTerms:
     """
@@ -117,12 +444,299 @@ class GlobalMinimum:
     ----------
         surface: Surface
         equilibrium_terms: EquilibriumTerms
-        slices: list[Slice] (Falta este campo, para la versión 0.2.0)
+        slice_data: SliceArrays | None (rebanadas de la superficie en columnas)
+        slices: list[Slice] (se construye desde slice_data al accederla)
     """
     surface: Surface
     equilibrium_terms: EquilibriumTerms
-    # Falta este campo
-    #slices: list[Slice]
+    slice_data: SliceArrays | None = None
+
+    @property
+    def slices(self) -> list[Slice]:
+        """Lista de rebanadas construida desde slice_data"""
+        if self.slice_data is None:
+            return []
+        return self.slice_data.to_slices()
+
+
+@dataclass
+class SupportResult:
+    """
+    Clase SupportResult que une los resultados de un soporte con su geometría y su propiedad.
+    Atributos:
+    ----------
+        index (int): Posición del soporte (0, 1, ...), igual en el .sli y en el .s01.
+        support (Support | None): Soporte de la geometría.
+        support_property (PropertySupport | None): Propiedad del soporte.
+        forces (dict[str, float]): Fuerza F movilizada en el soporte por la
+            superficie mínima de cada método (0 si el soporte no la cruza, exists = 0).
+        max_force_along (float): Máximo del diagrama de fuerzas a lo largo del
+            soporte. Es la envolvente de capacidad del soporte (en los anclados
+            en el extremo es igual a cap), no la carga movilizada.
+        capacity (float | None): Capacidad de la propiedad (cap), si la tiene.
+        utilizations (dict[str, float | None]): F movilizada entre capacidad,
+            por método (None sin capacidad).
+        utilization (float | None): Máximo de utilizations entre métodos.
+    """
+    index: int
+    support: Support | None
+    support_property: PropertySupport | None
+    forces: dict[str, float]
+    max_force_along: float
+    capacity: float | None
+    utilizations: dict[str, float | None]
+    utilization: float | None
+
+
+@dataclass(eq=False)
+class SupportResults:
+    """
+    Clase SupportResults que guarda los resultados de los soportes (bolts) en arreglos.
+
+    Los diagramas de fuerza a lo largo de cada soporte tienen distinto número
+    de puntos, por lo que se guardan concatenados: los puntos del soporte i
+    son force_*[force_offsets[i]:force_offsets[i+1]].
+    Atributos:
+    ----------
+        methods (list[str]): Nombre de los métodos.
+        columns (list[str]): Nombre de las columnas de bolt_data (x1, y1, x2, y2, exists, xi, yi, F, ...).
+        bolt_data (np.ndarray): Datos de cada soporte, matriz (n_metodos, n_soportes, n_columnas).
+        force_offsets (np.ndarray): Inicio de los puntos de cada soporte, (n_soportes + 1,).
+        force_xi (np.ndarray): Coordenada x de cada punto del diagrama.
+        force_yi (np.ndarray): Coordenada y de cada punto del diagrama.
+        force (np.ndarray): Fuerza en cada punto del diagrama.
+        force_mode (np.ndarray): Modo de falla en cada punto del diagrama.
+    """
+    methods: list[str]
+    columns: list[str]
+    bolt_data: np.ndarray
+    force_offsets: np.ndarray
+    force_xi: np.ndarray
+    force_yi: np.ndarray
+    force: np.ndarray
+    force_mode: np.ndarray
+
+    @property
+    def num_supports(self) -> int:
+        return self.bolt_data.shape[1] if self.bolt_data.ndim == 3 else len(self.force_offsets) - 1
+
+    def __len__(self) -> int:
+        return self.num_supports
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, SupportResults):
+            return NotImplemented
+        return self.methods == other.methods and self.columns == other.columns and all(
+            np.array_equal(getattr(self, name), getattr(other, name), equal_nan=True)
+            for name in ('bolt_data', 'force_offsets', 'force_xi', 'force_yi', 'force', 'force_mode')
+        )
+
+    def column(self, name: str, method: str | None = None) -> np.ndarray:
+        """
+        Columna de bolt_data por nombre (por ejemplo "F" o "exists")
+
+        Args:
+            name: Nombre de la columna
+            method: Nombre del método; si es None se devuelven todos, (n_metodos, n_soportes)
+        """
+        values = self.bolt_data[:, :, self.columns.index(name)]
+        if method is None:
+            return values
+        return values[self.methods.index(method)]
+
+    def forces_along(self, index: int) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Diagrama de fuerzas (xi, yi, force, mode) del soporte index, como vistas sin copia"""
+        start, end = self.force_offsets[index], self.force_offsets[index + 1]
+        return (self.force_xi[start:end], self.force_yi[start:end],
+                self.force[start:end], self.force_mode[start:end])
+
+    def max_force_along(self) -> np.ndarray:
+        """
+        Máximo del diagrama de fuerzas de cada soporte (NaN si el soporte no
+        tiene puntos). El diagrama es la envolvente de capacidad a lo largo
+        del soporte, no la fuerza movilizada (ver max_force)
+        """
+        result = np.full(self.num_supports, np.nan)
+        counts = np.diff(self.force_offsets)
+        filled = counts > 0
+        if filled.any():
+            result[filled] = np.maximum.reduceat(self.force, self.force_offsets[:-1][filled])
+        return result
+
+    def max_force(self, method: str | None = None) -> np.ndarray:
+        """
+        Fuerza F de cada soporte en la superficie mínima
+
+        Args:
+            method: Nombre del método; si es None se toma el máximo entre métodos
+        """
+        forces = self.column('F', method)
+        return forces if method is not None else forces.max(axis=0, initial=-np.inf)
+
+    def join(self, geometry: ProjectGeometry, properties: ProjectProperties) -> list[SupportResult]:
+        """
+        Une los resultados de cada soporte con ProjectGeometry.supports y con
+        su PropertySupport, calculando la utilización frente a la capacidad a
+        partir de la fuerza F movilizada por la superficie mínima de cada
+        método (los soportes que no cruzan la superficie, exists = 0, tienen
+        fuerza 0). El diagrama de fuerzas a lo largo del soporte es la
+        envolvente de capacidad y no se usa en la utilización.
+
+        Args:
+            geometry: Geometría del proyecto
+            properties: Propiedades del proyecto
+        """
+        properties_by_id = {support.id: support for support in properties.supports}
+        forces = self.column('F') if 'F' in self.columns else np.full((len(self.methods), self.num_supports), np.nan)
+        if 'exists' in self.columns:
+            forces = np.where(self.column('exists') != 0, forces, 0.0)
+        max_along = self.max_force_along()
+
+        results = []
+        for i in range(self.num_supports):
+            support = geometry.supports[i] if i < len(geometry.supports) else None
+            support_property = properties_by_id.get(support.property_id) if support else None
+            capacity = getattr(support_property.support_params, 'cap', None) if support_property else None
+
+            method_forces = {method: float(forces[j, i]) for j, method in enumerate(self.methods)}
+            utilizations = {
+                method: force / capacity if capacity else None for method, force in method_forces.items()
+            }
+            values = [value for value in utilizations.values() if value is not None and value == value]
+            results.append(SupportResult(
+                index=i,
+                support=support,
+                support_property=support_property,
+                forces=method_forces,
+                max_force_along=float(max_along[i]),
+                capacity=capacity,
+                utilizations=utilizations,
+                utilization=max(values) if values else None
+            ))
+        return results
+
+
+@dataclass(eq=False)
+class MethodSummary:
+    """
+    Clase MethodSummary con los estadísticos del FS de un método sobre las
+    superficies válidas de la tabla.
+    Atributos:
+    ----------
+        method (str): Nombre del método.
+        count (int): Superficies con FS válido.
+        invalid (int): Superficies sin FS válido (vacías o con código de error, FS <= 0).
+        minimum (float): FS mínimo.
+        maximum (float): FS máximo.
+        percentiles (dict[float, float]): FS por percentil (ResultsIndex.PERCENTILES).
+    """
+    method: str
+    count: int
+    invalid: int
+    minimum: float
+    maximum: float
+    percentiles: dict[float, float]
+
+
+class ResultsIndex:
+    """
+    Índice de consultas sobre los resultados: por método, las filas de la
+    tabla de superficies con FS válido ordenadas por FS, los estadísticos de
+    cada método y el mínimo global de cada método. Se construye una vez
+    (O(n log n)); top_k y below cuestan O(log n + k).
+    Atributos:
+    ----------
+        table (SurfaceTable): Tabla de superficies indexada.
+        order (dict[str, np.ndarray]): Filas con FS válido de cada método, de menor a mayor FS.
+        sorted_fs (dict[str, np.ndarray]): FS de esas filas, en el mismo orden.
+        summaries (dict[str, MethodSummary]): Estadísticos de cada método.
+        minimums (dict[str, GlobalMinimum]): Mínimo global de cada método.
+    """
+    # Percentiles precalculados de cada método
+    PERCENTILES = (5.0, 25.0, 50.0, 75.0, 95.0)
+
+    def __init__(self, table: SurfaceTable, global_minimums: list[GlobalMinimum]):
+        self.table = table
+        self.order = {}
+        self.sorted_fs = {}
+        self.summaries = {}
+        for column, method in enumerate(table.methods):
+            fs = table.fs[:, column]
+            rows = np.flatnonzero(np.isfinite(fs) & (fs > 0))
+            rows = rows[np.argsort(fs[rows], kind='stable')]
+            values = np.ascontiguousarray(fs[rows])
+            self.order[method] = rows
+            self.sorted_fs[method] = values
+            self.summaries[method] = MethodSummary(
+                method=method,
+                count=len(rows),
+                invalid=len(fs) - len(rows),
+                minimum=float(values[0]) if len(values) else np.nan,
+                maximum=float(values[-1]) if len(values) else np.nan,
+                percentiles=dict(zip(
+                    self.PERCENTILES,
+                    np.percentile(values, self.PERCENTILES).tolist() if len(values) else [np.nan] * len(self.PERCENTILES)
+                ))
+            )
+        self.minimums = {}
+        for minimum in global_minimums:
+            self.minimums.setdefault(minimum.surface.method, minimum)
+        self._critical = min(self.minimums.values(), key=lambda minimum: minimum.surface.fs, default=None)
+
+    @property
+    def methods(self) -> list[str]:
+        return list(self.table.methods)
+
+    def rows(self, method: str) -> np.ndarray:
+        """Filas de la tabla con FS válido del método, de menor a mayor FS"""
+        return self.order[self._method(method)]
+
+    def top_k(self, method: str, k: int) -> list[Surface]:
+        """
+        Las k superficies de menor FS de un método
+
+        Args:
+            method: Nombre del método
+            k: Número de superficies
+        """
+        method = self._method(method)
+        return [self.table.surface(row, method) for row in self.order[method][:max(k, 0)].tolist()]
+
+    def below(self, fs: float, method: str | None = None) -> list[Surface]:
+        """
+        Superficies con FS menor que fs, de menor a mayor FS por método
+
+        Args:
+            fs: Umbral de FS (estricto)
+            method: Nombre del método (por defecto todos, en el orden de la tabla)
+        """
+        methods = self.table.methods if method is None else [self._method(method)]
+        surfaces = []
+        for name in methods:
+            count = int(np.searchsorted(self.sorted_fs[name], fs, side='left'))
+            surfaces.extend(self.table.surface(row, name) for row in self.order[name][:count].tolist())
+        return surfaces
+
+    def count_below(self, fs: float, method: str) -> int:
+        """Número de superficies de un método con FS menor que fs, O(log n)"""
+        return int(np.searchsorted(self.sorted_fs[self._method(method)], fs, side='left'))
+
+    def critical(self, method: str | None = None) -> GlobalMinimum | None:
+        """
+        Mínimo global de un método, o el de menor FS entre todos los métodos
+
+        Args:
+            method: Nombre del método (por defecto todos)
+        """
+        if method is None:
+            return self._critical
+        return self.minimums.get(method.strip().lower())
+
+    def _method(self, method: str) -> str:
+        name = method.strip().lower()
+        if name not in self.order:
+            raise KeyError(f"Método sin resultados: {method} (disponibles: {', '.join(self.table.methods)})")
+        return name
 
 
 #####################################
@@ -135,12 +749,123 @@ class ProjectResults:
     Atributos:
     ----------
         methods: list[Method]
-        surfaces: list[Surface]
+        surface_table: SurfaceTable
         global_minimums: list[GlobalMinimum]
+        supports: SupportResults | None
+        surfaces: list[Surface] (se construye desde surface_table al accederla)
+        index: ResultsIndex (se construye al primer acceso)
     """
     methods: list[Method]
-    surfaces: list[Surface]
+    surface_table: SurfaceTable
     global_minimums: list[GlobalMinimum]
+    supports: SupportResults | None = None
+    _surfaces: list[Surface] | None = field(default=None, init=False, repr=False, compare=False)
+    _index: ResultsIndex | None = field(default=None, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_surfaces(
+            cls,
+            methods: list[Method],
+            surfaces: list[Surface],
+            global_minimums: list[GlobalMinimum],
+            supports: SupportResults | None = None
+            ) -> "ProjectResults":
+        """
+        Crea los resultados a partir de la lista de superficies, con los mismos
+        argumentos que el constructor anterior a SurfaceTable. Las superficies
+        consecutivas con la misma geometría y métodos distintos (en el orden de
+        methods) se guardan en una misma fila de la tabla, como en el .s01. La
+        lista recibida se conserva como surfaces.
+        """
+        names = [method.name for method in methods]
+        column = {name: i for i, name in enumerate(names)}
+        width = len(SurfaceTable.COLUMNS) + len(names) + 1
+        rows = []
+        key = None
+        for surface in surfaces:
+            if surface.method not in column:
+                raise KeyError(f"Método de la superficie no está en methods: {surface.method}")
+            values = [surface.point_center.x, surface.point_center.y, surface.radius, surface.yleft,
+                      surface.point1.x, surface.point1.y, surface.point2.x, surface.point2.y,
+                      surface.yright, surface.b1]
+            values = np.array([np.nan if value is None else float(value) for value in values])
+            j = column[surface.method]
+            # se agrega a la fila anterior si es la misma superficie y el método va después
+            if key is not None and np.array_equal(values, key, equal_nan=True) and np.isnan(rows[-1][len(SurfaceTable.COLUMNS) + j:-1]).all():
+                rows[-1][len(SurfaceTable.COLUMNS) + j] = surface.fs
+                continue
+            row = np.full(width, np.nan)
+            row[:len(SurfaceTable.COLUMNS)] = values[:-1]
+            row[-1] = values[-1]
+            row[len(SurfaceTable.COLUMNS) + j] = surface.fs
+            rows.append(row)
+            key = values
+
+        results = cls(
+            methods=methods,
+            surface_table=SurfaceTable.from_rows(np.array(rows).reshape(-1, width), names),
+            global_minimums=global_minimums,
+            supports=supports
+        )
+        results._surfaces = list(surfaces)
+        return results
+
+    @property
+    def surfaces(self) -> list[Surface]:
+        """Lista de superficies (una por superficie y método), construida al primer acceso"""
+        if self._surfaces is None:
+            self._surfaces = self.surface_table.to_surfaces()
+        return self._surfaces
+
+    def iter_surfaces(self, method: str | None = None, fs_max: float | None = None) -> Iterator[Surface]:
+        """
+        Recorre las superficies de la tabla sin construir la lista completa,
+        en el mismo orden que surfaces
+
+        Args:
+            method: Nombre del método (por defecto todos)
+            fs_max: Si se indica, solo las superficies con 0 < FS <= fs_max
+                (se omiten los códigos de error)
+        """
+        table = self.surface_table
+        if method is None:
+            columns = np.arange(len(table.methods))
+        else:
+            name = method.strip().lower()
+            if name not in table.methods:
+                raise KeyError(f"Método sin resultados: {method} (disponibles: {', '.join(table.methods)})")
+            columns = np.array([table.methods.index(name)])
+        # por bloques de filas, para no crear índices del tamaño de la tabla
+        for start in range(0, len(table), _ITER_CHUNK):
+            fs = table.fs[start:start + _ITER_CHUNK, columns]
+            keep = ~np.isnan(fs)
+            if fs_max is not None:
+                keep &= (fs > 0.0) & (fs <= fs_max)
+            rows, picked = np.nonzero(keep)
+            for row, column in zip((rows + start).tolist(), columns[picked].tolist()):
+                yield table.surface(row, table.methods[column])
+
+    def fs_fields(self) -> dict[str, "FSField"]:
+        """
+        Campo de FS mínimo por centro de la grilla de centros, por método
+        (analysis.fs_field), con detección de mínimos locales y curvas de nivel
+        """
+        from ..analysis.fs_field import fs_field
+        return {method: fs_field(self.surface_table, method) for method in self.surface_table.methods}
+
+    @property
+    def index(self) -> ResultsIndex:
+        """Índice de consultas por método (top_k, below, estadísticos), construido al primer acceso"""
+        if self._index is None:
+            self._index = ResultsIndex(self.surface_table, self.global_minimums)
+        return self._index
+
+    def __getstate__(self) -> dict:
+        # la lista de superficies y el índice se reconstruyen desde la tabla, no se serializan
+        state = self.__dict__.copy()
+        state['_surfaces'] = None
+        state['_index'] = None
+        return state
 
 
 
@@ -0,0 +1,33 @@
+"""
+FS de los mínimos globales del proyecto de ejemplo recalculado con el motor
+de equilibrio límite, comparado con el de Slide
+"""
+from slidepyv6 import SlideProject
+from pathlib import Path
+import pytest
+
+EXAMPLE = Path(__file__).resolve().parent.parent / "examples" / "example_project.slim"
+
+# FS de Slide y FS recalculado con las rebanadas de cada mínimo global
+SLIDE_FS = {'bishop simplified': 1.38101, 'janbu simplified': 1.27737}
+COMPUTED_FS = {'bishop simplified': 1.38054, 'janbu simplified': 1.27759}
+
+
+@pytest.fixture(scope="module")
+def project() -> SlideProject:
+    return SlideProject(EXAMPLE)
+
+
+def test_global_minimums_match_slide(project):
+    slide = {minimum.surface.method: minimum.surface.fs for minimum in project.results.global_minimums}
+    assert slide == pytest.approx(SLIDE_FS)
+    factors = project.evaluate_safety_factors()
+    for method, fs in SLIDE_FS.items():
+        assert float(factors[method].fs) == pytest.approx(fs, abs=1e-3)
+
+
+def test_global_minimums_regression(project):
+    factors = project.evaluate_safety_factors()
+    for method, fs in COMPUTED_FS.items():
+        assert factors[method].converged
+        assert float(factors[method].fs) == pytest.approx(fs, abs=1e-5)
@@ -0,0 +1,177 @@
+"""
+Equivalencia del escáner de secciones del .sli y del parser de resultados
+por flujo (.s01) con las búsquedas por expresiones regulares anteriores (y,
+en los bloques de grilla, con una lectura hecha a mano)
+"""
+from slidepyv6.io.archive import MemoryArchive
+from slidepyv6.io.parsers.input_parser import InputParser
+from slidepyv6.io.parsers.output_parser import OutputParser
+from pathlib import Path
+import numpy as np
+import re
+
+EXAMPLE = Path(__file__).resolve().parent.parent / "examples" / "example_project.slim"
+
+# Archivo de resultados con dos bloques de grilla (incluye un centro sin superficies)
+GRID_S01 = """* Version 1960035639 10116 0
+* Analysis names
+bishop simplified
+janbu simplified
+* grid#
+1.5 2.5 2
+3.0 10.0 0.5 10.0 6.5 10.0 10.0 1.25 1.125 0.5
+3.5 10.0 0.25 10.0 6.75 10.0 10.0 1.5 1.375 0.5
+2.5 2.5 0
+3.5 2.5 1
+4.0 10.0 0.5 10.0 7.5 10.0 10.0 1.75 1.625 0.5
+* grid#
+1.5 3.5 1
+5.0 10.0 0.5 10.0 8.5 10.0 10.0 2.25 2.125 0.5
+* Global Minimum FS (xc,yc,r,x1,y1,x2,y2,fs,name)
+1.5 2.5 3.0 0.5 10.0 6.5 10.0 1.25 bishop simplified
+* #data
+"""
+
+
+def _read_example() -> tuple[str, str]:
+    archive = MemoryArchive(EXAMPLE)
+    archive.open()
+    return archive.read('input'), archive.read('output')
+
+
+#---------------------------------------------------------------
+# referencias: búsquedas por expresiones regulares anteriores
+#---------------------------------------------------------------
+def _regex_sections(content: str) -> dict[str, str]:
+    sections = {}
+    for section in InputParser.SECTIONS:
+        match = re.search(rf"^{section}\b:(.*?)(?=\n\w|\Z)", content, re.DOTALL | re.MULTILINE)
+        if match:
+            sections[section] = match.group(1).strip()
+    return sections
+
+
+def _regex_methods(content: str) -> list[str]:
+    block = re.search(r"(?ms)(\* Version.*?)(?=\* Three Point Surfaces.*?|\* grid#.*?)", content).group(1).strip()
+    pattern = r"(?ms)^\*\s*(?P<key>.*?)\s*\n(?P<value>.*?)(?=^\*\s|\Z)"
+    data = {m.group("key"): m.group("value").strip() for m in re.finditer(pattern, block)}
+    return data['Analysis names'].split('\n')
+
+
+def _regex_surfaces(content: str, methods: list[str]) -> list[tuple]:
+    """(método, xc, yc, r, yleft, x1, y1, x2, y2, yright, fs, b1) de cada superficie de tres puntos y método"""
+    block = re.search(r"(?ms)(\* Three Point Surfaces.*?)(?=\* Global Minimum FS \(xc,yc,r,x1,y1,x2,y2,fs,name\))",
+                      content).group(1).strip()
+    surfaces = []
+    # sin el encabezado ni el $end final
+    for line in block.split('\n')[1:-1]:
+        values = [float(part) for part in line.split()]
+        for i, fs in enumerate(values[9:-1]):
+            surfaces.append((methods[i], *values[:9], fs, values[-1]))
+    return surfaces
+
+
+def _grid_surfaces(content: str, methods: list[str]) -> list[tuple]:
+    """
+    Superficies de los bloques de grilla leídas a mano: la búsqueda anterior
+    confundía las filas de datos con encabezados de centro, por lo que no
+    sirve como referencia
+    """
+    surfaces = []
+    pending = 0
+    for line in content.splitlines():
+        parts = line.split()
+        if not parts or parts[0].startswith('*'):
+            pending = 0
+            continue
+        if pending == 0:
+            if len(parts) == 3:
+                xc, yc, pending = float(parts[0]), float(parts[1]), int(parts[2])
+            continue
+        values = [float(part) for part in parts]
+        for i, fs in enumerate(values[7:-1]):
+            surfaces.append((methods[i], xc, yc, *values[:7], fs, values[-1]))
+        pending -= 1
+    return surfaces
+
+
+def _as_tuples(surfaces) -> list[tuple]:
+    return [
+        (s.method, s.point_center.x, s.point_center.y, s.radius, s.yleft, s.point1.x, s.point1.y,
+         s.point2.x, s.point2.y, s.yright, s.fs, s.b1)
+        for s in surfaces
+    ]
+
+
+#---------------------------------------------------------------
+# pruebas
+#---------------------------------------------------------------
+def test_section_scanner_matches_regex():
+    content, _ = _read_example()
+    if isinstance(content, bytes):
+        content = content.decode('utf-8', errors='ignore')
+    sections = InputParser.split_sections(content)
+    expected = _regex_sections(content)
+    assert set(sections.spans) == set(expected)
+    for name, text in expected.items():
+        assert sections[name] == text
+
+
+def test_section_scanner_edge_cases():
+    content = (
+        "vertices:\n  1 x: 0 y: 0\n  2 x: 1 y: 0\n"
+        "slope limits: 0 1\n"
+        "slope:\n  1\n  2\n"
+        "vertices:\n  9 x: 9 y: 9\n"
+        "exterior: 1 2"
+    )
+    sections = InputParser.split_sections(content)
+    expected = _regex_sections(content)
+    assert set(sections.spans) == set(expected)
+    for name, text in expected.items():
+        assert sections[name] == text
+
+
+def test_stream_parser_matches_regex_three_point():
+    _, content = _read_example()
+    methods = _regex_methods(content)
+    results = OutputParser.parse(content)
+    assert [method.name for method in results.methods] == methods
+    expected = _regex_surfaces(content, methods)
+    assert len(expected) > 0
+    assert _as_tuples(results.surfaces) == expected
+    assert _as_tuples(OutputParser.iter_surfaces(content.splitlines())) == expected
+
+
+def test_stream_parser_matches_regex_grid():
+    methods = _regex_methods(GRID_S01)
+    results = OutputParser.parse(GRID_S01)
+    expected = _grid_surfaces(GRID_S01, methods)
+    assert len(expected) == 8
+    assert _as_tuples(results.surfaces) == expected
+    assert _as_tuples(OutputParser.iter_surfaces(GRID_S01.splitlines())) == expected
+    # dos bloques de grilla: no se guarda una única grilla de centros
+    assert results.surface_table.grid is None
+
+
+def test_grid_keeps_centers_without_surfaces():
+    content = GRID_S01.split("* grid#\n1.5 3.5")[0] + "* Global Minimum FS (xc,yc,r,x1,y1,x2,y2,fs,name)\n"
+    table = OutputParser.parse(content).surface_table
+    assert table.grid.shape == (1, 3)
+    field = OutputParser.parse(content).fs_fields()['bishop simplified']
+    assert field.shape == (1, 3)
+    assert np.isnan(field.fs[0, 1])
+
+
+def test_cell_arrays_with_spaced_vertex_lists():
+    compact = ("1 vertices: [1,2,3] material: soil1\n"
+               "2 vertices: [2,3,4,5] material: soil2\n"
+               "3 vertices: [3,4,5] material: soil1\n")
+    spaced = compact.replace(',', ', ')
+    expected = InputParser._parse_cell_arrays(compact)
+    result = InputParser._parse_cell_arrays(spaced)
+    for value, reference in zip(result, expected):
+        if isinstance(reference, np.ndarray):
+            np.testing.assert_array_equal(value, reference)
+        else:
+            assert value == reference
@@ -0,0 +1,55 @@
+"""
+Reproducibilidad del análisis de Monte Carlo con distinto número de procesos
+"""
+from slidepyv6 import SlideProject
+from slidepyv6.analysis.probabilistic import Distribution
+from slidepyv6.utils.exceptions import SlideError
+from pathlib import Path
+import numpy as np
+import pytest
+
+EXAMPLE = Path(__file__).resolve().parent.parent / "examples" / "example_project.slim"
+
+
+@pytest.fixture(scope="module")
+def project() -> SlideProject:
+    return SlideProject(EXAMPLE)
+
+
+def _run(project: SlideProject, workers: int, seed: int = 42):
+    material = project.properties.materials[0]
+    distributions = {material.id: {
+        'cohesion': Distribution('normal', material.material_params.cohesion, 1.0),
+        'friction_angle': Distribution('lognormal', material.material_params.friction_angle, 2.0),
+    }}
+    statistics = None
+    for statistics in project.monte_carlo(distributions, realizations=2000, seed=seed,
+                                          chunk_size=500, workers=workers):
+        pass
+    return statistics
+
+
+def test_monte_carlo_reproducible_across_workers(project):
+    single = _run(project, workers=1)
+    parallel = _run(project, workers=2)
+    assert set(single) == set(parallel)
+    for method, reference in single.items():
+        other = parallel[method]
+        assert other.count == reference.count == 2000
+        assert other.failures == reference.failures
+        assert other.mean == pytest.approx(reference.mean, rel=1e-12)
+        assert other.m2 == pytest.approx(reference.m2, rel=1e-9)
+        np.testing.assert_array_equal(other.histogram, reference.histogram)
+
+
+def test_monte_carlo_seed_changes_results(project):
+    first = _run(project, workers=1, seed=1)
+    second = _run(project, workers=1, seed=2)
+    assert any(first[method].mean != second[method].mean for method in first)
+
+
+def test_truncation_far_in_tail_raises():
+    with pytest.raises(SlideError):
+        Distribution('normal', 10, 1, minimum=100, maximum=200).sample(np.random.default_rng(0), 5)
+    with pytest.raises(SlideError):
+        Distribution('lognormal', 0, 1).sample(np.random.default_rng(0), 5)